@@ -0,0 +1,57 @@
+from __future__ import annotations
+import os
+import subprocess
+from typing import List, Optional, Tuple
+from llvmlite import binding as llvm
+from llvmlite import ir
+from cache import temp_path
+from error import CodegenError
+from pipeline import PipelineOptions, PipelineReport, run_pipeline
+import jit
+
+
+class TargetOptions(object):
+    """目标机器的配置。triple 为空时生成本机代码；cpu 为 'native' 时使用本机的 CPU 型号与全部特性，
+    features 中给出的特性（如 '+avx2,-fma'）追加在后面。要链接成共享库的目标文件需用位置无关代码（reloc='pic'）。
+    pipeline 是优化流水线的配置，其优化级别同时用于机器码生成"""
+    def __init__(self, pipeline: Optional[PipelineOptions] = None, cpu: str = '', features: str = '',
+                 triple: Optional[str] = None, reloc: str = 'pic') -> None:
+        self.pipeline = pipeline or PipelineOptions()
+        self.cpu = cpu
+        self.features = features
+        self.triple = triple
+        self.reloc = reloc
+
+    def create_target_machine(self) -> llvm.TargetMachine:
+        return jit.create_target_machine(self.pipeline.opt, self.cpu, self.features, self.triple, self.reloc,
+                                         'default')
+
+
+def compile_object(module: ir.Module, options: TargetOptions) -> Tuple[bytes, PipelineReport]:
+    """优化并生成 module 的目标文件内容"""
+    target_machine = options.create_target_machine()
+    llvm_module = jit.parse_module(str(module))
+    llvm_module.triple = target_machine.triple
+    llvm_module.data_layout = str(target_machine.target_data)
+    report = run_pipeline(llvm_module, target_machine, options.pipeline)
+    return target_machine.emit_object(llvm_module), report
+
+
+def write_object(module: ir.Module, path: str, options: TargetOptions) -> PipelineReport:
+    data, report = compile_object(module, options)
+    tmp_path = temp_path(path)
+    with open(tmp_path, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return report
+
+
+def link_shared(object_files: List[str], path: str) -> None:
+    """用系统的 C 编译器（$CC，默认 cc）把目标文件链接成共享库"""
+    command = [os.environ.get('CC', 'cc'), '-shared', '-o', path, *object_files]
+    try:
+        process = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+    except OSError as err:
+        raise CodegenError(f'can not run linker {command[0]}: {err}') from None
+    if process.returncode != 0:
+        raise CodegenError(f'linking {path} failed:\n{process.stdout}')
@@ -1,9 +1,11 @@
 from __future__ import annotations
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from enums import BasicType, BinaryOp, UnaryOp, IOType
 
 
 class Indent(object):
+    __slots__ = ('ind',)
+
     def __init__(self, ind: int = 0) -> None:
         super().__init__()
         self.ind = ind
@@ -16,74 +18,111 @@ class Indent(object):
 
 
 class Node(object):
+    __slots__ = ('row',)
+
     def __init__(self, row) -> None:
         super().__init__()
         self.row = row
 
     def __str__(self, ind=Indent()):
-        return ind.__str__()
+        # 打印统一由 printer 完成，显式栈展开，不受树深度限制
+        import printer
+        return printer.dumps(self, ind.ind)
 
     def accept(self, visitor) -> None:
         visitor.visit(self)
 
 
+_field_names: Dict[type, Tuple[str, ...]] = {}
+
+
+def field_names(cls: type) -> Tuple[str, ...]:
+    """节点类的全部 slot 字段名（父类在前），按类缓存"""
+    names = _field_names.get(cls)
+    if names is None:
+        names = tuple(name for klass in reversed(cls.__mro__) for name in klass.__dict__.get('__slots__', ()))
+        _field_names[cls] = names
+    return names
+
+
 class CompUnit(Node):
+    __slots__ = ('allDeclarationList', 'declViews')
+
     def __init__(self, row) -> None:
         super().__init__(row)
-        self.allDeclarationList: List[Declaration] = []
-        self.blockDeclList: List[BlockDecl] = []
-        self.templateDeclList: List[TemplateDecl] = []
-        self.templateBlockDeclList: List[TemplateDecl] = []
-        self.templateFuncDefList: List[TemplateDecl] = []
-        self.funcDefList: List[FuncDef] = []
+        self.allDeclarationList: List[Declaration] = []  # 按源码顺序
+        # 按类别划分的声明列表，首次访问时从 allDeclarationList 一次算出，添加声明后失效
+        self.declViews: Optional[Tuple[List[BlockDecl], List[TemplateDecl], List[TemplateDecl],
+                                       List[TemplateDecl], List[FuncDef]]] = None
 
     def add_declaration(self, decl):
-        if isinstance(decl, BlockDecl):
-            self.blockDeclList.insert(0, decl)
-        elif isinstance(decl, TemplateDecl):
-            self.templateDeclList.insert(0, decl)
-            if isinstance(decl.declaration, BlockDecl):
-                self.templateBlockDeclList.insert(0, decl)
-            elif isinstance(decl.declaration, FuncDef):
-                self.templateFuncDefList.insert(0, decl)
-            else:
+        if isinstance(decl, TemplateDecl):
+            if not isinstance(decl.declaration, (BlockDecl, FuncDef)):
                 raise TypeError(f'unknown declaration type {type(decl)}')
-        elif isinstance(decl, FuncDef):
-            self.funcDefList.insert(0, decl)
-        else:
+        elif not isinstance(decl, (BlockDecl, FuncDef)):
             raise TypeError(f'unknown declaration type {type(decl)}')
-        self.allDeclarationList.insert(0, decl)
-
-    def __str__(self, ind=Indent()):
-        ret = 'CompUnit:\n'
-        for decl in self.blockDeclList:
-            ret += decl.__str__(ind+1)
-        for decl in self.templateDeclList:
-            ret += decl.__str__(ind+1)
-        for defi in self.funcDefList:
-            ret += defi.__str__(ind+1)
-        return ret
+        self.allDeclarationList.append(decl)
+        self.declViews = None
+
+    def get_decl_views(self):
+        if self.declViews is None:
+            views = ([], [], [], [], [])
+            blockDecls, templateDecls, templateBlockDecls, templateFuncDefs, funcDefs = views
+            for decl in self.allDeclarationList:
+                if isinstance(decl, BlockDecl):
+                    blockDecls.append(decl)
+                elif isinstance(decl, TemplateDecl):
+                    templateDecls.append(decl)
+                    if isinstance(decl.declaration, BlockDecl):
+                        templateBlockDecls.append(decl)
+                    else:
+                        templateFuncDefs.append(decl)
+                else:
+                    funcDefs.append(decl)
+            self.declViews = views
+        return self.declViews
+
+    @property
+    def blockDeclList(self) -> List[BlockDecl]:
+        return self.get_decl_views()[0]
+
+    @property
+    def templateDeclList(self) -> List[TemplateDecl]:
+        return self.get_decl_views()[1]
+
+    @property
+    def templateBlockDeclList(self) -> List[TemplateDecl]:
+        return self.get_decl_views()[2]
+
+    @property
+    def templateFuncDefList(self) -> List[TemplateDecl]:
+        return self.get_decl_views()[3]
+
+    @property
+    def funcDefList(self) -> List[FuncDef]:
+        return self.get_decl_views()[4]
 
 
 class Declaration(Node):
-    pass
+    __slots__ = ()
 
 
 class BlockDecl(Declaration):
-    pass
+    __slots__ = ()
 
 
 class TypeDefDecl(BlockDecl):
+    __slots__ = ('ident', 'typeSpec')
+
     def __init__(self, row, ident, typeSpec: TypeSpecifier):
         super().__init__(row)
         self.ident = ident
         self.typeSpec = typeSpec
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}Typedef:\n{ind+1}ID: {self.ident}\n{ind+1}Type: {self.typeSpec.__str__(ind+2)}\n'
-
 
 class VarDecl(BlockDecl):
+    __slots__ = ('initDeclList',)
+
     def __init__(self, row, initDeclList: List[InitDecl], isConst: bool):
         super().__init__(row)
         self.initDeclList = initDeclList
@@ -91,14 +130,10 @@ class VarDecl(BlockDecl):
             for initdecl in self.initDeclList:
                 initdecl.isConst = True
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}VarDecl:\n'
-        for initdecl in self.initDeclList:
-            ret += initdecl.__str__(ind+1)
-        return ret
-
 
 class InitDecl(Node):
+    __slots__ = ('ident', 'typeSpec', 'initVal', 'isConst')
+
     def __init__(self, row, typeSpec: Optional[TypeSpecifier], ident: str, initVal: Optional[Expression]):
         super().__init__(row)
         self.ident = ident
@@ -106,165 +141,119 @@ class InitDecl(Node):
         self.initVal = initVal
         self.isConst = False
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}InitDecl: {"(const)" if self.isConst else ""}\n'
-        ret += f'{ind+1}Type: {self.typeSpec.__str__(ind+2) if self.typeSpec else "(empty)"}\n'
-        ret += f'{ind+1}ID: {self.ident}\n'
-        ret += f'{ind+1}Initializer:\n{self.initVal.__str__(ind+2) if self.typeSpec else ""}'
-        return ret
-
 
 class FuncDecl(BlockDecl):
+    __slots__ = ('ident', 'funcType')
+
     def __init__(self, row, ident: str, funcType: FuncType):
         super().__init__(row)
         self.ident = ident
         self.funcType = funcType
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}FuncDecl:\n'
-        ret += f'{ind+1}ID: {self.ident}\n'
-        ret += f'{self.funcType.__str__(ind+1)}'
-        return ret
-
 
 class TemplateDecl(Declaration):
+    __slots__ = ('typeNameList', 'declaration')
+
     def __init__(self, row, typeNameList: List[str], declaration: Declaration):
         super().__init__(row)
         self.typeNameList = typeNameList
         self.declaration = declaration
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}Template: {self.declaration.__str__(ind+1)}'
-
 
 class FuncDef(Declaration):
+    __slots__ = ('funcDecl', 'blockStmt')
+
     def __init__(self, row, funcDecl: FuncDecl, blockStmt: BlockStmt):
         super().__init__(row)
         self.funcDecl = funcDecl
         self.blockStmt = blockStmt
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}Function Definition:\n{self.funcDecl.__str__(ind+1)}{self.blockStmt.__str__(ind+1)}'
-
-
-class MainFuncDef(Node):
-    def __init__(self, row, blockStmt: BlockStmt):
-        super().__init__(row)
-        self.blockStmt = blockStmt
-
-    def __str__(self, ind=Indent()):
-        return f'{ind}MainFuncDef:\n{self.blockStmt.__str__(ind+1)}'
-
 
 class TypeSpecifier(Node):
-    pass
+    __slots__ = ()
 
 
 class BType(TypeSpecifier):
+    __slots__ = ('bType',)
+
     def __init__(self, row, bType: BasicType):
         super().__init__(row)
         self.bType = bType
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}{self.bType.name}'
-
 
 class DefinedType(TypeSpecifier):
+    __slots__ = ('typeName',)
+
     def __init__(self, row, typeName: str):
         super().__init__(row)
         self.typeName = typeName
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}Defined type({self.typeName})'
-
 
 class GenericType(TypeSpecifier):
+    __slots__ = ('typeName',)
+
     def __init__(self, row, typeName: str):
         super().__init__(row)
         self.typeName = typeName
 
-    def __str__(self, ind=Indent()):
-        return f'Generic Type({self.typeName})'
-
 
 class ArrayType(TypeSpecifier):
+    __slots__ = ('typeSpec', 'size')
+
     def __init__(self, row, typeSpec: TypeSpecifier, size: Optional[int]):
         super().__init__(row)
         self.typeSpec = typeSpec
         self.size = size
 
-    def __str__(self, ind=Indent()):
-        return f'{self.typeSpec.__str__(ind+1)}[{self.size if self.size else ""}]'
-
 
 class ReferType(TypeSpecifier):
+    __slots__ = ('typeSpec',)
+
     def __init__(self, row, typeSpec: TypeSpecifier):
         super().__init__(row)
         self.typeSpec = typeSpec
 
-    def __str__(self, ind=Indent()):
-        return f'{self.typeSpec.__str__(ind+1)} reference'
-
 
 class StructType(TypeSpecifier):
+    __slots__ = ('ident', 'genericSpecList')
+
     def __init__(self, row, ident: str, genericSpecList: List[TypeSpecifier]):
         super().__init__(row)
         self.ident = ident
         self.genericSpecList = genericSpecList
 
-    def __str__(self, ind=Indent()):
-        if len(self.genericSpecList) > 0:
-            tmpstr = '<'
-            for i, genericSpec in enumerate(self.genericSpecList):
-                if i != 0:
-                    tmpstr += ', '
-                tmpstr += f'{genericSpec.__str__(ind + 1)}'
-            tmpstr += '>'
-        else:
-            tmpstr = ''
-        return f'struct {tmpstr} ({self.ident})'
-
 
 class FuncType(TypeSpecifier):
+    __slots__ = ('funcParamList', 'funcRetType')
+
     def __init__(self, row, funcParamList: List[FuncParam], funcRetType: Optional[TypeSpecifier] = None):
         super().__init__(row)
         self.funcParamList = funcParamList
         self.funcRetType = funcRetType
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}Function Type:\n'
-        ret += f'{ind+1}FuncParams:\n'
-        for param in self.funcParamList:
-            ret += param.__str__(ind+2)
-        ret += f'{ind+1}FuncRetType: {self.funcRetType.__str__(ind+2) if self.funcRetType else "(Empty)"}\n'
-        return ret
-
 
 class FuncParam(Node):
+    __slots__ = ('paramType', 'ident')
+
     def __init__(self, row, paramType: Optional[TypeSpecifier] = None, ident: str = ""):
         super().__init__(row)
         self.paramType = paramType
         self.ident = ident
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}FuncParam:\n'
-        ret += f'{ind+1}Type: {self.paramType.__str__(ind+2) if self.paramType else "(Empty)"}\n'
-        ret += f'{ind+1}ID: {self.ident}\n'
-        return ret
-
 
 class GenericTypeDecl(Node):
+    __slots__ = ('ident',)
+
     def __init__(self, row, ident) -> None:
         super().__init__(row)
         self.ident = ident
 
-    def __str__(self, ind=Indent()) -> str:
-        return f'{ind}Generic Name: {self.ident}\n'
-
 
 # 结构体
 
 class StructDecl(BlockDecl):
+    __slots__ = ('ident', 'memberDeclList', 'consFuncDefList', 'memberFuncDefList')
+
     def __init__(self, row, ident: str, memberList: List[StructMember]):
         super().__init__(row)
         self.ident = ident
@@ -285,122 +274,88 @@ class StructDecl(BlockDecl):
         else:
             raise TypeError(f'unknown member type {type(member)}')
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}Struct Declaration:\n{ind+1}ID: {self.ident}\n'
-        ret += f'{ind+1}Members:\n'
-        for member in self.memberDeclList:
-            ret += member.__str__(ind+2)
-        for member in self.consFuncDefList:
-            ret += member.__str__(ind+2)
-        for member in self.memberFuncDefList:
-            ret += member.__str__(ind+2)
-        return ret
-
 
 class StructMember(Node):
-    pass
+    __slots__ = ()
 
 
 class MemberVarDecl(StructMember):
+    __slots__ = ('ident', 'typeSpec')
+
     def __init__(self, row, ident: str, typeSpec: TypeSpecifier):
         super().__init__(row)
         self.ident = ident
         self.typeSpec = typeSpec
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}MemberDecl:\n'
-        ret += f'{ind+1}ID: {self.ident}\n'
-        ret += f'{ind+1}Type: {self.typeSpec.__str__(ind+2)}\n'
-        return ret
-
 
 class ConsFuncDef(StructMember):
+    __slots__ = ('structType', 'funcType', 'blockStmt')
+
     def __init__(self, row, structType: StructType, funcType: FuncType, blockStmt: BlockStmt):
         super().__init__(row)
         self.structType = structType
         self.funcType = funcType
         self.blockStmt = blockStmt
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}ConsFuncDef:\n'
-        ret += f'{ind+1}{self.structType.__str__(ind+1)}\n'
-        ret += f'{self.funcType.__str__(ind+1)}\n'
-        ret += f'{self.blockStmt.__str__(ind+1)}\n'
-        return ret
-
 
 class MemberFuncDef(StructMember):
+    __slots__ = ('funcDef',)
+
     def __init__(self, row, funcDef: FuncDef):
         super().__init__(row)
         self.funcDef = funcDef
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}MemberFuncDef:\n{self.funcDef.__str__(ind+1)}'
-
 
 class Stmt(Node):
-    pass
+    __slots__ = ()
 
 
 class BlockStmt(Stmt):
+    __slots__ = ('stmtList',)
+
     def __init__(self, row, stmtList: List[Stmt]):
         super().__init__(row)
         self.stmtList = stmtList
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}BlockStmt:\n'
-        for stmt in self.stmtList:
-            ret += stmt.__str__(ind+1)
-        return ret
-
 
 class DeclStmt(Stmt):
+    __slots__ = ('varDecl',)
+
     def __init__(self, row, varDecl: VarDecl):
         super().__init__(row)
         self.varDecl = varDecl
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}DeclStmt:\n{self.varDecl.__str__(ind+1)}'
-
 
 class ExpStmt(Stmt):
+    __slots__ = ('exp',)
+
     def __init__(self, row, exp: Optional[Expression]):
         super().__init__(row)
         self.exp = exp
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}Expression Statement:\n{self.exp.__str__(ind+1) if self.exp else ""}'
-
 
 class IfStmt(Stmt):
+    __slots__ = ('cond', 'trueStmt', 'falseStmt')
+
     def __init__(self, row, cond: Expression, trueStmt: Stmt, falseStmt: Optional[Stmt]):
         super().__init__(row)
         self.cond = cond
         self.trueStmt = trueStmt
         self.falseStmt = falseStmt
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}IfStmt:\n'
-        ret += f'{ind+1}cond:\n{self.cond.__str__(ind+2)}'
-        ret += f'{ind+1}trueStmt:\n{self.trueStmt.__str__(ind+2)}'
-        ret += f'{ind+1}falseStmt:\n{self.falseStmt.__str__(ind+2) if self.falseStmt else ""}'
-        return ret
-
 
 class WhileStmt(Stmt):
+    __slots__ = ('cond', 'loopStmt')
+
     def __init__(self, row, cond: Expression, loopStmt: Stmt):
         super().__init__(row)
         self.cond = cond
         self.loopStmt = loopStmt
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}WhileStmt:\n'
-        ret += f'{ind+1}cond:\n{self.cond.__str__(ind+2)}'
-        ret += f'{ind+1}loopStmt:\n{self.loopStmt.__str__(ind+2)}'
-        return ret
-
 
 class ForStmt(Stmt):
+    __slots__ = ('init', 'cond', 'after', 'loopStmt')
+
     def __init__(self, row, init: Stmt, cond: Expression, after: Stmt, loopStmt: Stmt):
         super().__init__(row)
         self.init = init
@@ -408,192 +363,143 @@ class ForStmt(Stmt):
         self.after = after
         self.loopStmt = loopStmt
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}ForStmt:\n'
-        ret += f'{ind + 1}init:\n{self.init.__str__(ind + 2)}'
-        ret += f'{ind + 1}cond:\n{self.cond.__str__(ind + 2)}'
-        ret += f'{ind + 1}after:\n{self.after.__str__(ind + 2)}'
-        ret += f'{ind + 1}loopStmt:\n{self.loopStmt.__str__(ind + 2)}'
-        return ret
-
 
 class BreakStmt(Stmt):
+    __slots__ = ()
+
     def __init__(self, row):
         super().__init__(row)
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}BreakStmt\n'
-        return ret
-
 
 class ContinueStmt(Stmt):
+    __slots__ = ()
+
     def __init__(self, row):
         super().__init__(row)
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}ContinueStmt\n'
-        return ret
-
 
 class ReturnStmt(Stmt):
+    __slots__ = ('exp',)
+
     def __init__(self, row, exp: Optional[Expression]):
         super().__init__(row)
         self.exp = exp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}ReturnStmt:\n'
-        ret += f'{self.exp.__str__(ind+1) if self.exp else ""}'
-        return ret
-
 
 class Expression(Node):
-    pass
+    __slots__ = ()
 
 
 class AssignExp(Expression):
+    __slots__ = ('LVal', 'exp')
+
     def __init__(self, row, LVal: Expression, exp: Expression):
         super().__init__(row)
         self.LVal = LVal
         self.exp = exp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}AssignExp:\n{self.LVal.__str__(ind+1)} equals {self.exp.__str__(ind+1)}'
-        return ret
-
 
 class UnaryExp(Expression):
+    __slots__ = ('unaryOp', 'exp')
+
     def __init__(self, row, unaryOp: UnaryOp, exp: Expression):
         super().__init__(row)
         self.unaryOp = unaryOp
         self.exp = exp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}UnaryExp:\n'
-        ret += f'{ind+1}unaryOp:{self.unaryOp.name}\n'
-        ret += f'{self.exp.__str__(ind+1)}'
-        return ret
-
 
 class BinaryExp(Expression):
+    __slots__ = ('leftExp', 'rightExp', 'binaryOp')
+
     def __init__(self, row, leftExp: Expression, rightExp: Expression, binaryOp: BinaryOp):
         super().__init__(row)
         self.leftExp = leftExp
         self.rightExp = rightExp
         self.binaryOp = binaryOp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}BinaryExp:\n'
-        ret += f'{self.leftExp.__str__(ind+1)}'
-        ret += f'{self.rightExp.__str__(ind+1)}'
-        ret += f'{ind + 1}binaryOp: {self.binaryOp.name}\n'
-        return ret
-
 
 class PostfixExp(Expression):
-    pass
+    __slots__ = ()
 
 
 class PrimaryExp(PostfixExp):
-    pass
+    __slots__ = ()
 
 
 class LiteralPri(PrimaryExp):
-    def __init__(self, row, literal):
+    __slots__ = ('value', 'kind', 'bType')
+
+    def __init__(self, row, value, kind: str, bType: Optional[BasicType] = None):
         super().__init__(row)
-        self.literal = literal
-        
-    def __str__(self, ind=Indent()):
-        return f'{ind}LiteralPrE: ({self.literal.type}) {self.literal.value}\n'
+        self.value = value
+        self.kind = kind
+        self.bType = bType  # 常量折叠得到的字面量带上运算结果的类型（如 f32），源码中的字面量为 None
 
 
 class IdentPri(PrimaryExp):
+    __slots__ = ('ident',)
+
     def __init__(self, row, ident: str):
         super().__init__(row)
         self.ident = ident
 
-    def __str__(self, ind=Indent()):
-        return f'{ind}IdentPrE: {self.ident}\n'
-
 
 class ExpPri(PrimaryExp):
+    __slots__ = ('exp',)
+
     def __init__(self, row, exp: Expression):
         super().__init__(row)
         self.exp = exp
 
-    def __str__(self, ind=Indent()):
-        return self.exp.__str__(ind)
-
 
 class ArrayIndexExp(PostfixExp):
+    __slots__ = ('arrayExp', 'indexExp')
+
     def __init__(self, row, arrayExp: PostfixExp, indexExp: Expression):
         super().__init__(row)
         self.arrayExp = arrayExp
         self.indexExp = indexExp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}ArrayIndexExp:\n'
-        ret += f'{ind+1}arrayExp:\n{self.arrayExp.__str__(ind+2)}\n'
-        ret += f'{ind+1}indexExp:\n{self.indexExp.__str__(ind+2)}\n'
-        return ret
-
 
 class MemberExp(PostfixExp):
+    __slots__ = ('objectExp', 'MemberID')
+
     def __init__(self, row, objectExp: PostfixExp, MemberID: str):
         super().__init__(row)
         self.objectExp = objectExp
         self.MemberID = MemberID
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}MemberExp:\n'
-        ret += f'{ind+1}objectExp:\n{self.objectExp.__str__(ind+2)}\n'
-        ret += f'{ind+1}MemberID:\n{self.MemberID}\n'
-        return ret
-
 
 class ReferExp(PostfixExp):
+    __slots__ = ('referObjectExp',)
+
     def __init__(self, row, referObjectExp: PostfixExp):
         super().__init__(row)
         self.referObjectExp = referObjectExp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}ReferExp:\n'
-        ret += f'{ind+1}referObjectExp:\n{self.referObjectExp.__str__(ind+2)}\n'
-        return ret
-
 
 class CastExp(PostfixExp):
+    __slots__ = ('typeSpec', 'castedExp')
+
     def __init__(self, row, typeSpec: TypeSpecifier, castedExp: Expression):
         super().__init__(row)
         self.typeSpec = typeSpec
         self.castedExp = castedExp
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}CastExp:\n'
-        ret += f'{ind+1}Type: {self.typeSpec.__str__(ind+2)}\n'
-        ret += f'{ind+1}castedExp:\n{self.castedExp.__str__(ind+2)}\n'
-        return ret
-
 
 class FuncCallExp(PostfixExp):
+    __slots__ = ('funcExp', 'genericSpecList', 'paramExpList')
+
     def __init__(self, row, funcExp: PostfixExp, genericSpecList: List[TypeSpecifier], paramExpList: List[Expression]):
         super().__init__(row)
         self.funcExp = funcExp
         self.genericSpecList = genericSpecList
         self.paramExpList = paramExpList
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}FuncCallExp:\n'
-        ret += f'{ind+1}funcExp:\n{self.funcExp.__str__(ind+2)}'
-        ret += f'{ind+1}genericSpecList:\n'
-        for i, genericsSpec in enumerate(self.genericSpecList):
-            ret += f'{ind+2}<{i}>: {genericsSpec.__str__(ind+3)}\n'
-        ret += f'{ind+1}paramExpList:\n'
-        for param in self.paramExpList:
-            ret += param.__str__(ind+2)
-        return ret
-
 
 class IOExp(PostfixExp):
+    __slots__ = ('inIdent', 'outExp', 'ioType', 'typeSpec')
+
     def __init__(self, row, ioType: IOType, typeSpec: TypeSpecifier, inIdent: str = "", outExp: Expression = None):
         super().__init__(row)
         self.inIdent = inIdent
@@ -601,23 +507,11 @@ class IOExp(PostfixExp):
         self.ioType = ioType
         self.typeSpec = typeSpec
 
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}IOExp:\n'
-        ret += f'{ind+1}inIdent: {self.inIdent}\n'
-        ret += f'{ind+1}outExp: \n{self.outExp.__str__(ind+2)}\n'
-        ret += f'{ind+1}ioType: {self.ioType.name}\n'
-        ret += f'{ind+1}type: {self.typeSpec.__str__(ind+2)}\n'
-        return ret
-
 
 class LambdaExp(PostfixExp):
+    __slots__ = ('funcType', 'blockStmt')
+
     def __init__(self, row, funcType: FuncType, blockStmt: BlockStmt):
         super().__init__(row)
         self.funcType = funcType
         self.blockStmt = blockStmt
-
-    def __str__(self, ind=Indent()):
-        ret = f'{ind}Lambda Expression:\n'
-        ret += f'{self.funcType.__str__(ind+1)}'
-        ret += f'{self.blockStmt.__str__(ind+1)}'
-        return ret
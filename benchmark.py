@@ -0,0 +1,920 @@
+"""编译器前端性能基准
+
+Generates synthetic matrix-only programs of configurable size and measures the
+lexer and parser built by create_lexer()/create_parser():
+
+    python benchmark.py --size 2000
+    python benchmark.py --save-baseline bench_baseline.json
+    python benchmark.py --baseline bench_baseline.json
+    python benchmark.py --micro query-name
+    python benchmark.py --micro cold-start
+    python benchmark.py --micro mmap
+    python benchmark.py --micro ast-memory
+    python benchmark.py --micro flat-ast
+    python benchmark.py --micro list-scaling
+    python benchmark.py --micro many-decls
+    python benchmark.py --micro print
+    python benchmark.py --micro traverse
+    python benchmark.py --micro deep-expr
+    python benchmark.py --micro constfold
+    python benchmark.py --micro semantic
+    python benchmark.py --micro scopes
+    python benchmark.py --micro clone
+    python benchmark.py --micro types
+    python benchmark.py --micro templates
+    python benchmark.py --micro codegen
+    python benchmark.py --micro jit-cache
+    python benchmark.py --micro pipeline
+"""
+import argparse
+import gc
+import json
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from sys import stdout
+from typing import Callable, Dict, List
+from enums import BasicType
+from lexer import create_bytes_lexer, create_lexer, init_lexer_context, input_bytes
+from parser import create_parser
+from symboltable import SymbolTable
+from type import Type, interned_count
+from flatast import FlatAST
+import ast1
+import codegen
+import constfold
+import printer
+import semantic
+import visitor
+
+
+############################################################## 源程序生成
+def gen_funcs(n: int) -> str:
+    parts = []
+    for i in range(n):
+        parts.append(
+            f'func fn{i}(int: a, int: b) = int {{\n'
+            f'    var int: c = a * {i} + b;\n'
+            f'    if (c == b)\n'
+            f'        return a;\n'
+            f'    while (c > 0) {{\n'
+            f'        c = c - 1;\n'
+            f'    }}\n'
+            f'    return c + a - b;\n'
+            f'}}\n'
+        )
+    return ''.join(parts)
+
+
+def gen_structs(n: int, depth: int = 8) -> str:
+    parts = []
+    for i in range(n):
+        parts.append(f'struct S{i} {{\n    f32 : x;\n')
+        if i > 0:
+            parts.append(f'    S{i - 1} : inner;\n')
+        parts.append(f'    func S{i}(&S{i}: self) {{\n        self.x = 0.0;\n    }}\n')
+        member = 'self' + '.inner' * min(i, depth) + '.x'
+        parts.append(f'    func get(&S{i}: self) = f32 {{\n        return {member} + self.x;\n    }}\n')
+        parts.append('};\n')
+    return ''.join(parts)
+
+
+def gen_templates(n: int, width: int = 16) -> str:
+    names = [f'T{k}' for k in range(width)]
+    params = ', '.join(f'{name}: a{k}' for k, name in enumerate(names))
+    body = ' + '.join(f'a{k}' for k in range(width))
+    parts = []
+    for i in range(n):
+        parts.append(
+            f'template<{", ".join(names)}>\n'
+            f'func t{i}({params}) {{\n'
+            f'    return {body};\n'
+            f'}}\n'
+        )
+    return ''.join(parts)
+
+
+def gen_binary_chain(n: int) -> str:
+    ops = ['+', '-', '*', '+', '/', '-', '%']
+    terms = ['a']
+    for i in range(1, n):
+        terms.append(f' {ops[i % len(ops)]} {i % 97 + 1}')
+    return f'func chain(int: a) = int {{\n    return {"".join(terms)};\n}}\n'
+
+
+def gen_long_block(n: int) -> str:
+    # 一个块里 n 条语句、一条声明里 n 个变量、一个函数 n 个参数，考察列表产生式的扩展性
+    params = ', '.join(f'int: p{i}' for i in range(n))
+    decls = ', '.join(f'v{i} = {i}' for i in range(n))
+    stmts = ''.join(f'    p0 = p0 + {i % 97};\n' for i in range(n))
+    return f'func block({params}) = int {{\n    var {decls};\n{stmts}    return p0;\n}}\n'
+
+
+def gen_nested_scopes(n: int, depth: int = 64) -> str:
+    # n 个函数，每个函数体内嵌套 depth 层块，每层声明局部变量并引用外层变量与全局常量
+    lines = [f'const int: g{i} = {i};' for i in range(8)]
+    for f in range(n):
+        lines.append(f'func nest{f}(int: a) = int {{')
+        lines.append('    var x0 = a;')
+        for d in range(1, depth + 1):
+            lines.append(f'{"    " * d}{{ var x{d} = x{d - 1} + g{d % 8} * a;')
+        lines.append(f'{"    " * (depth + 1)}a = x{depth} + g0;')
+        lines.append(' ' * 4 + '}' * depth)
+        lines.append('    return a;\n}')
+    return '\n'.join(lines) + '\n'
+
+
+def gen_mixed(n: int) -> str:
+    return (gen_structs(max(n // 10, 1)) + gen_templates(max(n // 10, 1)) +
+            gen_funcs(n) + gen_binary_chain(n))
+
+
+GENERATORS: Dict[str, Callable[[int], str]] = {
+    'funcs': gen_funcs,
+    'structs': gen_structs,
+    'templates': gen_templates,
+    'binary': gen_binary_chain,
+    'block': gen_long_block,
+    'mixed': gen_mixed,
+}
+
+
+############################################################## 测量
+def count_nodes(root: ast1.Node) -> int:
+    count = 0
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ast1.Node):
+            count += 1
+            stack.extend(getattr(item, name) for name in ast1.field_names(type(item)))
+        elif isinstance(item, list):
+            stack.extend(item)
+    return count
+
+
+_dict_classes: Dict[type, type] = {}
+
+
+def dict_class(cls: type) -> type:
+    """字段与节点类 cls 相同、但没有 __slots__ 的对照类，即改用 __slots__ 之前的节点布局"""
+    mirror = _dict_classes.get(cls)
+    if mirror is None:
+        mirror = _dict_classes[cls] = type(cls.__name__, (object,), {})
+    return mirror
+
+
+def copy_tree(root: ast1.Node, make: Callable[[type], object]) -> object:
+    """逐节点复制 AST，节点换成 make(节点类) 创建的对象，列表复制，其余字段值共享；显式栈，不受树深度限制"""
+    copies = {}
+    order = []
+    stack = [root]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, ast1.Node):
+            copies[id(item)] = make(type(item))
+            order.append(item)
+            stack.extend(getattr(item, name) for name in ast1.field_names(type(item)))
+        elif isinstance(item, list):
+            stack.extend(item)
+
+    def copy_value(value):
+        if isinstance(value, ast1.Node):
+            return copies[id(value)]
+        if isinstance(value, list):
+            return [copy_value(item) for item in value]
+        return value
+
+    for node in order:
+        copy = copies[id(node)]
+        for name in ast1.field_names(type(node)):
+            setattr(copy, name, copy_value(getattr(node, name)))
+    return copies[id(root)]
+
+
+def lex_all(code_str: str) -> int:
+    lexer = create_lexer()
+    lexer.input(code_str)
+    count = 0
+    while lexer.token():
+        count += 1
+    return count
+
+
+def startup():
+    return create_lexer(), create_parser()
+
+
+def parse_all(code_str: str) -> ast1.CompUnit:
+    lexer, parser = startup()
+    return parser.parse(code_str, lexer=lexer)
+
+
+def best_of(func, repeat: int):
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def peak_memory(func) -> int:
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def bench_case(name: str, size: int, repeat: int) -> Dict[str, float]:
+    code_str = GENERATORS[name](size)
+    lex_time, token_count = best_of(lambda: lex_all(code_str), repeat)
+    startup_time, _ = best_of(startup, repeat)
+    parse_time, ast_root = best_of(lambda: parse_all(code_str), repeat)
+    return {
+        'startup_time': startup_time,
+        'source_bytes': len(code_str),
+        'tokens': token_count,
+        'lex_time': lex_time,
+        'tokens_per_sec': token_count / lex_time if lex_time else 0.0,
+        'parse_time': parse_time - startup_time,
+        'ast_nodes': count_nodes(ast_root),
+        'lex_peak_bytes': peak_memory(lambda: lex_all(code_str)),
+        'parse_peak_bytes': peak_memory(lambda: parse_all(code_str)),
+    }
+
+
+############################################################## 微基准
+def micro_query_name(repeat: int) -> List[str]:
+    """lexer 吞吐量随已登记的 struct / typedef / 泛型名数量的变化"""
+    code_str = gen_funcs(200)
+    rows = []
+    for count in (10, 100, 1000, 10000, 100000):
+        lexer = create_lexer()
+        context = lexer.context
+        for i in range(count):
+            context.add_struct(f'S{i}')
+            context.add_typedef(f'D{i}')
+        context.push_generic_scope()
+        for i in range(count):
+            context.add_generic_type(f'G{i}')
+
+        def lex_with_names():
+            lexer.input(code_str)
+            tokens = 0
+            while lexer.token():
+                tokens += 1
+            return tokens
+
+        lex_with_names()
+        elapsed, tokens = best_of(lex_with_names, repeat)
+        rows.append(f'{count:>8} names/kind: {tokens / elapsed:>12.0f} tokens/s')
+    return rows
+
+
+def micro_mmap(repeat: int) -> List[str]:
+    """整文件读成 str 后词法分析 vs. mmap 后直接在字节上词法分析"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        source_file = os.path.join(tmp_dir, 'big.mo')
+        with open(source_file, 'w', encoding='utf8') as f:
+            f.write(gen_funcs(5000))
+
+        def lex_read():
+            lexer = create_lexer()
+            with open(source_file, 'r', encoding='utf8') as f:
+                lexer.input(f.read())
+            return sum(1 for _ in iter(lexer.token, None))
+
+        def lex_mapped():
+            lexer = create_bytes_lexer()
+            with open(source_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                input_bytes(lexer, data)
+                count = sum(1 for _ in iter(lexer.token, None))
+                lexer.lexdata = lexer.lexmatch = None
+            return count
+
+        rows = [f'source: {os.path.getsize(source_file) // 1024} KB']
+        for name, func in (('read()', lex_read), ('mmap', lex_mapped)):
+            elapsed, tokens = best_of(func, repeat)
+            rows.append(f'{name:<8}: {tokens / elapsed:>10.0f} tokens/s, peak {peak_memory(func) // 1024:>8} KB')
+    return rows
+
+
+def micro_ast_memory(repeat: int) -> List[str]:
+    """解析结束后 AST 实际占用的内存（含字段里的字符串、列表等），按节点平均"""
+    code_str = gen_funcs(2000) + gen_binary_chain(5000)
+    lexer, parser = startup()
+    gc.collect()
+    tracemalloc.start()
+    ast_root = parser.parse(code_str, lexer=lexer)
+    lexer.lexdata = None
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    nodes = count_nodes(ast_root)
+    rows = [f'{nodes} nodes, {retained // 1024} KB retained, {retained / nodes:.1f} bytes/node']
+    # 对照：同一棵树分别复制成 __slots__ 节点和字段存在 __dict__ 里的节点，字段值共享，只统计节点与列表
+    sizes = {}
+    for name, make in (('__slots__', object.__new__), ('__dict__', lambda cls: dict_class(cls)())):
+        gc.collect()
+        tracemalloc.start()
+        tree = copy_tree(ast_root, make)
+        gc.collect()
+        sizes[name] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del tree
+        rows.append(f'{name:<9}: {sizes[name] / nodes:>6.1f} bytes/node (nodes and lists only)')
+    rows.append(f'__slots__ saves {1 - sizes["__slots__"] / sizes["__dict__"]:.0%} against __dict__ nodes')
+    return rows
+
+
+def micro_flat_ast(repeat: int) -> List[str]:
+    """对象树与平铺数组 AST：转换、全树遍历和序列化的耗时"""
+    code_str = gen_funcs(2000) + gen_binary_chain(5000)
+    lexer, parser = startup()
+    ast_root = parser.parse(code_str, lexer=lexer)
+    flat = FlatAST.from_tree(ast_root)
+    data = flat.to_bytes()
+
+    def count_flat():
+        counts = [0] * len(flat.layouts)
+        for kind in flat.kind:
+            counts[kind] += 1
+        return counts
+
+    rows = [f'{count_nodes(ast_root)} nodes, {len(flat)} flat entries, {len(data) // 1024} KB serialized']
+    for name, func in (('from_tree', lambda: FlatAST.from_tree(ast_root)),
+                       ('to_tree', flat.to_tree),
+                       ('walk objects', lambda: count_nodes(ast_root)),
+                       ('walk flat', count_flat),
+                       ('to_bytes', flat.to_bytes),
+                       ('from_bytes', lambda: FlatAST.from_bytes(data))):
+        elapsed, _ = best_of(func, repeat)
+        rows.append(f'{name:<12}: {elapsed * 1000:>10.2f} ms')
+    return rows
+
+
+def micro_list_scaling(repeat: int) -> List[str]:
+    """列表长度翻倍时解析耗时应大致翻倍（线性），每元素耗时保持平稳"""
+    lexer, parser = startup()
+    rows = []
+    for n in (1000, 5000, 20000, 50000):
+        code_str = gen_long_block(n)
+
+        def parse_block():
+            init_lexer_context(lexer)
+            return parser.parse(code_str, lexer=lexer)
+
+        elapsed, _ = best_of(parse_block, repeat)
+        rows.append(f'{n:>6} items/list: {elapsed * 1000:>10.1f} ms, {elapsed / n * 1e6:>6.2f} us/item')
+    return rows
+
+
+def micro_many_decls(repeat: int) -> List[str]:
+    """10 万个顶层声明：CompUnit 逐个添加声明、首次取分类视图，以及完整解析的耗时"""
+    n = 100000
+    code_str = ''.join(f'var int: g{i} = {i};\n' if i % 2 else f'func fn{i}() {{\n}}\n' for i in range(n))
+    lexer, parser = startup()
+    decls = parser.parse(code_str, lexer=lexer).allDeclarationList
+
+    def build():
+        comp_unit = ast1.CompUnit(1)
+        for decl in decls:
+            comp_unit.add_declaration(decl)
+        return comp_unit
+
+    def parse_decls():
+        init_lexer_context(lexer)
+        return parser.parse(code_str, lexer=lexer)
+
+    rows = []
+    for name, func in (('add_declaration', build),
+                       ('views', lambda: build().funcDefList),
+                       ('parse', parse_decls)):
+        elapsed, _ = best_of(func, repeat)
+        rows.append(f'{n} decls, {name:<16}: {elapsed * 1000:>10.1f} ms')
+    return rows
+
+
+def micro_print(repeat: int) -> List[str]:
+    """AstPrinter 先拼成整串再写 vs. 流式写入文件"""
+    code_str = gen_structs(200) + gen_templates(200) + gen_funcs(3000)
+    lexer, parser = startup()
+    ast_root = parser.parse(code_str, lexer=lexer)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        out_file = os.path.join(tmp_dir, 'out.ast')
+
+        def write_str():
+            with open(out_file, 'w', encoding='utf8') as f:
+                f.write(printer.dumps(ast_root))
+
+        def write_stream():
+            with open(out_file, 'w', encoding='utf8') as f:
+                printer.dump(ast_root, f)
+
+        for name, func in (('dumps()', write_str), ('dump()', write_stream)):
+            elapsed, _ = best_of(func, repeat)
+            rows.append(f'{name:<10}: {elapsed * 1000:>10.1f} ms, peak {peak_memory(func) // 1024:>8} KB '
+                        f'({os.path.getsize(out_file) // 1024} KB output)')
+    return rows
+
+
+class CountingVisitor(visitor.Visitor):
+    def __init__(self) -> None:
+        self.idents = 0
+        self.depth = self.max_depth = 0
+
+    def visit_IdentPri(self, node: ast1.IdentPri) -> None:
+        self.idents += 1
+
+    def enter_Expression(self, node: ast1.Expression) -> None:
+        self.depth += 1
+        self.max_depth = max(self.max_depth, self.depth)
+
+    def leave_Expression(self, node: ast1.Expression) -> None:
+        self.depth -= 1
+
+
+class IdentityTransformer(visitor.Transformer):
+    def visit_LiteralPri(self, node: ast1.LiteralPri) -> ast1.LiteralPri:
+        return node
+
+
+def micro_traverse(repeat: int) -> List[str]:
+    """整棵树遍历的吞吐量，含 2 万项的表达式链（递归遍历会超出递归深度）"""
+    code_str = gen_mixed(2000) + gen_binary_chain(20000).replace('chain', 'long_chain')
+    lexer, parser = startup()
+    ast_root = parser.parse(code_str, lexer=lexer)
+    nodes = count_nodes(ast_root)
+    rows = [f'{nodes} nodes']
+    for name, func in (('walk', lambda: sum(1 for _ in visitor.walk(ast_root))),
+                       ('Visitor.visit', lambda: CountingVisitor().visit(ast_root)),
+                       ('Visitor.traverse', lambda: CountingVisitor().traverse(ast_root)),
+                       ('Transformer', lambda: IdentityTransformer().visit(ast_root))):
+        elapsed, _ = best_of(func, repeat)
+        rows.append(f'{name:<16}: {elapsed * 1000:>8.1f} ms, {nodes / elapsed:>10.0f} nodes/s')
+    return rows
+
+
+def micro_deep_expr(repeat: int) -> List[str]:
+    """n 项左深表达式链：解析、遍历、平铺的耗时应随 n 线性增长，且不触发递归深度限制"""
+    lexer, parser = startup()
+    rows = []
+    for n in (10000, 50000, 100000):
+        code_str = gen_binary_chain(n)
+        init_lexer_context(lexer)
+        parse_time, ast_root = best_of(lambda: parser.parse(code_str, lexer=lexer), 1)
+        walk_time, _ = best_of(lambda: CountingVisitor().traverse(ast_root), repeat)
+        flat_time, _ = best_of(lambda: FlatAST.from_tree(ast_root).to_tree(), repeat)
+        rows.append(f'{n:>6} terms: parse {parse_time / n * 1e6:>6.2f} us/term, '
+                    f'traverse {walk_time / n * 1e6:>6.2f} us/term, flat round trip {flat_time / n * 1e6:>6.2f} us/term')
+    return rows
+
+
+def gen_const_chain(n: int) -> str:
+    # 常量逐个引用前一个常量，最后在函数里用常量组成的表达式链，折叠后应只剩字面量
+    decls = ''.join(f'const int: c{i} = c{i - 1} * 3 + {i % 97};\n' for i in range(1, n))
+    return f'const int: c0 = 1;\n{decls}' + gen_binary_chain(n).replace('(int: a)', '()').replace('a', f'c{n - 1}', 1)
+
+
+def micro_constfold(repeat: int) -> List[str]:
+    """常量折叠：折叠前后节点数与每个节点的折叠耗时"""
+    lexer, parser = startup()
+    rows = []
+    for n in (1000, 10000, 50000):
+        code_str = gen_const_chain(n)
+        times = []
+        for _ in range(max(repeat, 1)):
+            init_lexer_context(lexer)
+            ast_root = parser.parse(code_str, lexer=lexer)
+            before = count_nodes(ast_root)
+            start = time.perf_counter()
+            folded = constfold.fold_constants(ast_root)
+            times.append(time.perf_counter() - start)
+        after = count_nodes(ast_root)
+        rows.append(f'{n:>6} consts: {before:>7} -> {after:>7} nodes, {folded:>6} subtrees folded, '
+                    f'{min(times) * 1000:>8.1f} ms ({min(times) / before * 1e6:.2f} us/node)')
+    return rows
+
+
+def micro_semantic(repeat: int) -> List[str]:
+    """语义分析各阶段的耗时，每个节点的耗时应不随程序规模增长"""
+    lexer, parser = startup()
+    rows = []
+    for n in (200, 2000, 10000):
+        code_str = gen_mixed(n)
+        init_lexer_context(lexer)
+        ast_root = parser.parse(code_str, lexer=lexer)
+        nodes = count_nodes(ast_root)
+        best: Dict[str, float] = {}
+        for _ in range(max(repeat, 1)):
+            analyzer = semantic.analyze(ast_root)
+            for stage, elapsed in analyzer.timings.items():
+                best[stage] = min(best.get(stage, elapsed), elapsed)
+        stages = ', '.join(f'{stage} {elapsed * 1000:>7.1f} ms' for stage, elapsed in best.items())
+        rows.append(f'{n:>6} funcs, {nodes:>7} nodes, {interned_count():>5} interned types: {stages} '
+                    f'({sum(best.values()) / nodes * 1e6:.2f} us/node)')
+    return rows
+
+
+def micro_scopes(repeat: int) -> List[str]:
+    """深层作用域中的名字查找：符号表链上逐层查找外层名字，以及嵌套 64 层块的程序的语义检查耗时"""
+    rows = []
+    lookups = 10000
+    for depth in (10, 50, 200, 800):
+        table = SymbolTable(None, None)
+        table.add_symbol('outer', None)
+        for level in range(depth):
+            table = SymbolTable(table, None)
+            table.add_symbol(f'local{level}', None)
+        elapsed, _ = best_of(lambda: [table.get_symbol('outer') for _ in range(lookups)], repeat)
+        rows.append(f'symbol lookup through {depth:>4} scopes: {elapsed / lookups * 1e9:>8.0f} ns/lookup')
+    lexer, parser = startup()
+    for depth in (16, 64, 256):
+        code_str = gen_nested_scopes(max(2000 // depth, 4), depth)
+        init_lexer_context(lexer)
+        ast_root = parser.parse(code_str, lexer=lexer)
+        nodes = count_nodes(ast_root)
+        elapsed, _ = best_of(lambda: semantic.analyze(ast_root), repeat)
+        rows.append(f'semantic check, {depth:>3} nested blocks: {elapsed * 1000:>8.1f} ms, '
+                    f'{elapsed / nodes * 1e6:.2f} us/node')
+    return rows
+
+
+def micro_clone(repeat: int) -> List[str]:
+    """模板实例化：每次克隆模板的作用域并替换其中的泛型类型与参数类型，实例全部保留"""
+    lexer, parser = startup()
+    init_lexer_context(lexer)
+    analyzer = semantic.analyze(parser.parse(gen_mixed(50), lexer=lexer))
+    width = 16
+    struct_type = analyzer.globalSymtab.get_type('S0')
+    template = SymbolTable(analyzer.globalSymtab, None)
+    for k in range(width):
+        template.add_type(f'T{k}', Type.generic(f'T{k}'))
+        template.add_symbol(f'a{k}', Type.generic(f'T{k}'))
+        template.add_symbol(f's{k}', struct_type)
+    spec_types = [Type.basic(basic_type) for basic_type in semantic.NUMERIC_RANK]
+
+    def instantiate(count: int) -> List[SymbolTable]:
+        instances = []
+        for i in range(count):
+            instance = template.clone()
+            for k in range(width):
+                spec_type = spec_types[(i + k) % len(spec_types)]
+                instance.modify_type_local(f'T{k}', spec_type)
+                instance.modify_symbol_type_local(f'a{k}', spec_type)
+            instances.append(instance)
+        return instances
+
+    rows = []
+    for count in (100, 500):
+        elapsed, _ = best_of(lambda: instantiate(count), repeat)
+        peak = peak_memory(lambda: instantiate(count))
+        rows.append(f'{count:>4} instantiations: {elapsed * 1000:>8.1f} ms ({elapsed / count * 1e6:>7.1f} us each), '
+                    f'peak {peak / 1024:>9.1f} KB ({peak / count / 1024:.1f} KB each)')
+    return rows
+
+
+def micro_types(repeat: int) -> List[str]:
+    """类型的构造、相等比较、哈希与字符串化；类型经过驻留，结构相同即为同一对象"""
+    def build_ref() -> Type:
+        return Type.reference(Type.basic(BasicType.F32))
+
+    def build_func() -> Type:
+        return Type.function([Type.basic(BasicType.INT)] * 4, Type.basic(BasicType.F64))
+
+    def build_array() -> Type:
+        return Type.array(Type.array(Type.basic(BasicType.INT), 8), 4)
+
+    rows, count = [], 20000
+    for name, build in (('ref', build_ref), ('func', build_func), ('array', build_array)):
+        left, right = build(), build()
+        built, _ = best_of(lambda: [build() for _ in range(count)], repeat)
+        compared, _ = best_of(lambda: [left == right for _ in range(count)], repeat)
+        hashed, _ = best_of(lambda: [hash(left) for _ in range(count)], repeat)
+        printed, _ = best_of(lambda: [str(left) for _ in range(count)], repeat)
+        rows.append(f'{name:<6}: build {built / count * 1e9:>7.0f} ns, eq {compared / count * 1e9:>5.0f} ns, '
+                    f'hash {hashed / count * 1e9:>5.0f} ns, str {printed / count * 1e9:>6.0f} ns, '
+                    f'same object {left is right}')
+    return rows
+
+
+def gen_template_calls(n: int, templates: int = 10) -> str:
+    # templates 个模板函数，调用函数里 n 处调用，实参类型轮流取三种组合
+    parts = [
+        f'template<T, U>\nfunc tm{i}(T: a, U: b) {{\n    var c = a * {i} + b;\n'
+        f'    if (c > a)\n        return c;\n    return a + b;\n}}\n'
+        for i in range(templates)
+    ]
+    args = ['i, i', 'i, f', 'f, d']
+    calls = ''.join(f'    r = r + tm{k % templates}({args[k // templates % len(args)]});\n' for k in range(n))
+    parts.append(f'func caller(int: i, f32: f, f64: d) = f64 {{\n    var f64: r = 0.0;\n{calls}    return r;\n}}\n')
+    return ''.join(parts)
+
+
+class UncachedAnalyzer(semantic.SemanticAnalyzer):
+    """每处调用都重新实例化模板，作为特化缓存的对照"""
+    def instantiate(self, *args):
+        self.specializations.clear()
+        return super().instantiate(*args)
+
+
+def micro_templates(repeat: int) -> List[str]:
+    """模板实例化：每组 (模板, 类型实参) 只检查一次，其余调用处命中缓存"""
+    lexer, parser = startup()
+    rows = []
+    for n in (100, 1000, 5000):
+        init_lexer_context(lexer)
+        ast_root = parser.parse(gen_template_calls(n), lexer=lexer)
+        cached, analyzer = best_of(lambda: semantic.SemanticAnalyzer().analyze(ast_root), repeat)
+        uncached, _ = best_of(lambda: UncachedAnalyzer().analyze(ast_root), repeat)
+        rows.append(f'{n:>5} call sites: {len(analyzer.specializations):>3} specializations, '
+                    f'{analyzer.specHits:>5} hits / {analyzer.specMisses:>3} misses, '
+                    f'{cached * 1000:>8.1f} ms cached vs {uncached * 1000:>8.1f} ms re-checking every call')
+    return rows
+
+
+def micro_codegen(repeat: int) -> List[str]:
+    """生成 LLVM IR 的耗时，以及生成的矩阵乘法在 JIT 下与 NumPy/纯 Python 实现的对比"""
+    lexer, parser = startup()
+    rows = []
+    for n in (100, 1000):
+        init_lexer_context(lexer)
+        ast_root = parser.parse(gen_mixed(n), lexer=lexer)
+        analyzer = semantic.analyze(ast_root)
+        elapsed, generator = best_of(lambda: codegen.generate(ast_root, analyzer), repeat)
+        instructions = sum(len(block.instructions) for function in generator.module.functions
+                           for block in function.blocks)
+        rows.append(f'{n:>5} decls: lowered to {len(generator.module.functions):>5} functions, '
+                    f'{instructions:>7} instructions in {elapsed * 1000:>8.1f} ms')
+    rows.extend(run_matmul(repeat))
+    return rows
+
+
+MATMUL_SOURCE = """
+func matmul(f64[]: a, f64[]: b, f64[]: c, int: n) {
+    for (var int: i = 0; n > i; i = i + 1) {
+        for (var int: j = 0; n > j; j = j + 1) {
+            var f64: s = 0.0;
+            for (var int: k = 0; n > k; k = k + 1) {
+                s = s + a[i * n + k] * b[k * n + j];
+            }
+            c[i * n + j] = s;
+        }
+    }
+}
+"""
+
+
+def jit_module(source: str, options=None):
+    """编译 source 并按 options（默认 -O2）优化后用 MCJIT 加载"""
+    import jit
+    lexer, parser = startup()
+    init_lexer_context(lexer)
+    ast_root = parser.parse(source, lexer=lexer)
+    fast_math = options is not None and options.fast_math
+    return jit.compile_module(codegen.generate(ast_root, semantic.analyze(ast_root), fast_math=fast_math).module,
+                              options)
+
+
+def jit_function(source: str, name: str):
+    return jit_module(source).function(name)
+
+
+def micro_jit_cache(repeat: int) -> List[str]:
+    """JIT 编译同一模块：不用缓存、首次写入磁盘缓存、之后命中缓存的耗时"""
+    import jit
+    from cache import ObjectCache
+    lexer, parser = startup()
+    rows = []
+    for n in (100, 1000):
+        init_lexer_context(lexer)
+        ast_root = parser.parse(gen_mixed(n), lexer=lexer)
+        module = codegen.generate(ast_root, semantic.analyze(ast_root)).module
+        with tempfile.TemporaryDirectory() as directory:
+            object_cache = ObjectCache(directory, jit.CACHE_BYTES)
+            uncached, _ = best_of(lambda: jit.compile_module(module), repeat)
+            start = time.perf_counter()
+            jit.compile_module(module, cache=object_cache)
+            first = time.perf_counter() - start
+            cached, _ = best_of(lambda: jit.compile_module(module, cache=object_cache), repeat)
+            rows.append(f'{n:>5} decls: {uncached * 1000:>8.1f} ms uncached, {first * 1000:>8.1f} ms filling cache, '
+                        f'{cached * 1000:>8.1f} ms from cache ({object_cache.stats()})')
+    return rows
+
+
+DOT_SOURCE = """
+func dot(f64[]: a, f64[]: b, int: n) = f64 {
+    var f64: s = 0.0;
+    for (var int: i = 0; n > i; i = i + 1) {
+        s = s + a[i] * b[i];
+    }
+    return s;
+}
+"""
+
+PIPELINE_CONFIGS = [
+    ('-O0', dict(opt=0)),
+    ('-O1', dict(opt=1)),
+    ('-O2', dict(opt=2)),
+    ('-O3', dict(opt=3)),
+    ('-O3 no vectorize', dict(opt=3, loop_vectorize=False, slp_vectorize=False)),
+    ('-O3 fast-math', dict(opt=3, fast_math=True)),
+]
+
+
+def micro_pipeline(repeat: int) -> List[str]:
+    """不同优化配置下的编译耗时、优化后的指令数与 matmul/dot 的运行时间"""
+    import ctypes
+    from pipeline import PipelineOptions
+    n, length = 128, 1 << 20
+    matrix = (ctypes.c_double * (n * n))(*[(i % 7) * 0.5 for i in range(n * n)])
+    result = (ctypes.c_double * (n * n))()
+    vector = (ctypes.c_double * length)(*[(i % 5) * 0.25 for i in range(length)])
+    rows = []
+    for label, config in PIPELINE_CONFIGS:
+        options = PipelineOptions(**config)
+        start = time.perf_counter()
+        module = jit_module(MATMUL_SOURCE + DOT_SOURCE, options)
+        compile_time = time.perf_counter() - start
+        matmul, dot = module.function('matmul'), module.function('dot')
+        matmul_time, _ = best_of(lambda: matmul(matrix, matrix, result, n), repeat)
+        dot_time, _ = best_of(lambda: dot(vector, vector, length), repeat)
+        rows.append(f'{label:<17}: compile {compile_time * 1000:>6.1f} ms '
+                    f'(pipeline {module.report.elapsed * 1000:>5.1f} ms, {module.report.after[2]:>4} instructions), '
+                    f'matmul {n}x{n} {matmul_time * 1000:>7.2f} ms, dot {length} {dot_time * 1000:>6.2f} ms')
+    return rows
+
+
+def python_matmul(a: List[float], b: List[float], n: int) -> List[float]:
+    c = [0.0] * (n * n)
+    for i in range(n):
+        for j in range(n):
+            s = 0.0
+            for k in range(n):
+                s += a[i * n + k] * b[k * n + j]
+            c[i * n + j] = s
+    return c
+
+
+def run_matmul(repeat: int) -> List[str]:
+    import ctypes
+    import random
+    try:
+        import numpy
+    except ImportError:
+        numpy = None
+    matmul = jit_function(MATMUL_SOURCE, 'matmul')
+    rows = []
+    for n in (32, 128):
+        rng = random.Random(n)
+        a = [rng.random() for _ in range(n * n)]
+        b = [rng.random() for _ in range(n * n)]
+        a_buf, b_buf, c_buf = ((ctypes.c_double * (n * n))(*values) for values in (a, b, [0.0] * (n * n)))
+        jitted, _ = best_of(lambda: matmul(a_buf, b_buf, c_buf, n), repeat)
+        pure, expected = best_of(lambda: python_matmul(a, b, n), 1 if n > 64 else repeat)
+        error = max(abs(x - y) for x, y in zip(c_buf, expected))
+        row = f'matmul {n:>4}x{n:<4}: jit {jitted * 1000:>8.2f} ms, python {pure * 1000:>9.1f} ms'
+        if numpy is not None:
+            a_np, b_np = numpy.array(a).reshape(n, n), numpy.array(b).reshape(n, n)
+            vectorized, _ = best_of(lambda: a_np @ b_np, repeat)
+            row += f', numpy {vectorized * 1000:>7.2f} ms'
+        else:
+            row += ', numpy not installed'
+        rows.append(f'{row}, max error {error:.1e}')
+    return rows
+
+
+# complier.py 单文件冷启动（含解释器启动）的目标耗时
+COLD_START_TARGET = 0.15
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_fresh(code: str) -> float:
+    # 把仓库目录放到 sys.path 末尾，避免仓库里的 ast.py 遮蔽标准库
+    prelude = f'import sys; sys.path.pop(0); sys.path.append({REPO_DIR!r}); '
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', prelude + code], check=True,
+                   stdout=subprocess.DEVNULL, cwd=REPO_DIR)
+    return time.perf_counter() - start
+
+
+def micro_cold_start(repeat: int) -> List[str]:
+    """新进程中 complier.py 的冷启动时间，对比表缓存与 PLY 反射构建"""
+    rows = []
+    for flags in ([], ['--no-table-cache']):
+        argv = ['complier.py', 'test/variable', *flags]
+        code = f'import runpy; sys.argv = {argv!r}; runpy.run_path("complier.py", run_name="__main__")'
+        run_fresh(code)  # 预热表缓存
+        elapsed = min(run_fresh(code) for _ in range(max(repeat, 3)))
+        verdict = 'ok' if elapsed <= COLD_START_TARGET else 'over target'
+        rows.append(f'complier.py {" ".join(flags) or "(table cache)":<20}: {elapsed * 1000:>8.1f} ms '
+                    f'(target {COLD_START_TARGET * 1000:.0f} ms, {verdict})')
+    return rows
+
+
+MICRO_BENCHES: Dict[str, Callable[[int], List[str]]] = {
+    'query-name': micro_query_name,
+    'cold-start': micro_cold_start,
+    'mmap': micro_mmap,
+    'ast-memory': micro_ast_memory,
+    'flat-ast': micro_flat_ast,
+    'list-scaling': micro_list_scaling,
+    'many-decls': micro_many_decls,
+    'print': micro_print,
+    'traverse': micro_traverse,
+    'deep-expr': micro_deep_expr,
+    'constfold': micro_constfold,
+    'semantic': micro_semantic,
+    'scopes': micro_scopes,
+    'clone': micro_clone,
+    'types': micro_types,
+    'templates': micro_templates,
+    'codegen': micro_codegen,
+    'jit-cache': micro_jit_cache,
+    'pipeline': micro_pipeline,
+}
+
+
+############################################################## 基线
+# 时间和内存类指标越小越好，吞吐量越大越好
+LOWER_IS_BETTER = ('startup_time', 'lex_time', 'parse_time', 'lex_peak_bytes', 'parse_peak_bytes')
+HIGHER_IS_BETTER = ('tokens_per_sec',)
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    regressions = []
+    for case, metrics in results.items():
+        if case not in baseline:
+            continue
+        base = baseline[case]
+        for key in LOWER_IS_BETTER:
+            if base.get(key) and metrics[key] > base[key] * (1 + tolerance):
+                regressions.append(f'{case}.{key}: {base[key]:.6g} -> {metrics[key]:.6g}')
+        for key in HIGHER_IS_BETTER:
+            if base.get(key) and metrics[key] < base[key] * (1 - tolerance):
+                regressions.append(f'{case}.{key}: {base[key]:.6g} -> {metrics[key]:.6g}')
+        if base.get('ast_nodes') is not None and metrics['ast_nodes'] != base['ast_nodes']:
+            regressions.append(f'{case}.ast_nodes: {base["ast_nodes"]} -> {metrics["ast_nodes"]}')
+    return regressions
+
+
+def report(results: Dict[str, Dict[str, float]]) -> None:
+    stdout.write(f'{"case":<16}{"tokens":>10}{"tok/s":>12}{"start(s)":>10}{"lex(s)":>10}{"parse(s)":>10}'
+                 f'{"nodes":>10}{"lex peak":>12}{"parse peak":>12}\n')
+    for case, m in results.items():
+        stdout.write(f'{case:<16}{m["tokens"]:>10}{m["tokens_per_sec"]:>12.0f}'
+                     f'{m["startup_time"]:>10.4f}{m["lex_time"]:>10.4f}'
+                     f'{m["parse_time"]:>10.4f}{m["ast_nodes"]:>10}'
+                     f'{m["lex_peak_bytes"] // 1024:>10}KB{m["parse_peak_bytes"] // 1024:>10}KB\n')
+
+
+def run():
+    arg_parser = argparse.ArgumentParser(description='matrix-only front-end benchmark')
+    arg_parser.add_argument('cases', nargs='*', metavar='case',
+                            help=f'one of {", ".join(GENERATORS)} (default: all)')
+    arg_parser.add_argument('--size', type=int, default=1000)
+    arg_parser.add_argument('--repeat', type=int, default=3)
+    arg_parser.add_argument('--save-baseline', metavar='PATH')
+    arg_parser.add_argument('--baseline', metavar='PATH')
+    arg_parser.add_argument('--tolerance', type=float, default=0.2)
+    arg_parser.add_argument('--micro', choices=list(MICRO_BENCHES), help='run a micro-benchmark instead')
+    args = arg_parser.parse_args()
+    if args.micro:
+        for row in MICRO_BENCHES[args.micro](args.repeat):
+            stdout.write(row + '\n')
+        return
+    for name in args.cases:
+        if name not in GENERATORS:
+            arg_parser.error(f'unknown case {name}')
+
+    results = {}
+    for name in args.cases or GENERATORS:
+        results[f'{name}-{args.size}'] = bench_case(name, args.size, args.repeat)
+    report(results)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w', encoding='utf8') as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf8') as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        for line in regressions:
+            stdout.write(f'REGRESSION {line}\n')
+        if regressions:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,107 @@
+import hashlib
+import os
+import shutil
+from typing import Optional
+import ply
+
+
+def cache_root() -> str:
+    """缓存根目录：$MATRIX_ONLY_CACHE，否则 $XDG_CACHE_HOME/matrix-only"""
+    root = os.environ.get('MATRIX_ONLY_CACHE')
+    if root:
+        return root
+    xdg = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(xdg, 'matrix-only')
+
+
+def source_key(*source_files: str) -> str:
+    digest = hashlib.sha256(ply.__version__.encode())
+    for source_file in source_files:
+        with open(source_file, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def table_cache_dir(name: str, *source_files: str, root: Optional[str] = None) -> str:
+    """PLY 表缓存目录，按表名（lex/yacc）、源码和 PLY 版本区分，源码改动后自动换目录"""
+    path = os.path.join(root or cache_root(), f'ply-{name}-{source_key(*source_files)}')
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def prune_table_dirs(cache_dir: str) -> None:
+    """写入新表后删除同名表的旧目录，即源码或 PLY 版本改动前留下的、不会再被读取的表"""
+    parent, current = os.path.split(cache_dir)
+    prefix = current.rsplit('-', 1)[0] + '-'
+    with os.scandir(parent) as it:
+        for entry in it:
+            if entry.name.startswith(prefix) and entry.name != current and entry.is_dir():
+                shutil.rmtree(entry.path, ignore_errors=True)  # 可能正被其它进程删除
+
+
+def temp_path(path: str) -> str:
+    # 先写到进程私有的临时文件再 os.replace，避免并发进程读到写了一半的表
+    return f'{path}.{os.getpid()}.tmp'
+
+
+class ObjectCache(object):
+    """磁盘上按键存放的字节缓存，总大小超过 max_bytes 时按最近使用时间淘汰。
+    最近使用时间用文件的 mtime 记录，命中时更新，多个进程共用同一目录时也按同一顺序淘汰。"""
+    def __init__(self, directory: str, max_bytes: int) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key + '.o')
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        path = self.path(key)
+        tmp_path = temp_path(path)
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self) -> None:
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith('.o'):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue  # 已被其它进程淘汰
+            total -= size
+            self.evictions += 1
+
+    def stats(self) -> str:
+        return f'{self.hits} hits, {self.misses} misses, {self.evictions} evictions'
+
+
+def object_cache(max_bytes: int, root: Optional[str] = None) -> ObjectCache:
+    """JIT 目标代码缓存，放在缓存根目录的 jit 子目录下"""
+    return ObjectCache(os.path.join(root or cache_root(), 'jit'), max_bytes)
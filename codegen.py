@@ -0,0 +1,764 @@
+from __future__ import annotations
+import time
+from types import GeneratorType
+from typing import Dict, List, Optional, Sequence, Tuple
+from llvmlite import ir
+import ast1
+from enums import BasicType, BinaryOp, IDType, IOType, UnaryOp
+from error import CodegenError
+from semantic import SemanticAnalyzer, Specialization, literal_type
+from symboltable import SymbolTable
+from type import Type
+from visitor import Visitor
+
+INT32 = ir.IntType(32)
+BOOL1 = ir.IntType(1)
+CHAR_PTR = ir.PointerType(ir.IntType(8))
+
+FLOAT_RANK = {BasicType.F16: 0, BasicType.F32: 1, BasicType.F64: 2}
+
+INT_OPS = {BinaryOp.PLUS: 'add', BinaryOp.MINUS: 'sub', BinaryOp.MUL: 'mul', BinaryOp.DIV: 'sdiv',
+           BinaryOp.MOD: 'srem', BinaryOp.LSHIFT: 'shl', BinaryOp.RSHIFT: 'ashr',
+           BinaryOp.AND: 'and_', BinaryOp.OR: 'or_', BinaryOp.XOR: 'xor'}
+FLOAT_OPS = {BinaryOp.PLUS: 'fadd', BinaryOp.MINUS: 'fsub', BinaryOp.MUL: 'fmul', BinaryOp.DIV: 'fdiv',
+             BinaryOp.MOD: 'frem'}
+COMPARE_OPS = {BinaryOp.EQ: '==', BinaryOp.NEQ: '!=', BinaryOp.LSS: '<', BinaryOp.LEQ: '<=',
+               BinaryOp.GRE: '>', BinaryOp.GEQ: '>='}
+
+# print/scan 使用的 printf/scanf 格式，浮点数打印前统一扩展为 double
+PRINT_FORMATS = {BasicType.BOOL: '%d\n', BasicType.INT: '%d\n',
+                 BasicType.F16: '%g\n', BasicType.F32: '%g\n', BasicType.F64: '%g\n'}
+SCAN_FORMATS = {BasicType.BOOL: ('%d', BasicType.INT), BasicType.INT: ('%d', BasicType.INT),
+                BasicType.F16: ('%f', BasicType.F32), BasicType.F32: ('%f', BasicType.F32),
+                BasicType.F64: ('%lf', BasicType.F64)}
+
+# 全局变量的非常量初始化放在这个函数里，登记到 llvm.global_ctors，在 main 之前执行
+INIT_FUNCTION = '__mo_init'
+
+
+class Address(object):
+    """要求子表达式产生地址（左值）而不是值"""
+    __slots__ = ('node',)
+
+    def __init__(self, node: ast1.Node) -> None:
+        self.node = node
+
+
+class CodeGenerator(Visitor):
+    """把经过语义分析的 CompUnit 翻译成 llvmlite 的 ir.Module。
+
+    表达式与语句的翻译函数 lower_<类名>（取值）与 addr_<类名>（取地址）写成生成器：
+    需要子节点的结果时 yield 子节点（或 Address(子节点)），run 用显式栈驱动这些生成器并把结果 send 回去，
+    所以深层表达式链、多层嵌套的块都不会超出递归深度。
+
+    变量都在函数入口块中 alloca，交给优化器的 mem2reg 提升为寄存器；引用变量的槽里存的是被引用对象的地址。
+    模板函数只生成语义分析记录下的实例，每个实例一个函数。
+    fast_math 时浮点运算与比较带上 fast 标志，允许优化器重结合、忽略 NaN/Inf 与有符号零。"""
+    def __init__(self, analyzer: SemanticAnalyzer, name: str = 'module', fast_math: bool = False) -> None:
+        self.analyzer = analyzer
+        self.fpFlags: Tuple[str, ...] = ('fast',) if fast_math else ()
+        self.context = ir.Context()
+        self.module = ir.Module(name, context=self.context)
+        self.irTypes: Dict[Type, ir.Type] = {}
+        self.memberIndex: Dict[object, Dict[str, int]] = {}
+        self.globalScope = SymbolTable(None, None)
+        self.methods: Dict[Tuple[Type, str], ir.Function] = {}  # (结构体类型, 方法名) -> 函数
+        self.constructors: Dict[Type, ir.Function] = {}  # 结构体类型 -> 只有 self 参数的构造函数
+        self.specFunctions: Dict[Specialization, ir.Function] = {}
+        self.strings: Dict[str, ir.GlobalVariable] = {}
+        self.externals: Dict[str, ir.Function] = {}
+        self.pending: List[Tuple[ast1.LambdaExp, ir.Function, Type, dict, dict]] = []
+        self.timings: Dict[str, float] = {}
+        # 正在生成的函数
+        self.function: Optional[ir.Function] = None
+        self.builder: Optional[ir.IRBuilder] = None
+        self.allocaBuilder: Optional[ir.IRBuilder] = None
+        self.retType: Optional[Type] = None
+        self.isMain = False
+        self.loops: List[Tuple[ir.Block, ir.Block]] = []  # (break 目标, continue 目标)
+        self.scope = self.globalScope
+        self.types: Dict[ast1.Node, Type] = analyzer.types
+        self.calls: Dict[ast1.FuncCallExp, Specialization] = analyzer.calls
+
+    ########################################################## 驱动
+    def run(self, root: ast1.Node):
+        """翻译 root，返回其值（取地址请求返回地址，语句返回 None）"""
+        stack: List[GeneratorType] = []
+        item: object = root
+        result = None
+        while True:
+            if item is not None:
+                if type(item) is Address:
+                    node, prefix = item.node, 'addr_'
+                else:
+                    node, prefix = item, 'lower_'
+                handler = type(self).lookup(type(node), prefix)
+                if handler is None:
+                    raise CodegenError(f'code generation for {type(node).__name__} is not supported '
+                                       f'(line {node.row})')
+                result = handler(self, node)
+                if type(result) is GeneratorType:
+                    stack.append(result)
+                    result = None
+            if not stack:
+                return result
+            try:
+                item = stack[-1].send(result)
+            except StopIteration as stop:
+                stack.pop()
+                item, result = None, stop.value
+
+    ########################################################## 类型
+    def type_of(self, node: ast1.Node) -> Type:
+        found = self.types.get(node)
+        if found is not None:
+            return found
+        # 常量折叠在语义分析之后进行，折叠出的字面量不在 types 中，其类型记在字面量上
+        if isinstance(node, ast1.LiteralPri):
+            return literal_type(node)
+        raise CodegenError(f'type of {type(node).__name__} at line {node.row} is unknown')
+
+    def ir_type(self, type: Type) -> ir.Type:
+        type = type.remove_const()
+        found = self.irTypes.get(type)
+        if found is not None:
+            return found
+        if type.idType in (IDType.AUTO, IDType.GENERIC) or type.is_generics():
+            raise CodegenError(f'type {type} is not instantiated')
+        ir_type = type.to_ir_type(self.context, self.ir_type)
+        self.irTypes[type] = ir_type
+        if type.idType == IDType.STRUCT and ir_type.is_opaque:
+            # 先登记再设置成员，成员中指向自身的引用可以直接取到这个类型
+            info = type.struct_info
+            bindings = {generic.generic_name: spec_type
+                        for generic, spec_type in zip(info.generics_type_list, type.generics_type_list)}
+            ir_type.set_body(*[self.ir_type(member.type.specialize(bindings)) for member in info.member_list])
+        return ir_type
+
+    def func_ir_type(self, func_type: Type, is_main: bool = False) -> ir.FunctionType:
+        func_ir_type = self.ir_type(func_type).pointee
+        if is_main:
+            return ir.FunctionType(INT32, func_ir_type.args)
+        return func_ir_type
+
+    def member_index(self, struct_type: Type, name: str) -> int:
+        info = struct_type.struct_info
+        index = self.memberIndex.get(info)
+        if index is None:
+            index = self.memberIndex[info] = {member.name: i for i, member in enumerate(info.member_list)}
+        if name not in index:
+            raise CodegenError(f'struct {struct_type.struct_name} has no member {name}')
+        return index[name]
+
+    def resolve(self, spec: ast1.TypeSpecifier) -> Type:
+        return self.analyzer.resolve(spec)
+
+    ########################################################## 值的转换
+    def truth(self, value: ir.Value, type: Type) -> ir.Value:
+        type = type.decay()
+        if type.idType != IDType.BASIC:
+            raise CodegenError(f'value of type {type} can not be used as a condition')
+        if type.basic_type == BasicType.BOOL:
+            return value
+        if type.basic_type == BasicType.INT:
+            return self.builder.icmp_signed('!=', value, ir.Constant(INT32, 0))
+        return self.builder.fcmp_unordered('!=', value, ir.Constant(value.type, 0.0))
+
+    def convert(self, value: ir.Value, source: Type, target: Type) -> ir.Value:
+        """按语义分析的隐式转换规则把 source 类型的值转换为 target 类型"""
+        source, target = source.decay(), target.decay()
+        if source is target or source.idType != IDType.BASIC or target.idType != IDType.BASIC:
+            return value
+        builder = self.builder
+        from_type, to_type = source.basic_type, target.basic_type
+        to_ir_type = self.ir_type(target)
+        if to_type == BasicType.BOOL:
+            return self.truth(value, source)
+        if from_type == BasicType.BOOL:
+            return builder.zext(value, to_ir_type) if to_type == BasicType.INT else builder.uitofp(value, to_ir_type)
+        if from_type == BasicType.INT:
+            return builder.sitofp(value, to_ir_type)
+        if to_type == BasicType.INT:
+            return builder.fptosi(value, to_ir_type)
+        if FLOAT_RANK[from_type] < FLOAT_RANK[to_type]:
+            return builder.fpext(value, to_ir_type)
+        return builder.fptrunc(value, to_ir_type)
+
+    def constant(self, value, source: Type, target: Type) -> ir.Constant:
+        """编译期常量的转换，用于全局变量的初始值"""
+        target = target.decay()
+        if target.idType != IDType.BASIC:
+            raise CodegenError(f'global of type {target} can not be initialized with a constant')
+        if target.basic_type == BasicType.BOOL:
+            value = bool(value)
+        elif target.basic_type == BasicType.INT:
+            value = int(value)
+        else:
+            value = float(value)
+        return ir.Constant(self.ir_type(target), value)
+
+    ########################################################## 函数框架
+    def alloca(self, ir_type: ir.Type, name: str = '') -> ir.AllocaInstr:
+        return self.allocaBuilder.alloca(ir_type, name=name)
+
+    def string(self, text: str) -> ir.Value:
+        variable = self.strings.get(text)
+        if variable is None:
+            data = bytearray(text.encode('utf8') + b'\0')
+            variable = ir.GlobalVariable(self.module, ir.ArrayType(ir.IntType(8), len(data)),
+                                         name=f'.str.{len(self.strings)}')
+            variable.linkage = 'private'
+            variable.global_constant = True
+            variable.initializer = ir.Constant(variable.type.pointee, data)
+            self.strings[text] = variable
+        return self.builder.gep(variable, [ir.Constant(INT32, 0), ir.Constant(INT32, 0)], inbounds=True)
+
+    def external(self, name: str, ret: ir.Type, args: Sequence[ir.Type], var_arg: bool = False) -> ir.Function:
+        function = self.externals.get(name)
+        if function is None:
+            function = ir.Function(self.module, ir.FunctionType(ret, args, var_arg=var_arg), name)
+            self.externals[name] = function
+        return function
+
+    def declare_function(self, name: str, func_type: Type, internal: bool = False,
+                         is_main: bool = False) -> ir.Function:
+        function = ir.Function(self.module, self.func_ir_type(func_type, is_main), name)
+        if internal:
+            function.linkage = 'internal'
+        return function
+
+    def lower_function(self, function: ir.Function, func_type: Type, params: Sequence[ast1.FuncParam],
+                       body: ast1.BlockStmt, parent: SymbolTable, types: dict, calls: dict,
+                       is_main: bool = False) -> None:
+        self.function, self.retType, self.isMain = function, func_type.func_ret_type, is_main
+        self.types, self.calls, self.loops = types, calls, []
+        entry = function.append_basic_block('entry')
+        start = function.append_basic_block('body')
+        self.allocaBuilder, self.builder = ir.IRBuilder(entry), ir.IRBuilder(start)
+        self.scope = SymbolTable(parent, func_type)
+        for param, param_type, arg in zip(params, func_type.param_types, function.args):
+            arg.name = param.ident
+            slot = self.alloca(arg.type, f'{param.ident}.addr')
+            self.builder.store(arg, slot)
+            self.scope.add_symbol(param.ident, param_type, slot)
+        self.run(body)
+        if not self.builder.block.is_terminated:
+            # 没有 return 就结束的函数返回零值
+            ret_ir_type = function.function_type.return_type
+            if isinstance(ret_ir_type, ir.VoidType):
+                self.builder.ret_void()
+            else:
+                self.builder.ret(ir.Constant(ret_ir_type, None))
+        self.allocaBuilder.branch(start)
+        self.scope = self.globalScope
+
+    ########################################################## 模块
+    def generate(self, root: ast1.CompUnit) -> ir.Module:
+        start = time.perf_counter()
+        bodies: List[tuple] = []
+        globals_init: List[Tuple[ast1.InitDecl, ir.GlobalVariable, Type]] = []
+        for decl in root.allDeclarationList:
+            if isinstance(decl, ast1.TemplateDecl):
+                continue  # 模板只生成实例
+            if isinstance(decl, ast1.VarDecl):
+                for init_decl in decl.initDeclList:
+                    self.declare_global(init_decl, globals_init)
+            elif isinstance(decl, ast1.FuncDecl):
+                symbol = self.globalScope.get_symbol_local(decl.ident)
+                if symbol is None:
+                    func_type = self.analyzer.globalSymtab.get_symbol(decl.ident).type.remove_const()
+                    function = self.declare_function(decl.ident, func_type)
+                    self.globalScope.add_symbol(decl.ident, func_type, function)
+            elif isinstance(decl, ast1.FuncDef):
+                self.declare_func_def(decl, bodies)
+            elif isinstance(decl, ast1.StructDecl):
+                self.declare_struct(decl, bodies)
+        for specialization in self.analyzer.specializations.values():
+            function = self.declare_function(specialization.name, specialization.funcType, internal=True)
+            self.specFunctions[specialization] = function
+            decl = specialization.template
+            bodies.append((function, specialization.funcType, decl.funcDecl.funcType.funcParamList, decl.blockStmt,
+                           self.globalScope, specialization.types, specialization.calls, False, specialization))
+        for struct_type, instances in self.analyzer.structInstances.items():
+            self.declare_struct_instance(struct_type, instances, bodies)
+        self.timings['declare'] = time.perf_counter() - start
+
+        lowered = time.perf_counter()
+        for function, func_type, params, body, parent, types, calls, is_main, specialization in bodies:
+            # 模板实例中的泛型类型说明符按实例的类型实参解析
+            self.analyzer.bindings = ({generic.generic_name: spec_type for generic, spec_type in
+                                       zip(self.analyzer.signatures[specialization.template].generics_type_list,
+                                           specialization.generics)}
+                                      if specialization is not None else {})
+            self.lower_function(function, func_type, params, body, parent, types, calls, is_main)
+            self.lower_pending()
+        self.analyzer.bindings = {}
+        if globals_init:
+            self.lower_globals_init(globals_init)
+        self.timings['lower'] = time.perf_counter() - lowered
+        return self.module
+
+    def declare_global(self, node: ast1.InitDecl, globals_init: list) -> None:
+        decl_type = self.type_of(node)
+        if decl_type.idType == IDType.REFERENCE:
+            raise CodegenError(f'global reference {node.ident} is not supported (line {node.row})')
+        variable = ir.GlobalVariable(self.module, self.ir_type(decl_type), node.ident)
+        if isinstance(node.initVal, ast1.LiteralPri):
+            variable.initializer = self.constant(node.initVal.value, self.type_of(node.initVal), decl_type)
+            variable.global_constant = node.isConst
+        else:
+            variable.initializer = ir.Constant(variable.value_type, None)
+            if node.initVal is not None:
+                globals_init.append((node, variable, decl_type))
+        self.globalScope.add_symbol(node.ident, decl_type, variable)
+
+    def declare_func_def(self, decl: ast1.FuncDef, bodies: list) -> None:
+        ident = decl.funcDecl.ident
+        func_type = self.analyzer.signatures[decl]
+        symbol = self.globalScope.get_symbol_local(ident)
+        is_main = ident == 'main'
+        if symbol is not None and isinstance(symbol.value, ir.Function):
+            # 先声明后定义：沿用声明时创建的函数
+            function = symbol.value
+        else:
+            function = self.declare_function(ident, func_type, is_main=is_main)
+            self.globalScope.add_symbol(ident, func_type, function)
+        bodies.append((function, func_type, decl.funcDecl.funcType.funcParamList, decl.blockStmt,
+                       self.globalScope, self.analyzer.types, self.analyzer.calls, is_main, None))
+
+    def struct_scope(self, struct_type: Type) -> SymbolTable:
+        scope = SymbolTable(self.globalScope, struct_type)
+        for member in struct_type.struct_info.member_list:
+            # 成员变量只能通过 self 访问，登记为不可访问以免被同名全局变量遮住
+            scope.add_symbol(member.name, member.type)
+        return scope
+
+    def declare_struct(self, decl: ast1.StructDecl, bodies: list) -> None:
+        """结构体的方法命名为 <结构体>.<方法>，构造函数为 <结构体>.<结构体>；方法体内可以直接调用同一结构体的其它方法"""
+        struct_type = self.analyzer.globalSymtab.get_type(decl.ident)
+        scope = self.struct_scope(struct_type)
+        for method in decl.memberFuncDefList:
+            func_def = method.funcDef
+            ident = func_def.funcDecl.ident
+            func_type = self.analyzer.signatures[func_def]
+            function = self.declare_function(f'{decl.ident}.{ident}', func_type)
+            self.methods[(struct_type, ident)] = function
+            scope.add_symbol(ident, func_type, function)
+            bodies.append((function, func_type, func_def.funcDecl.funcType.funcParamList, func_def.blockStmt,
+                           scope, self.analyzer.types, self.analyzer.calls, False, None))
+        for i, cons in enumerate(decl.consFuncDefList):
+            func_type = self.analyzer.signatures[cons]
+            name = f'{decl.ident}.{decl.ident}' + (f'.{i}' if i else '')
+            function = self.declare_function(name, func_type)
+            if len(func_type.param_types) == 1 and struct_type not in self.constructors:
+                self.constructors[struct_type] = function
+            bodies.append((function, func_type, cons.funcType.funcParamList, cons.blockStmt,
+                           scope, self.analyzer.types, self.analyzer.calls, False, None))
+
+    def declare_struct_instance(self, struct_type: Type, instances: List[Specialization], bodies: list) -> None:
+        """模板结构体的实例：方法与构造函数按实例的类型实参各生成一份，命名为 <实例>.<方法>，如 Box<INT>.get"""
+        scope = self.struct_scope(struct_type)
+        for i, specialization in enumerate(instances):
+            func_type = specialization.funcType
+            decl = specialization.template
+            if isinstance(decl, ast1.ConsFuncDef):
+                function = self.declare_function(specialization.name + (f'.{i}' if i else ''), func_type,
+                                                 internal=True)
+                if len(func_type.param_types) == 1 and struct_type not in self.constructors:
+                    self.constructors[struct_type] = function
+                params, body = decl.funcType.funcParamList, decl.blockStmt
+            else:
+                function = self.declare_function(specialization.name, func_type, internal=True)
+                self.methods[(struct_type, specialization.ident)] = function
+                scope.add_symbol(specialization.ident, func_type, function)
+                params, body = decl.funcDecl.funcType.funcParamList, decl.blockStmt
+            self.specFunctions[specialization] = function
+            bodies.append((function, func_type, params, body, scope, specialization.types, specialization.calls,
+                           False, specialization))
+
+    def lower_pending(self) -> None:
+        """函数体中的 lambda 在外层函数生成完之后再生成；lambda 不能捕获外层的局部变量"""
+        while self.pending:
+            node, function, func_type, types, calls = self.pending.pop()
+            self.lower_function(function, func_type, node.funcType.funcParamList, node.blockStmt,
+                                self.globalScope, types, calls)
+
+    def lower_globals_init(self, globals_init: list) -> None:
+        function = ir.Function(self.module, ir.FunctionType(ir.VoidType(), []), INIT_FUNCTION)
+        function.linkage = 'internal'
+        self.function, self.retType, self.isMain = function, Type.basic(BasicType.VOID), False
+        self.types, self.calls, self.loops = self.analyzer.types, self.analyzer.calls, []
+        entry = function.append_basic_block('entry')
+        start = function.append_basic_block('body')
+        self.allocaBuilder, self.builder = ir.IRBuilder(entry), ir.IRBuilder(start)
+        self.scope = self.globalScope
+        for node, variable, decl_type in globals_init:
+            value = self.run(node.initVal)
+            self.builder.store(self.convert(value, self.type_of(node.initVal), decl_type), variable)
+        self.builder.ret_void()
+        self.allocaBuilder.branch(start)
+        self.lower_pending()
+        # { 优先级, 函数, 关联数据 }，优先级 65535 为默认
+        ctor_type = ir.LiteralStructType([INT32, function.type, CHAR_PTR])
+        ctors = ir.GlobalVariable(self.module, ir.ArrayType(ctor_type, 1), 'llvm.global_ctors')
+        ctors.linkage = 'appending'
+        ctors.initializer = ir.Constant(ctors.value_type, [
+            ir.Constant(ctor_type, [ir.Constant(INT32, 65535), function, ir.Constant(CHAR_PTR, None)])])
+
+    ########################################################## 语句
+    def lower_BlockStmt(self, node: ast1.BlockStmt):
+        self.scope = SymbolTable(self.scope, None)
+        for stmt in node.stmtList:
+            if self.builder.block.is_terminated:
+                break  # return/break/continue 之后的语句不可达
+            yield stmt
+        self.scope = self.scope.parentSymtab
+
+    def lower_DeclStmt(self, node: ast1.DeclStmt):
+        yield node.varDecl
+
+    def lower_VarDecl(self, node: ast1.VarDecl):
+        for init_decl in node.initDeclList:
+            yield init_decl
+
+    def lower_InitDecl(self, node: ast1.InitDecl):
+        decl_type = self.type_of(node)
+        slot = self.alloca(self.ir_type(decl_type), node.ident)
+        if node.initVal is None:
+            self.builder.store(ir.Constant(slot.type.pointee, None), slot)
+            if decl_type.decay().idType == IDType.STRUCT:
+                constructor = self.constructors.get(decl_type.decay())
+                if constructor is not None:
+                    self.builder.call(constructor, [slot])
+        elif decl_type.idType == IDType.REFERENCE:
+            self.builder.store((yield Address(node.initVal)), slot)
+        else:
+            value = yield node.initVal
+            self.builder.store(self.convert(value, self.type_of(node.initVal), decl_type), slot)
+        self.scope.add_symbol(node.ident, decl_type, slot)
+
+    def lower_ExpStmt(self, node: ast1.ExpStmt):
+        if node.exp is not None:
+            yield node.exp
+
+    def lower_IfStmt(self, node: ast1.IfStmt):
+        cond = self.truth((yield node.cond), self.type_of(node.cond))
+        function = self.function
+        true_block = function.append_basic_block('if.then')
+        false_block = function.append_basic_block('if.else') if node.falseStmt is not None else None
+        merge_block = function.append_basic_block('if.end')
+        self.builder.cbranch(cond, true_block, false_block or merge_block)
+        self.builder.position_at_end(true_block)
+        yield node.trueStmt
+        if not self.builder.block.is_terminated:
+            self.builder.branch(merge_block)
+        if false_block is not None:
+            self.builder.position_at_end(false_block)
+            yield node.falseStmt
+            if not self.builder.block.is_terminated:
+                self.builder.branch(merge_block)
+        self.builder.position_at_end(merge_block)
+
+    def lower_WhileStmt(self, node: ast1.WhileStmt):
+        function = self.function
+        cond_block = function.append_basic_block('while.cond')
+        body_block = function.append_basic_block('while.body')
+        end_block = function.append_basic_block('while.end')
+        self.builder.branch(cond_block)
+        self.builder.position_at_end(cond_block)
+        cond = self.truth((yield node.cond), self.type_of(node.cond))
+        self.builder.cbranch(cond, body_block, end_block)
+        self.builder.position_at_end(body_block)
+        self.loops.append((end_block, cond_block))
+        yield node.loopStmt
+        self.loops.pop()
+        if not self.builder.block.is_terminated:
+            self.builder.branch(cond_block)
+        self.builder.position_at_end(end_block)
+
+    def lower_ForStmt(self, node: ast1.ForStmt):
+        self.scope = SymbolTable(self.scope, None)
+        if node.init is not None:
+            yield node.init
+        function = self.function
+        cond_block = function.append_basic_block('for.cond')
+        body_block = function.append_basic_block('for.body')
+        step_block = function.append_basic_block('for.step')
+        end_block = function.append_basic_block('for.end')
+        self.builder.branch(cond_block)
+        self.builder.position_at_end(cond_block)
+        if node.cond is not None:
+            cond = self.truth((yield node.cond), self.type_of(node.cond))
+            self.builder.cbranch(cond, body_block, end_block)
+        else:
+            self.builder.branch(body_block)
+        self.builder.position_at_end(body_block)
+        self.loops.append((end_block, step_block))
+        yield node.loopStmt
+        self.loops.pop()
+        if not self.builder.block.is_terminated:
+            self.builder.branch(step_block)
+        self.builder.position_at_end(step_block)
+        if node.after is not None:
+            yield node.after
+        self.builder.branch(cond_block)
+        self.builder.position_at_end(end_block)
+        self.scope = self.scope.parentSymtab
+
+    def lower_BreakStmt(self, node: ast1.BreakStmt) -> None:
+        self.builder.branch(self.loops[-1][0])
+
+    def lower_ContinueStmt(self, node: ast1.ContinueStmt) -> None:
+        self.builder.branch(self.loops[-1][1])
+
+    def lower_ReturnStmt(self, node: ast1.ReturnStmt):
+        ret_type = self.retType
+        if ret_type.idType == IDType.REFERENCE:
+            raise CodegenError(f'returning a reference is not supported (line {node.row})')
+        if node.exp is None:
+            if self.isMain:
+                self.builder.ret(ir.Constant(INT32, 0))
+            else:
+                self.builder.ret_void()
+            return
+        value = yield node.exp
+        if self.isMain:
+            self.builder.ret(self.convert(value, self.type_of(node.exp), Type.basic(BasicType.INT)))
+        elif ret_type.decay().basic_type == BasicType.VOID:
+            self.builder.ret_void()
+        else:
+            self.builder.ret(self.convert(value, self.type_of(node.exp), ret_type))
+
+    ########################################################## 表达式：取地址
+    def addr_Expression(self, node: ast1.Expression):
+        # 右值需要地址时（如取函数返回的结构体的成员）先存入临时变量
+        value = yield node
+        slot = self.alloca(value.type)
+        self.builder.store(value, slot)
+        return slot
+
+    def lookup_symbol(self, node: ast1.IdentPri):
+        symbol = self.scope.get_symbol(node.ident)
+        if symbol is None or symbol.value is None:
+            raise CodegenError(f'{node.ident} is not accessible here (line {node.row}); '
+                               f'lambdas can not capture local variables')
+        return symbol
+
+    def addr_IdentPri(self, node: ast1.IdentPri) -> ir.Value:
+        symbol = self.lookup_symbol(node)
+        if isinstance(symbol.value, ir.Function):
+            raise CodegenError(f'function {node.ident} is not an lvalue (line {node.row})')
+        if symbol.type.idType == IDType.REFERENCE:
+            return self.builder.load(symbol.value)
+        return symbol.value
+
+    def addr_ExpPri(self, node: ast1.ExpPri):
+        return (yield Address(node.exp))
+
+    def addr_ReferExp(self, node: ast1.ReferExp):
+        return (yield Address(node.referObjectExp))
+
+    def addr_ArrayIndexExp(self, node: ast1.ArrayIndexExp):
+        array_type = self.type_of(node.arrayExp).decay()
+        if array_type.idType != IDType.ARRAY:
+            raise CodegenError(f'subscripted value of type {array_type} is not an array (line {node.row})')
+        if array_type.size is not None:
+            base = yield Address(node.arrayExp)
+            index = yield node.indexExp
+            index = self.convert(index, self.type_of(node.indexExp), Type.basic(BasicType.INT))
+            return self.builder.gep(base, [ir.Constant(INT32, 0), index], inbounds=True)
+        # 未指定长度的数组是指向元素的指针
+        base = yield node.arrayExp
+        index = yield node.indexExp
+        index = self.convert(index, self.type_of(node.indexExp), Type.basic(BasicType.INT))
+        return self.builder.gep(base, [index], inbounds=True)
+
+    def addr_MemberExp(self, node: ast1.MemberExp):
+        struct_type = self.type_of(node.objectExp).decay()
+        base = yield Address(node.objectExp)
+        self.ir_type(struct_type)
+        index = self.member_index(struct_type, node.MemberID)
+        address = self.builder.gep(base, [ir.Constant(INT32, 0), ir.Constant(INT32, index)], inbounds=True)
+        if self.type_of(node).idType == IDType.REFERENCE:
+            return self.builder.load(address)
+        return address
+
+    ########################################################## 表达式：取值
+    def lower_LiteralPri(self, node: ast1.LiteralPri) -> ir.Value:
+        value_type = self.type_of(node)
+        if value_type.basic_type == BasicType.STRING:
+            raise CodegenError(f'{node.kind} literal is not supported (line {node.row})')
+        return ir.Constant(self.ir_type(value_type), node.value)
+
+    def lower_IdentPri(self, node: ast1.IdentPri):
+        symbol = self.lookup_symbol(node)
+        if isinstance(symbol.value, ir.Function):
+            return symbol.value
+        return self.builder.load((yield Address(node)))
+
+    def lower_ExpPri(self, node: ast1.ExpPri):
+        return (yield node.exp)
+
+    def lower_ArrayIndexExp(self, node: ast1.ArrayIndexExp):
+        return self.builder.load((yield Address(node)))
+
+    def lower_MemberExp(self, node: ast1.MemberExp):
+        if node in self.analyzer.bound:
+            raise CodegenError(f'method {node.MemberID} can only be called (line {node.row})')
+        return self.builder.load((yield Address(node)))
+
+    def lower_ReferExp(self, node: ast1.ReferExp):
+        return (yield Address(node.referObjectExp))
+
+    def lower_CastExp(self, node: ast1.CastExp):
+        value = yield node.castedExp
+        return self.convert(value, self.type_of(node.castedExp), self.type_of(node))
+
+    def lower_UnaryExp(self, node: ast1.UnaryExp):
+        value = yield node.exp
+        source = self.type_of(node.exp)
+        builder = self.builder
+        if node.unaryOp == UnaryOp.LOGICNOT:
+            return builder.not_(self.truth(value, source))
+        result_type = self.type_of(node).decay()
+        value = self.convert(value, source, result_type)
+        if node.unaryOp == UnaryOp.MINUS:
+            if result_type.basic_type == BasicType.INT:
+                return builder.neg(value)
+            return builder.fneg(value, flags=self.fpFlags)
+        if node.unaryOp == UnaryOp.NOT:
+            return builder.not_(value)
+        return value
+
+    def lower_BinaryExp(self, node: ast1.BinaryExp):
+        op = node.binaryOp
+        builder = self.builder
+        if op in (BinaryOp.LOGICAND, BinaryOp.LOGICOR):
+            # 短路求值：左侧已决定结果时跳过右侧
+            left = self.truth((yield node.leftExp), self.type_of(node.leftExp))
+            left_block = builder.block
+            right_block = self.function.append_basic_block('logic.rhs')
+            merge_block = self.function.append_basic_block('logic.end')
+            if op == BinaryOp.LOGICAND:
+                builder.cbranch(left, right_block, merge_block)
+            else:
+                builder.cbranch(left, merge_block, right_block)
+            builder.position_at_end(right_block)
+            right = self.truth((yield node.rightExp), self.type_of(node.rightExp))
+            right_block = builder.block
+            builder.branch(merge_block)
+            builder.position_at_end(merge_block)
+            phi = builder.phi(BOOL1)
+            phi.add_incoming(ir.Constant(BOOL1, op == BinaryOp.LOGICOR), left_block)
+            phi.add_incoming(right, right_block)
+            return phi
+
+        left = yield node.leftExp
+        right = yield node.rightExp
+        left_type, right_type = self.type_of(node.leftExp).decay(), self.type_of(node.rightExp).decay()
+        if op in COMPARE_OPS:
+            common = self.analyzer.promote(left_type, right_type)
+            left, right = self.convert(left, left_type, common), self.convert(right, right_type, common)
+            if common.basic_type == BasicType.INT:
+                return builder.icmp_signed(COMPARE_OPS[op], left, right)
+            if op == BinaryOp.NEQ:
+                return builder.fcmp_unordered('!=', left, right, flags=self.fpFlags)
+            return builder.fcmp_ordered(COMPARE_OPS[op], left, right, flags=self.fpFlags)
+        result_type = self.type_of(node).decay()
+        left, right = self.convert(left, left_type, result_type), self.convert(right, right_type, result_type)
+        if result_type.basic_type == BasicType.INT:
+            return getattr(builder, INT_OPS[op])(left, right)
+        instruction = getattr(builder, FLOAT_OPS[op])(left, right)
+        instruction.flags.extend(self.fpFlags)  # IRBuilder 的二元浮点运算不接受 flags 参数
+        return instruction
+
+    def lower_AssignExp(self, node: ast1.AssignExp):
+        address = yield Address(node.LVal)
+        value = yield node.exp
+        value = self.convert(value, self.type_of(node.exp), self.type_of(node.LVal))
+        self.builder.store(value, address)
+        return value
+
+    def argument(self, param_type: Type, arg: ast1.Expression):
+        """按形参类型传递实参：引用传地址，未指定长度的数组传首元素地址，其余按值传递并做隐式转换"""
+        if param_type.idType == IDType.REFERENCE:
+            return (yield Address(arg))
+        param_type = param_type.decay()
+        if param_type.idType == IDType.ARRAY and param_type.size is None:
+            arg_type = self.type_of(arg).decay()
+            if arg_type.idType == IDType.ARRAY and arg_type.size is not None:
+                address = yield Address(arg)
+                return self.builder.gep(address, [ir.Constant(INT32, 0), ir.Constant(INT32, 0)], inbounds=True)
+        value = yield arg
+        return self.convert(value, self.type_of(arg), param_type)
+
+    def lower_FuncCallExp(self, node: ast1.FuncCallExp):
+        func_exp = node.funcExp
+        callee_type = self.type_of(func_exp).decay()
+        specialization = self.calls.get(node)
+        args: List[ir.Value] = []
+        if specialization is not None:
+            function = self.specFunctions[specialization]
+            param_types = specialization.funcType.param_types
+        elif func_exp in self.analyzer.bound:
+            # 成员函数：对象的地址作为 self 参数
+            struct_type = self.type_of(func_exp.objectExp).decay()
+            function = self.methods.get((struct_type, func_exp.MemberID))
+            if function is None:
+                raise CodegenError(f'method {func_exp.MemberID} of {struct_type} is not generated (line {node.row})')
+            args.append((yield Address(func_exp.objectExp)))
+            param_types = callee_type.param_types[1:]
+        elif callee_type.is_generics():
+            raise CodegenError(f'call of uninstantiated template at line {node.row}')
+        else:
+            function = yield func_exp
+            param_types = callee_type.param_types
+        for param_type, arg in zip(param_types, node.paramExpList):
+            args.append((yield from self.argument(param_type, arg)))
+        return self.builder.call(function, args)
+
+    def lower_LambdaExp(self, node: ast1.LambdaExp) -> ir.Function:
+        func_type = self.type_of(node)
+        function = self.declare_function(f'{self.function.name}.lambda.{len(self.pending)}.{node.row}',
+                                         func_type, internal=True)
+        self.pending.append((node, function, func_type, self.types, self.calls))
+        return function
+
+    def lower_IOExp(self, node: ast1.IOExp):
+        io_type = self.resolve(node.typeSpec).decay()
+        if io_type.idType != IDType.BASIC or io_type.basic_type not in PRINT_FORMATS:
+            raise CodegenError(f'can not {node.ioType.name.lower()} values of type {io_type} (line {node.row})')
+        builder = self.builder
+        if node.ioType == IOType.PRINT:
+            value = self.convert((yield node.outExp), self.type_of(node.outExp), io_type)
+            if io_type.basic_type == BasicType.BOOL:
+                value = builder.zext(value, INT32)
+            elif io_type.basic_type != BasicType.INT:
+                value = builder.fpext(value, ir.DoubleType()) if io_type.basic_type != BasicType.F64 else value
+            printf = self.external('printf', INT32, [CHAR_PTR], var_arg=True)
+            builder.call(printf, [self.string(PRINT_FORMATS[io_type.basic_type]), value])
+            return None
+        symbol = self.scope.get_symbol(node.inIdent)
+        if symbol is None or symbol.value is None or isinstance(symbol.value, ir.Function):
+            raise CodegenError(f'can not scan into {node.inIdent} (line {node.row})')
+        fmt, read_basic_type = SCAN_FORMATS[io_type.basic_type]
+        read_type = Type.basic(read_basic_type)
+        slot = self.alloca(self.ir_type(read_type))
+        scanf = self.external('scanf', INT32, [CHAR_PTR], var_arg=True)
+        builder.call(scanf, [self.string(fmt), slot])
+        value = self.convert(builder.load(slot), read_type, io_type)
+        target = builder.load(symbol.value) if symbol.type.idType == IDType.REFERENCE else symbol.value
+        builder.store(self.convert(value, io_type, symbol.type), target)
+        return value
+
+
+def generate(root: ast1.CompUnit, analyzer: SemanticAnalyzer, name: str = 'module',
+             fast_math: bool = False) -> CodeGenerator:
+    """为已通过语义分析（可以已做常量折叠）的 root 生成 IR，生成器的 module 即结果"""
+    generator = CodeGenerator(analyzer, name, fast_math)
+    try:
+        generator.generate(root)
+    except (TypeError, ValueError) as err:
+        # llvmlite 构造指令时检查操作数类型，出错说明生成的 IR 不一致，作为编译错误报告而不是抛出异常栈
+        raise CodegenError(f'invalid IR: {err}') from err
+    return generator
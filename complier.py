@@ -1,31 +1,349 @@
+from __future__ import annotations
 import argparse
+import functools
+import glob
+import mmap
+import os
+import threading
+import time
 from sys import stdout
-from error import ParseError, SemanticError
-from lexer import create_lexer
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, TextIO, Union
+from cache import ObjectCache, object_cache
+from error import CodegenError, ParseError, SemanticError
+from lexer import StreamLexer, create_bytes_lexer, create_lexer, init_lexer_context, input_bytes
 from parser import create_parser
 import ast1
+import constfold
+import printer
+import semantic
+
+if TYPE_CHECKING:
+    from aot import TargetOptions
+
+
+class CompileResult(object):
+    def __init__(self, source_file: str, error: Optional[str], elapsed: float, output: Optional[str] = None,
+                 stages: Optional[Dict[str, float]] = None, exit_code: Optional[int] = None) -> None:
+        self.source_file = source_file
+        self.error = error
+        self.elapsed = elapsed
+        self.output = output
+        self.stages = stages or {}  # 各阶段耗时，按执行顺序
+        self.exit_code = exit_code  # --jit 运行 main 的返回值
+        self.report: Optional[str] = None  # --time-passes 的优化流水线报告
+
+    def format_timing(self) -> str:
+        stages = ', '.join(f'{name} {elapsed * 1000:.1f}ms' for name, elapsed in self.stages.items())
+        return f'{self.source_file}: {self.elapsed:.4f}s{f" ({stages})" if stages else ""}'
+
+
+# 每个进程（线程）只构建一次 lexer/parser，之后的文件复用
+_local = threading.local()
+
+
+def init_worker(optimize=True):
+    _local.optimize = optimize
+    _local.lexer = create_lexer(optimize=optimize)
+    _local.parser = create_parser(optimize=optimize)
+
+
+def parse_source(code_str: str) -> ast1.CompUnit:
+    if getattr(_local, 'parser', None) is None:
+        init_worker()
+    init_lexer_context(_local.lexer)
+    return _local.parser.parse(code_str, lexer=_local.lexer)
+
+
+def parse_stream(source: Union[TextIO, Iterable[str]]) -> ast1.CompUnit:
+    """边读边解析，源码不会整体读入内存"""
+    if getattr(_local, 'parser', None) is None:
+        init_worker()
+    init_lexer_context(_local.lexer)
+    return _local.parser.parse(lexer=StreamLexer(source, _local.lexer))
+
+
+def parse_mapped(source_file: str) -> ast1.CompUnit:
+    """把源文件 mmap 到内存，lexer 直接在映射的字节上匹配，不把整个文件读成 str"""
+    if getattr(_local, 'parser', None) is None:
+        init_worker()
+    if getattr(_local, 'bytes_lexer', None) is None:
+        _local.bytes_lexer = create_bytes_lexer(optimize=_local.optimize)
+    lexer = _local.bytes_lexer
+    init_lexer_context(lexer)
+    with open(source_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return parse_source('')
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            input_bytes(lexer, data)
+            try:
+                return _local.parser.parse(lexer=lexer)
+            finally:
+                lexer.lexdata = lexer.lexmatch = None
+
+
+def compile_file(source_file: str, output_dir: Optional[str] = None, keep_output: bool = False,
+                 stream: bool = False, mapped: bool = False, out: Optional[TextIO] = None,
+                 fold: bool = True, check: bool = True, emit_llvm: bool = False,
+                 run_jit: bool = False, jit_cache: Optional[ObjectCache] = None, emit_obj: bool = False,
+                 target: Optional[TargetOptions] = None) -> CompileResult:
+    """emit_llvm 时输出 LLVM IR（<name>.ll）而不是 AST；run_jit 时在进程内编译并运行 main；
+    emit_obj 时按 target 生成目标文件 <name>.o，没有 output_dir 时写到当前目录。
+    生成代码需要语义分析的结果，这几种模式总会做语义检查"""
+    generate = emit_llvm or run_jit or emit_obj
+    stages: Dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        if mapped:
+            ast_root = parse_mapped(source_file)
+        else:
+            with open(source_file, 'r', encoding='utf8') as f:
+                ast_root = parse_stream(f) if stream else parse_source(f.read())
+        stages['parse'] = time.perf_counter() - start
+        if check or generate:
+            analyzer = semantic.analyze(ast_root)
+            stages.update(analyzer.timings)
+    except (ParseError, SemanticError, OSError) as err:
+        return CompileResult(source_file, str(err), time.perf_counter() - start, stages=stages)
+    if fold:
+        fold_start = time.perf_counter()
+        constfold.fold_constants(ast_root)
+        stages['fold'] = time.perf_counter() - fold_start
+    if generate:
+        # 代码生成只在需要时导入，只输出 AST 时不付出导入 llvmlite 各模块的开销
+        import codegen
+        codegen_start = time.perf_counter()
+        try:
+            fast_math = target is not None and target.pipeline.fast_math
+            module = codegen.generate(ast_root, analyzer, os.path.basename(source_file), fast_math).module
+        except CodegenError as err:
+            return CompileResult(source_file, str(err), time.perf_counter() - start, stages=stages)
+        stages['codegen'] = time.perf_counter() - codegen_start
+        if run_jit:
+            return jit_run(source_file, module, start, stages, jit_cache, target)
+        if emit_obj:
+            return emit_object(source_file, module, output_dir, start, stages, target)
+        print_start = time.perf_counter()
+        text = str(module)
+        if out is not None:
+            out.write(text)
+        if output_dir:
+            with open(os.path.join(output_dir, os.path.basename(source_file) + '.ll'), 'w', encoding='utf8') as f:
+                f.write(text)
+        stages['print'] = time.perf_counter() - print_start
+        return CompileResult(source_file, None, time.perf_counter() - start, text if keep_output else None, stages)
+
+    # AST 直接流式写出，不在内存中拼出完整的字符串
+    print_start = time.perf_counter()
+    if out is not None:
+        printer.dump(ast_root, out)
+    if output_dir:
+        with open(os.path.join(output_dir, os.path.basename(source_file) + '.ast'), 'w', encoding='utf8') as f:
+            printer.dump(ast_root, f)
+    output = printer.dumps(ast_root) if keep_output else None
+    stages['print'] = time.perf_counter() - print_start
+    return CompileResult(source_file, None, time.perf_counter() - start, output, stages)
+
+
+def object_path(source_file: str, output_dir: Optional[str]) -> str:
+    return os.path.join(output_dir or '.', os.path.basename(source_file) + '.o')
+
+
+def emit_object(source_file: str, module, output_dir: Optional[str], start: float, stages: Dict[str, float],
+                target: Optional[TargetOptions]) -> CompileResult:
+    # llvmlite.binding 要加载 LLVM 共享库，只在生成机器码时才导入
+    import aot
+    target = target or aot.TargetOptions()
+    emit_start = time.perf_counter()
+    path = object_path(source_file, output_dir)
+    try:
+        report = aot.write_object(module, path, target)
+    except (CodegenError, OSError) as err:
+        return CompileResult(source_file, str(err), time.perf_counter() - start, stages=stages)
+    stages['optimize'] = report.elapsed
+    stages['emit'] = time.perf_counter() - emit_start - report.elapsed
+    result = CompileResult(source_file, None, time.perf_counter() - start, path, stages)
+    if target.pipeline.time_passes:
+        result.report = report.format()
+    return result
+
+
+def jit_run(source_file: str, module, start: float, stages: Dict[str, float],
+            jit_cache: Optional[ObjectCache], target: Optional[TargetOptions]) -> CompileResult:
+    # llvmlite.binding 要加载 LLVM 共享库，只在 --jit 时才导入
+    import jit
+    jit_start = time.perf_counter()
+    try:
+        if target is None:
+            jit_module = jit.compile_module(module, cache=jit_cache)
+        else:
+            jit_module = jit.compile_module(module, target.pipeline, jit_cache, target.cpu, target.features)
+        if jit_module.report is not None:
+            stages['optimize'] = jit_module.report.elapsed
+        stages['jit'] = time.perf_counter() - jit_start - stages.get('optimize', 0.0)
+        run_start = time.perf_counter()
+        exit_code = jit_module.run_main()
+    except CodegenError as err:
+        return CompileResult(source_file, str(err), time.perf_counter() - start, stages=stages)
+    stages['run'] = time.perf_counter() - run_start
+    result = CompileResult(source_file, None, time.perf_counter() - start, stages=stages, exit_code=exit_code)
+    if target is not None and target.pipeline.time_passes:
+        result.report = jit_module.report.format() if jit_module.report is not None else \
+            'pipeline skipped: machine code loaded from the jit cache'
+    return result
+
+
+def expand_sources(patterns: List[str]) -> List[str]:
+    source_files = []
+    for pattern in patterns:
+        if glob.has_magic(pattern):
+            source_files.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            source_files.append(pattern)
+    return source_files
+
+
+def compile_all(source_files: List[str], jobs: int, output_dir: Optional[str] = None,
+                optimize: bool = True, stream: bool = False, mapped: bool = False,
+                fold: bool = True, check: bool = True, emit_llvm: bool = False, emit_obj: bool = False,
+                target: Optional[TargetOptions] = None) -> List[CompileResult]:
+    compile_one = functools.partial(compile_file, output_dir=output_dir, stream=stream, mapped=mapped,
+                                    fold=fold, check=check, emit_llvm=emit_llvm, emit_obj=emit_obj, target=target)
+    if jobs <= 1 or len(source_files) <= 1:
+        init_worker(optimize)
+        return [compile_one(source_file) for source_file in source_files]
+    # 进程池只在批量编译时才导入，单文件编译不付出 multiprocessing 的导入开销
+    from concurrent.futures import ProcessPoolExecutor
+    chunksize = max(1, len(source_files) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(optimize,)) as executor:
+        return list(executor.map(compile_one, source_files, chunksize=chunksize))
 
 
 def run():
-    # arg_parser = argparse.ArgumentParser()
-    # arg_parser.add_argument("source_file", type=str)
-    # args = arg_parser.parse_args()
+    arg_parser = argparse.ArgumentParser()
+    arg_parser.add_argument("source_files", type=str, nargs='+', help="source files or glob patterns")
+    arg_parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1)
+    arg_parser.add_argument("-o", "--output-dir", type=str, default=None, help="write <name>.ast (<name>.ll, <name>.o) for each source")
+    arg_parser.add_argument("--timings", action="store_true", help="print per-file compile time")
+    arg_parser.add_argument("--no-table-cache", action="store_true",
+                            help="build lexer/parser tables through PLY reflection instead of the table cache")
+    arg_parser.add_argument("--stream", action="store_true",
+                            help="lex sources incrementally instead of reading whole files into memory")
+    arg_parser.add_argument("--mmap", action="store_true",
+                            help="memory-map sources and lex the mapped bytes directly")
+    arg_parser.add_argument("--no-fold", action="store_true", help="keep constant expressions unfolded in the AST")
+    arg_parser.add_argument("--no-check", action="store_true", help="skip semantic analysis")
+    arg_parser.add_argument("--emit-llvm", action="store_true", help="output LLVM IR (<name>.ll) instead of the AST")
+    arg_parser.add_argument("--jit", action="store_true",
+                            help="compile a single source in-process with MCJIT and run its main")
+    arg_parser.add_argument("--no-jit-cache", action="store_true", help="do not reuse machine code cached on disk")
+    arg_parser.add_argument("--jit-cache-size", type=int, default=64, metavar="MB",
+                            help="evict least recently used cached objects above this size")
+    arg_parser.add_argument("-c", "--emit-obj", action="store_true",
+                            help="compile each source to a native object file <name>.o")
+    arg_parser.add_argument("--shared", type=str, default=None, metavar="PATH",
+                            help="compile the sources to objects and link them into a shared library; "
+                                 "the objects are kept only with -o or -c")
+    arg_parser.add_argument("-O", dest="opt_level", type=int, choices=range(4), default=2,
+                            help="LLVM optimization level for --jit and object output")
+    arg_parser.add_argument("--loop-vectorize", action=argparse.BooleanOptionalAction, default=None,
+                            help="run the loop vectorizer (default: on at -O2 and above)")
+    arg_parser.add_argument("--slp-vectorize", action=argparse.BooleanOptionalAction, default=None,
+                            help="run the SLP vectorizer (default: on at -O2 and above)")
+    arg_parser.add_argument("--inline-threshold", type=int, default=None, metavar="N",
+                            help="inlining cost threshold (default: the one of the -O level)")
+    arg_parser.add_argument("--fast-math", action="store_true",
+                            help="allow reassociation and ignore NaN/Inf/signed zeros in float arithmetic")
+    arg_parser.add_argument("--time-passes", action="store_true",
+                            help="report time per optimization pass, and IR size before/after the whole pipeline "
+                                 "(IR size is not tracked per pass)")
+    arg_parser.add_argument("--mcpu", type=str, default="", help="target CPU, 'native' for the host CPU")
+    arg_parser.add_argument("--mattr", type=str, default="", help="target features, e.g. +avx2,-fma")
+    arg_parser.add_argument("--target", type=str, default=None, metavar="TRIPLE",
+                            help="target triple for object output (default: host)")
+    args = arg_parser.parse_args()
+    optimize = not args.no_table_cache
+
+    source_files = expand_sources(args.source_files)
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+    emit_obj = args.emit_obj or args.shared is not None
+    target = None
+    if args.jit or emit_obj or args.emit_llvm:
+        from aot import TargetOptions
+        from pipeline import PipelineOptions
+        pipeline = PipelineOptions(args.opt_level, args.loop_vectorize, args.slp_vectorize, args.inline_threshold,
+                                   args.fast_math, args.time_passes)
+        target = TargetOptions(pipeline, args.mcpu, args.mattr, args.target)
 
-    # with open(args.source_file, 'r', encoding='utf8') as f:
+    if args.jit:
+        if len(source_files) != 1:
+            arg_parser.error('--jit runs exactly one source file')
+        if args.target:
+            arg_parser.error('--target can not be used with --jit, JIT code runs on the host')
+        init_worker(optimize)
+        jit_cache = None if args.no_jit_cache else object_cache(args.jit_cache_size << 20)
+        result = compile_file(source_files[0], stream=args.stream, mapped=args.mmap, fold=not args.no_fold,
+                              run_jit=True, jit_cache=jit_cache, target=target)
+        if result.error:
+            stdout.write(f'{result.error}\n')
+        if result.report:
+            stdout.write(f'{result.report}\n')
+        if args.timings:
+            stdout.write(f'{result.format_timing()}\n')
+            if jit_cache is not None:
+                stdout.write(f'jit cache: {jit_cache.stats()}\n')
+        raise SystemExit(1 if result.error else result.exit_code)
 
-    with open('test/variable', 'r', encoding='utf8') as f:
-        code_str = f.read()
+    # 单文件且不输出到目录时保持原来的行为：直接打印 AST
+    if len(source_files) == 1 and not args.output_dir and not emit_obj:
+        init_worker(optimize)
+        result = compile_file(source_files[0], stream=args.stream, mapped=args.mmap, out=stdout,
+                              fold=not args.no_fold, check=not args.no_check, emit_llvm=args.emit_llvm,
+                              target=target)
+        if result.error:
+            stdout.write(result.error)
+        if args.timings:
+            stdout.write(f'\n{result.format_timing()}\n')
+        raise SystemExit(1 if result.error else 0)
 
-    lexer = create_lexer()
-    parser = create_parser()
+    start = time.perf_counter()
+    object_dir = args.output_dir
+    temp_dir = None
+    if args.shared is not None and not args.output_dir and not args.emit_obj:
+        # 只要共享库时目标文件写到临时目录，链接后删除，不在当前目录留下 .o 文件
+        import tempfile
+        temp_dir = tempfile.TemporaryDirectory(prefix='matrix-only-')
+        object_dir = temp_dir.name
     try:
-        ast_root = parser.parse(code_str)
-        stdout.write(str(ast_root))
-    except ParseError as err:
-        error_message = str(err)
-        stdout.write(str(error_message))
+        results = compile_all(source_files, args.jobs, object_dir, optimize, args.stream, args.mmap,
+                              not args.no_fold, not args.no_check, args.emit_llvm, emit_obj, target)
+        failed = [result for result in results if result.error]
+        link_error = None
+        if args.shared is not None and not failed:
+            import aot
+            try:
+                aot.link_shared([result.output for result in results], args.shared)
+            except CodegenError as err:
+                link_error = str(err)
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+    elapsed = time.perf_counter() - start
+
+    for result in results:
+        if result.report:
+            stdout.write(f'{result.source_file}: {result.report}\n')
+    if args.timings:
+        for result in results:
+            stdout.write(f'{result.format_timing()}{" (failed)" if result.error else ""}\n')
+    for result in failed:
+        stdout.write(f'{result.source_file}: {result.error}\n')
+    stdout.write(f'{len(results) - len(failed)} succeeded, {len(failed)} failed, '
+                 f'{len(results)} files in {elapsed:.3f}s\n')
+    if link_error:
+        stdout.write(f'{link_error}\n')
+    raise SystemExit(1 if failed or link_error else 0)
 
 
 if __name__ == "__main__":
     run()
-
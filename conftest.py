@@ -0,0 +1,26 @@
+import io
+import sys
+import pytest
+import complier
+
+
+@pytest.fixture(autouse=True, scope='session')
+def cache_root(tmp_path_factory):
+    """PLY 表与 JIT 目标代码缓存写到临时目录，测试不读写用户的缓存"""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setenv('MATRIX_ONLY_CACHE', str(tmp_path_factory.mktemp('cache')))
+        yield
+
+
+@pytest.fixture
+def run_cli(monkeypatch):
+    """以命令行参数运行 complier.run，返回 (退出码, 输出)"""
+    def run(*args: str):
+        out = io.StringIO()
+        monkeypatch.setattr(sys, 'argv', ['complier.py', '-j1', *args])
+        # complier 在导入时绑定了 stdout，capsys 截获不到
+        monkeypatch.setattr(complier, 'stdout', out)
+        with pytest.raises(SystemExit) as exit_info:
+            complier.run()
+        return exit_info.value.code, out.getvalue()
+    return run
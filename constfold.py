@@ -0,0 +1,318 @@
+from __future__ import annotations
+import math
+import struct
+from typing import Dict, Optional, Tuple, Union
+import ast1
+from enums import BasicType, BinaryOp, UnaryOp
+from semantic import BOOL_OPS, NUMERIC_RANK
+from symboltable import SymbolTable
+from type import Type
+from visitor import Visitor
+
+Value = Union[bool, int, float]
+
+# 浮点数按声明类型的精度舍入
+FLOAT_FORMATS = {BasicType.F16: 'e', BasicType.F32: 'f', BasicType.F64: 'd'}
+
+# 源码中各种字面量的类型
+LITERAL_BASIC_TYPES = {'INTCON': BasicType.INT, 'FLOATCON': BasicType.F64, 'BOOLCON': BasicType.BOOL}
+
+# 这些字段是被赋值、取引用或调用的对象，即使是常量名也不能替换成字面量
+NO_FOLD_FIELDS = {'LVal', 'referObjectExp', 'funcExp', 'objectExp', 'arrayExp'}
+
+
+def wrap_int(value: int) -> int:
+    """按 32 位有符号整数回绕"""
+    value &= 0xffffffff
+    return value - 0x100000000 if value & 0x80000000 else value
+
+
+def round_float(value: float, basic_type: BasicType) -> float:
+    fmt = FLOAT_FORMATS[basic_type]
+    try:
+        return struct.unpack(fmt, struct.pack(fmt, value))[0]
+    except OverflowError:
+        return math.copysign(math.inf, value)
+
+
+def convert(value: Value, basic_type: BasicType) -> Optional[Value]:
+    """常量值转换为 basic_type，不支持的转换返回 None"""
+    if basic_type == BasicType.BOOL:
+        return bool(value)
+    if basic_type == BasicType.INT:
+        if isinstance(value, float):
+            if not math.isfinite(value):
+                return None
+            value = math.trunc(value)
+        return wrap_int(int(value))
+    if basic_type in FLOAT_FORMATS:
+        return round_float(float(value), basic_type)
+    return None
+
+
+def literal_kind(value: Value) -> str:
+    if isinstance(value, bool):
+        return 'BOOLCON'
+    if isinstance(value, int):
+        return 'INTCON'
+    return 'FLOATCON'
+
+
+def promote(left: BasicType, right: BasicType) -> BasicType:
+    """与语义分析相同的提升规则：取两侧中较大者，bool 参与运算时提升为 int"""
+    return max(left, right, BasicType.INT, key=NUMERIC_RANK.__getitem__)
+
+
+def binary_type(op: BinaryOp, left: BasicType, right: BasicType) -> BasicType:
+    return BasicType.BOOL if op in BOOL_OPS else promote(left, right)
+
+
+def unary_type(op: UnaryOp, operand: BasicType) -> BasicType:
+    return BasicType.BOOL if op == UnaryOp.LOGICNOT else promote(operand, operand)
+
+
+def fold_binary(op: BinaryOp, left: Value, right: Value, basic_type: BasicType) -> Optional[Value]:
+    """两个常量的二元运算，basic_type 是两侧提升后的类型：操作数先转换为该类型，浮点结果按该类型的精度舍入，
+    与不折叠时生成的代码逐次运算的结果一致。除零、越界移位等运行时才确定（或未定义）的情况返回 None 不折叠"""
+    if op == BinaryOp.LOGICAND:
+        return bool(left) and bool(right)
+    if op == BinaryOp.LOGICOR:
+        return bool(left) or bool(right)
+    left, right = convert(left, basic_type), convert(right, basic_type)
+    if left is None or right is None:
+        return None
+    if op == BinaryOp.EQ:
+        return left == right
+    if op == BinaryOp.NEQ:
+        return left != right
+    if op == BinaryOp.LSS:
+        return left < right
+    if op == BinaryOp.LEQ:
+        return left <= right
+    if op == BinaryOp.GRE:
+        return left > right
+    if op == BinaryOp.GEQ:
+        return left >= right
+
+    if basic_type in FLOAT_FORMATS:
+        # 双精度算出的 + - * / 结果再舍入到 f32/f16，与直接以该精度运算的结果相同
+        if op == BinaryOp.PLUS:
+            return round_float(left + right, basic_type)
+        if op == BinaryOp.MINUS:
+            return round_float(left - right, basic_type)
+        if op == BinaryOp.MUL:
+            return round_float(left * right, basic_type)
+        if op == BinaryOp.DIV:
+            return round_float(left / right, basic_type) if right != 0.0 else None
+        if op == BinaryOp.MOD:
+            return math.fmod(left, right) if right != 0.0 else None
+        return None  # 位运算不接受浮点数
+
+    if op == BinaryOp.PLUS:
+        return wrap_int(left + right)
+    if op == BinaryOp.MINUS:
+        return wrap_int(left - right)
+    if op == BinaryOp.MUL:
+        return wrap_int(left * right)
+    if op in (BinaryOp.DIV, BinaryOp.MOD):
+        if right == 0 or (left == -0x80000000 and right == -1):
+            return None
+        quotient = abs(left) // abs(right)
+        if (left < 0) != (right < 0):
+            quotient = -quotient
+        return quotient if op == BinaryOp.DIV else left - right * quotient
+    if op in (BinaryOp.LSHIFT, BinaryOp.RSHIFT):
+        if not 0 <= right < 32:
+            return None
+        return wrap_int(left << right) if op == BinaryOp.LSHIFT else wrap_int(left) >> right
+    if op == BinaryOp.AND:
+        return wrap_int(left & right)
+    if op == BinaryOp.OR:
+        return wrap_int(left | right)
+    if op == BinaryOp.XOR:
+        return wrap_int(left ^ right)
+    return None
+
+
+def fold_unary(op: UnaryOp, value: Value, basic_type: BasicType) -> Optional[Value]:
+    """basic_type 是操作数提升后的类型"""
+    if op == UnaryOp.LOGICNOT:
+        return not value
+    value = convert(value, basic_type)
+    if value is None or op == UnaryOp.PLUS:
+        return value
+    if op == UnaryOp.MINUS:
+        return -value if basic_type in FLOAT_FORMATS else wrap_int(-value)
+    if op == UnaryOp.NOT and basic_type not in FLOAT_FORMATS:
+        return wrap_int(~value)
+    return None
+
+
+def basic_type_of(type_spec: Optional[ast1.TypeSpecifier]) -> Optional[BasicType]:
+    return type_spec.bType if isinstance(type_spec, ast1.BType) else None
+
+
+class ConstFolder(Visitor):
+    """自底向上把常量子表达式替换为 LiteralPri，并把 const 声明的值记入 SymbolTable 供后续引用处替换。
+
+    基于 Visitor.traverse 全程迭代：子节点在 leave 时算出折叠结果，存入 folded，
+    父节点 leave 时再把对应字段替换掉，所以深层表达式链不会超出递归深度。
+
+    每个常量都带着类型折叠，中间结果按其类型的精度舍入，产生的字面量记下这个类型（LiteralPri.bType），
+    f16/f32 的运算折叠后仍是 f16/f32。"""
+    def __init__(self) -> None:
+        self.symtab = SymbolTable(None, None)
+        self.folded: Dict[ast1.Node, ast1.LiteralPri] = {}
+        self.count = 0  # 被替换掉的表达式子树数
+
+    def literal(self, node: ast1.Node, value: Value, basic_type: BasicType) -> None:
+        self.folded[node] = ast1.LiteralPri(node.row, value, literal_kind(value), basic_type)
+
+    def constant(self, node: Optional[ast1.Node]) -> Optional[Tuple[Value, BasicType]]:
+        """node 是数值或 bool 字面量时返回 (值, 类型)"""
+        if isinstance(node, ast1.LiteralPri) and node.kind in LITERAL_BASIC_TYPES:
+            return node.value, node.bType if node.bType is not None else LITERAL_BASIC_TYPES[node.kind]
+        return None
+
+    def replace(self, node: ast1.Node) -> Optional[ast1.Node]:
+        literal = self.folded.pop(node, None)
+        if literal is not None:
+            self.count += 1
+        return literal
+
+    ########################################################## 作用域
+    def push_scope(self) -> None:
+        self.symtab = SymbolTable(self.symtab, None)
+
+    def pop_scope(self) -> None:
+        self.symtab = self.symtab.parentSymtab
+
+    def declare(self, name: str, basic_type: Optional[BasicType] = None, value: Optional[Value] = None) -> None:
+        # 非 const 的变量、参数也要登记，遮蔽外层的同名常量
+        symbol_type = Type.basic(basic_type) if basic_type is not None else Type.auto()
+        self.symtab.add_symbol(name, symbol_type.with_const(value is not None), value)
+
+    def enter_FuncDef(self, node: ast1.FuncDef) -> None:
+        self.push_scope()
+
+    def enter_LambdaExp(self, node: ast1.LambdaExp) -> None:
+        self.push_scope()
+
+    def enter_ForStmt(self, node: ast1.ForStmt) -> None:
+        self.push_scope()
+
+    def enter_BlockStmt(self, node: ast1.BlockStmt) -> None:
+        self.push_scope()
+
+    ########################################################## 替换与折叠
+    def leave_Node(self, node: ast1.Node) -> None:
+        for name in ast1.field_names(type(node)):
+            value = getattr(node, name)
+            if isinstance(value, ast1.Node):
+                if name in NO_FOLD_FIELDS:
+                    self.folded.pop(value, None)
+                    continue
+                literal = self.replace(value)
+                if literal is not None:
+                    setattr(node, name, literal)
+            elif isinstance(value, list):
+                for i, item in enumerate(value):
+                    if isinstance(item, ast1.Node):
+                        literal = self.replace(item)
+                        if literal is not None:
+                            value[i] = literal
+
+    def leave_FuncDef(self, node: ast1.FuncDef) -> None:
+        self.leave_Node(node)
+        self.pop_scope()
+
+    def leave_LambdaExp(self, node: ast1.LambdaExp) -> None:
+        self.leave_Node(node)
+        self.pop_scope()
+
+    def leave_ForStmt(self, node: ast1.ForStmt) -> None:
+        self.leave_Node(node)
+        self.pop_scope()
+
+    def leave_BlockStmt(self, node: ast1.BlockStmt) -> None:
+        self.leave_Node(node)
+        self.pop_scope()
+
+    def leave_FuncParam(self, node: ast1.FuncParam) -> None:
+        self.leave_Node(node)
+        self.declare(node.ident, basic_type_of(node.paramType))
+
+    def leave_InitDecl(self, node: ast1.InitDecl) -> None:
+        self.leave_Node(node)
+        basic_type = basic_type_of(node.typeSpec)
+        constant = self.constant(node.initVal)
+        if constant is None or (node.typeSpec is not None and basic_type is None):
+            # 初始值不是常量，或声明的类型（typedef 名等）在这里无法确定
+            self.declare(node.ident, basic_type)
+            return
+        value, value_type = constant
+        if basic_type is None:
+            basic_type = value_type
+        else:
+            value = convert(value, basic_type)
+            if basic_type in FLOAT_FORMATS and isinstance(node.initVal.value, float) and value != node.initVal.value:
+                node.initVal = ast1.LiteralPri(node.initVal.row, value, 'FLOATCON', basic_type)
+        if node.isConst and value is not None:
+            self.declare(node.ident, basic_type, value)
+        else:
+            self.declare(node.ident, basic_type)
+
+    def leave_IdentPri(self, node: ast1.IdentPri) -> None:
+        symbol = self.symtab.get_symbol(node.ident)
+        if symbol is not None and symbol.value is not None and symbol.type.isConst:
+            self.literal(node, symbol.value, symbol.type.basic_type)
+
+    def leave_ExpPri(self, node: ast1.ExpPri) -> None:
+        self.leave_Node(node)
+        constant = self.constant(node.exp)
+        if constant is not None:
+            self.literal(node, *constant)
+
+    def leave_UnaryExp(self, node: ast1.UnaryExp) -> None:
+        self.leave_Node(node)
+        constant = self.constant(node.exp)
+        if constant is not None:
+            basic_type = unary_type(node.unaryOp, constant[1])
+            value = fold_unary(node.unaryOp, constant[0], basic_type)
+            if value is not None:
+                self.literal(node, value, basic_type)
+
+    def leave_BinaryExp(self, node: ast1.BinaryExp) -> None:
+        self.leave_Node(node)
+        left = self.constant(node.leftExp)
+        if left is None:
+            return
+        # 短路：左侧已能决定结果时不需要右侧是常量
+        if node.binaryOp == BinaryOp.LOGICAND and not left[0]:
+            self.literal(node, False, BasicType.BOOL)
+            return
+        if node.binaryOp == BinaryOp.LOGICOR and left[0]:
+            self.literal(node, True, BasicType.BOOL)
+            return
+        right = self.constant(node.rightExp)
+        if right is None:
+            return
+        value = fold_binary(node.binaryOp, left[0], right[0], promote(left[1], right[1]))
+        if value is not None:
+            self.literal(node, value, binary_type(node.binaryOp, left[1], right[1]))
+
+    def leave_CastExp(self, node: ast1.CastExp) -> None:
+        self.leave_Node(node)
+        constant = self.constant(node.castedExp)
+        basic_type = basic_type_of(node.typeSpec)
+        if constant is not None and basic_type is not None:
+            value = convert(constant[0], basic_type)
+            if value is not None:
+                self.literal(node, value, basic_type)
+
+
+def fold_constants(root: ast1.Node) -> int:
+    """原地折叠 root 下的常量表达式，返回被替换掉的子树数"""
+    folder = ConstFolder()
+    folder.traverse(root)
+    return folder.count
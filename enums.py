@@ -7,7 +7,8 @@ class IDType(Enum):
     STRUCT = 2,
     REFERENCE = 3,
     FUNCTION = 4,
-    ARRAY = 5
+    ARRAY = 5,
+    GENERIC = 6
 
 
 class BasicType(Enum):
@@ -6,3 +6,8 @@ class ParseError(RuntimeError):
 class SemanticError(RuntimeError):
     def __init__(self, msg) -> None:
         super().__init__(msg)
+
+
+class CodegenError(RuntimeError):
+    def __init__(self, msg) -> None:
+        super().__init__(msg)
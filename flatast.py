@@ -0,0 +1,315 @@
+from __future__ import annotations
+import itertools
+import struct
+from array import array
+from enum import Enum
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+import ast1
+import enums
+
+# 伪节点：列表字段本身也作为一个节点，元素挂在它下面
+LIST = 0
+# 行号为 None（以及列表伪节点）时 row 数组中存放的值，行号从 1 开始不会与之冲突
+NO_ROW = -1
+
+# payload 中各种值的类型标记
+TAG_NONE, TAG_FALSE, TAG_TRUE, TAG_INT, TAG_FLOAT, TAG_STR, TAG_ENUM, TAG_BIGINT = range(8)
+COUNT = struct.Struct('<I')
+# 反序列化时只按名字查找这两处定义的类，不会执行输入中的任何代码
+NODE_CLASSES = {name: cls for name, cls in vars(ast1).items()
+                if isinstance(cls, type) and issubclass(cls, ast1.Node)}
+ENUM_CLASSES = {name: cls for name, cls in vars(enums).items()
+                if isinstance(cls, type) and issubclass(cls, Enum) and cls is not Enum}
+
+
+class FlatAST(object):
+    """struct-of-arrays 形式的 AST。
+
+    节点按先序编号，第 i 个节点的信息分散在几条平行数组中：
+        kind[i]          布局编号，指向 layouts[kind[i]] = (节点类, 每个字段是否为子节点)
+        row[i]           行号，-1 表示没有
+        first_child[i]   第一个子节点，-1 表示没有
+        next_sibling[i]  下一个兄弟节点，-1 表示没有
+        payload[i]       非子节点字段（字符串、数值、枚举等）在 payloads 中的下标，-1 表示没有
+    """
+    def __init__(self) -> None:
+        self.layouts: List[Tuple[type, Tuple[bool, ...]]] = [(list, ())]
+        self.layout_index: Dict[Tuple[type, Tuple[bool, ...]], int] = {}
+        self.kind: Sequence[int] = array('H')
+        self.row: Sequence[int] = array('i')
+        self.first_child: Sequence[int] = array('i')
+        self.next_sibling: Sequence[int] = array('i')
+        self.payload: Sequence[int] = array('i')
+        self.payloads: List[tuple] = []
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def get_layout(self, cls: type, mask: Tuple[bool, ...]) -> int:
+        key = (cls, mask)
+        kind = self.layout_index.get(key)
+        if kind is None:
+            kind = len(self.layouts)
+            self.layouts.append(key)
+            self.layout_index[key] = kind
+        return kind
+
+    def node_class(self, index: int) -> type:
+        return self.layouts[self.kind[index]][0]
+
+    def children(self, index: int) -> Iterator[int]:
+        child = self.first_child[index]
+        while child != -1:
+            yield child
+            child = self.next_sibling[child]
+
+    def find(self, cls: type) -> Iterator[int]:
+        """顺序扫描 kind 数组，找出所有 cls（含子类）节点"""
+        kinds = {kind for kind, (layout_cls, _) in enumerate(self.layouts) if issubclass(layout_cls, cls)}
+        for index, kind in enumerate(self.kind):
+            if kind in kinds:
+                yield index
+
+    ########################################################## 对象树 <-> 平铺
+    @staticmethod
+    def from_tree(root: ast1.Node) -> FlatAST:
+        flat = FlatAST()
+        kind, row, first_child, next_sibling, payload = (
+            flat.kind, flat.row, flat.first_child, flat.next_sibling, flat.payload)
+        last_child: List[int] = []
+        stack: List[Tuple[object, int]] = [(root, -1)]
+        while stack:
+            item, parent = stack.pop()
+            index = len(kind)
+            if isinstance(item, list):
+                kind.append(LIST)
+                row.append(NO_ROW)
+                payload.append(-1)
+                children = item
+            else:
+                cls = type(item)
+                if cls is ast1.CompUnit:
+                    # 各分类列表都是 allDeclarationList 的视图，只保存这一份
+                    children = [item.allDeclarationList]
+                    mask = (True,)
+                    values = ()
+                else:
+                    children = []
+                    mask = []
+                    values = []
+                    for name in ast1.field_names(cls)[1:]:
+                        value = getattr(item, name)
+                        is_child = isinstance(value, (ast1.Node, list))
+                        mask.append(is_child)
+                        (children if is_child else values).append(value)
+                    mask = tuple(mask)
+                kind.append(flat.get_layout(cls, mask))
+                row.append(item.row if item.row is not None else NO_ROW)
+                if values:
+                    payload.append(len(flat.payloads))
+                    flat.payloads.append(tuple(values))
+                else:
+                    payload.append(-1)
+            first_child.append(-1)
+            next_sibling.append(-1)
+            last_child.append(-1)
+            if parent != -1:
+                if last_child[parent] == -1:
+                    first_child[parent] = index
+                else:
+                    next_sibling[last_child[parent]] = index
+                last_child[parent] = index
+            for child in reversed(children):
+                stack.append((child, index))
+        return flat
+
+    def to_tree(self) -> ast1.Node:
+        # 先序编号保证子节点下标大于父节点，倒序构建即可保证子节点先于父节点就绪
+        built: List[object] = [None] * len(self)
+        for index in range(len(self) - 1, -1, -1):
+            cls, mask = self.layouts[self.kind[index]]
+            row = self.row[index] if self.row[index] != NO_ROW else None
+            children = [built[child] for child in self.children(index)]
+            if cls is list:
+                built[index] = children
+                continue
+            if cls is ast1.CompUnit:
+                node = ast1.CompUnit(row)
+                for decl in children[0]:
+                    node.add_declaration(decl)
+                built[index] = node
+                continue
+            node = cls.__new__(cls)
+            node.row = row
+            values = iter(self.payloads[self.payload[index]] if self.payload[index] != -1 else ())
+            children = iter(children)
+            for name, is_child in zip(ast1.field_names(cls)[1:], mask):
+                setattr(node, name, next(children) if is_child else next(values))
+            built[index] = node
+        return built[0]
+
+    ########################################################## 序列化
+    HEADER = struct.Struct('<4sII')
+    MAGIC = b'MOFA'
+
+    def to_bytes(self) -> bytes:
+        meta = encode_meta(self.layouts[1:], self.payloads)
+        parts = [self.HEADER.pack(self.MAGIC, len(self), len(meta))]
+        for column in (self.kind, self.row, self.first_child, self.next_sibling, self.payload):
+            parts.append(column.tobytes())
+        parts.append(meta)
+        return b''.join(parts)
+
+    @staticmethod
+    def from_bytes(data) -> FlatAST:
+        """各列直接以 memoryview 引用 data，不拷贝。元数据是纯数据编码，不会执行输入中的代码；
+        头部或元数据格式错误时抛出 ValueError"""
+        view = memoryview(data)
+        try:
+            magic, count, meta_size = FlatAST.HEADER.unpack_from(view)
+        except struct.error:
+            raise ValueError('not a flat AST buffer') from None
+        if magic != FlatAST.MAGIC:
+            raise ValueError('not a flat AST buffer')
+        flat = FlatAST()
+        offset = FlatAST.HEADER.size
+        columns = []
+        for typecode in ('H', 'i', 'i', 'i', 'i'):
+            size = count * array(typecode).itemsize
+            if offset + size > len(view):
+                raise ValueError('truncated flat AST buffer')
+            columns.append(view[offset:offset + size].cast(typecode))
+            offset += size
+        flat.kind, flat.row, flat.first_child, flat.next_sibling, flat.payload = columns
+        layouts, flat.payloads = decode_meta(view[offset:offset + meta_size])
+        for cls, mask in layouts:
+            flat.get_layout(cls, mask)
+        return flat
+
+
+def pack_column(typecode: str, values) -> bytes:
+    return COUNT.pack(len(values)) + array(typecode, values).tobytes()
+
+
+def encode_meta(layouts: List[Tuple[type, Tuple[bool, ...]]], payloads: List[tuple]) -> bytes:
+    """元数据按列编码：字符串池、布局、枚举池、每个 payload 的值个数、每个值的类型标记，
+    再按类型分列存放整数、浮点数、字符串下标和枚举下标；每一列都以元素个数为前缀"""
+    strings: Dict[str, int] = {}
+    enum_values: Dict[Enum, int] = {}
+
+    def string(value: str) -> int:
+        index = strings.get(value)
+        if index is None:
+            index = strings[value] = len(strings)
+        return index
+
+    tags = bytearray()
+    ints, floats, string_refs, enum_refs, big_ints = [], [], [], [], []
+    for values in payloads:
+        for value in values:
+            if value is None:
+                tags.append(TAG_NONE)
+            elif value is True or value is False:
+                tags.append(TAG_TRUE if value else TAG_FALSE)
+            elif isinstance(value, Enum):
+                tags.append(TAG_ENUM)
+                index = enum_values.get(value)
+                if index is None:
+                    index = enum_values[value] = len(enum_values)
+                enum_refs.append(index)
+            elif isinstance(value, int):
+                if -1 << 63 <= value < 1 << 63:
+                    tags.append(TAG_INT)
+                    ints.append(value)
+                else:
+                    tags.append(TAG_BIGINT)
+                    big_ints.append(string(str(value)))
+            elif isinstance(value, float):
+                tags.append(TAG_FLOAT)
+                floats.append(value)
+            elif isinstance(value, str):
+                tags.append(TAG_STR)
+                string_refs.append(string(value))
+            else:
+                raise TypeError(f'can not serialize AST field value {value!r}')
+    layout_refs = [(string(cls.__name__), mask) for cls, mask in layouts]
+    enum_names = [(string(type(value).__name__), string(value.name)) for value in enum_values]
+
+    encoded = [value.encode('utf8') for value in strings]
+    parts = [pack_column('I', [len(value) for value in encoded]), *encoded]
+    parts.append(pack_column('I', [name for name, _ in layout_refs]))
+    parts.append(pack_column('H', [len(mask) for _, mask in layout_refs]))
+    parts.append(pack_column('B', [flag for _, mask in layout_refs for flag in mask]))
+    parts.append(pack_column('I', [ref for pair in enum_names for ref in pair]))
+    parts.append(pack_column('H', [len(values) for values in payloads]))
+    parts.append(COUNT.pack(len(tags)) + bytes(tags))
+    parts.append(pack_column('q', ints))
+    parts.append(pack_column('d', floats))
+    parts.append(pack_column('I', string_refs))
+    parts.append(pack_column('I', enum_refs))
+    parts.append(pack_column('I', big_ints))
+    return b''.join(parts)
+
+
+def decode_meta(view: memoryview) -> Tuple[List[Tuple[type, Tuple[bool, ...]]], List[tuple]]:
+    offset = 0
+
+    def read_bytes(size: int) -> memoryview:
+        nonlocal offset
+        if offset + size > len(view):
+            raise ValueError('truncated flat AST buffer')
+        offset += size
+        return view[offset - size:offset]
+
+    def read_column(typecode: str) -> array:
+        count = COUNT.unpack(read_bytes(COUNT.size))[0]
+        column = array(typecode)
+        column.frombytes(read_bytes(count * column.itemsize))
+        return column
+
+    def lookup(classes: Dict[str, type], name: str) -> type:
+        cls = classes.get(name)
+        if cls is None:
+            raise ValueError(f'unknown class {name} in flat AST buffer')
+        return cls
+
+    try:
+        strings = [str(read_bytes(size), 'utf8') for size in read_column('I')]
+        names, sizes, flags = read_column('I'), read_column('H'), read_column('B')
+        layouts = []
+        start = 0
+        for name, size in zip(names, sizes):
+            layouts.append((lookup(NODE_CLASSES, strings[name]), tuple(map(bool, flags[start:start + size]))))
+            start += size
+        enum_names = read_column('I')
+        enum_values = [lookup(ENUM_CLASSES, strings[cls])[strings[member]]
+                       for cls, member in zip(enum_names[::2], enum_names[1::2])]
+        counts = read_column('H')
+        tags = read_column('B')
+        ints, floats = read_column('q'), read_column('d')
+        string_refs, enum_refs, big_ints = read_column('I'), read_column('I'), read_column('I')
+        # 每种标记对应一个取值函数，按标记顺序依次从各列取值
+        readers = [itertools.repeat(None).__next__, itertools.repeat(False).__next__,
+                   itertools.repeat(True).__next__, iter(ints).__next__, iter(floats).__next__,
+                   map(strings.__getitem__, string_refs).__next__,
+                   map(enum_values.__getitem__, enum_refs).__next__,
+                   map(int, map(strings.__getitem__, big_ints)).__next__]
+        values = [readers[tag]() for tag in tags]
+    except (IndexError, KeyError, StopIteration, UnicodeDecodeError):
+        raise ValueError('corrupt flat AST buffer') from None
+    if sum(counts) != len(values):
+        raise ValueError('corrupt flat AST buffer')
+    payloads = []
+    start = 0
+    for count in counts:
+        payloads.append(tuple(values[start:start + count]))
+        start += count
+    return layouts, payloads
+
+
+def flatten(root: ast1.Node) -> FlatAST:
+    return FlatAST.from_tree(root)
+
+
+def unflatten(flat: FlatAST) -> Optional[ast1.Node]:
+    return flat.to_tree() if len(flat) else None
@@ -0,0 +1,177 @@
+from __future__ import annotations
+import ctypes
+import ctypes.util
+import hashlib
+from typing import Dict, List, Optional, Tuple
+from llvmlite import binding as llvm
+from llvmlite import ir
+from cache import ObjectCache
+from error import CodegenError
+from pipeline import PipelineOptions, PipelineReport, run_pipeline
+
+# IR 类型到 ctypes 类型；half 没有对应的 ctypes 类型，不能出现在导出函数的签名里
+CTYPES_BY_IR = {
+    'void': None,
+    'i1': ctypes.c_bool,
+    'i8': ctypes.c_int8,
+    'i32': ctypes.c_int32,
+    'i64': ctypes.c_int64,
+    'float': ctypes.c_float,
+    'double': ctypes.c_double,
+}
+
+# 目标代码缓存的默认容量
+CACHE_BYTES = 64 << 20
+
+_initialized = False
+
+
+def initialize() -> None:
+    """LLVM 的本机目标只需初始化一次"""
+    global _initialized
+    if not _initialized:
+        llvm.initialize_native_target()
+        llvm.initialize_native_asmprinter()
+        _initialized = True
+
+
+def resolve_cpu(cpu: str, features: str) -> Tuple[str, str]:
+    """cpu 为 'native' 时换成本机的 CPU 型号与全部特性，features 中给出的特性（如 '+avx2,-fma'）追加在后面"""
+    if cpu == 'native':
+        initialize()
+        cpu = llvm.get_host_cpu_name()
+        features = ','.join(filter(None, [llvm.get_host_cpu_features().flatten(), features]))
+    return cpu, features
+
+
+def create_target_machine(opt: int = 2, cpu: str = '', features: str = '', triple: Optional[str] = None,
+                          reloc: str = 'default', codemodel: str = 'jitdefault') -> llvm.TargetMachine:
+    """triple 为空时生成本机代码，cpu 为空时使用通用 CPU"""
+    initialize()
+    if triple:
+        # 交叉编译需要其它目标的代码生成器
+        llvm.initialize_all_targets()
+        llvm.initialize_all_asmprinters()
+    cpu, features = resolve_cpu(cpu, features)
+    try:
+        target = llvm.Target.from_triple(triple or llvm.get_process_triple())
+    except RuntimeError as err:
+        raise CodegenError(f'unknown target {triple}: {err}') from None
+    return target.create_target_machine(cpu=cpu, features=features, opt=opt, reloc=reloc, codemodel=codemodel)
+
+
+def to_ctype(ir_type: ir.Type):
+    if isinstance(ir_type, ir.PointerType):
+        pointee = ir_type.pointee
+        if isinstance(pointee, ir.FunctionType):
+            return to_cfunctype(pointee)
+        if isinstance(pointee, (ir.IntType, ir.FloatType, ir.DoubleType)):
+            return ctypes.POINTER(to_ctype(pointee))
+        return ctypes.c_void_p  # 结构体与定长数组按不透明指针传递
+    ctype = CTYPES_BY_IR.get(str(ir_type), False)
+    if ctype is False:
+        raise CodegenError(f'IR type {ir_type} can not be passed through ctypes')
+    return ctype
+
+
+def to_cfunctype(function_type: ir.FunctionType):
+    return ctypes.CFUNCTYPE(to_ctype(function_type.return_type), *[to_ctype(arg) for arg in function_type.args])
+
+
+def parse_module(ir_text: str) -> llvm.ModuleRef:
+    """解析并校验 IR 文本，LLVM 报告的错误转为 CodegenError"""
+    initialize()
+    try:
+        llvm_module = llvm.parse_assembly(ir_text)
+        llvm_module.verify()
+    except RuntimeError as err:
+        raise CodegenError(f'invalid IR: {err}') from err
+    return llvm_module
+
+
+def object_key(ir_text: str, triple: str, cpu: str, features: str, pipeline: str) -> str:
+    """目标代码由 IR、目标三元组、CPU 型号与特性、优化流水线的配置与 LLVM 版本共同决定"""
+    digest = hashlib.sha256(ir_text.encode('utf8'))
+    digest.update(f'\0{triple}\0{cpu}\0{features}\0{pipeline}\0{llvm.llvm_version_info}'.encode())
+    return digest.hexdigest()[:32]
+
+
+def flush_stdout() -> None:
+    """printf 写入 C 的 stdout 缓冲区，与 Python 的输出交错前先刷新"""
+    libc = ctypes.CDLL(ctypes.util.find_library('c'))
+    libc.fflush(None)
+
+
+class JITModule(object):
+    """用 MCJIT 在进程内编译一个 ir.Module，导出函数可以作为 ctypes 函数直接调用。
+
+    编译时按 options 运行优化流水线，然后执行模块的静态构造函数（全局变量的初始化）。
+    cpu 与 features 的含义同 resolve_cpu，为空时使用通用 CPU。
+    给出 cache 时通过 MCJIT 的目标代码缓存接口读写磁盘缓存：命中时跳过优化与机器码生成，直接加载缓存的目标文件，
+    此时 report 为 None。"""
+    def __init__(self, module: ir.Module, options: Optional[PipelineOptions] = None,
+                 cache: Optional[ObjectCache] = None, cpu: str = '', features: str = '') -> None:
+        options = options or PipelineOptions()
+        self.module = module
+        cpu, features = resolve_cpu(cpu, features)
+        self.targetMachine = create_target_machine(options.opt, cpu, features)
+        ir_text = str(module)
+        self.llvmModule = parse_module(ir_text)
+        cached = None
+        if cache is not None:
+            key = object_key(ir_text, self.targetMachine.triple, cpu, features, options.key())
+            cached = cache.get(key)
+        self.cacheHit = cached is not None
+        self.report: Optional[PipelineReport] = None
+        if not self.cacheHit:
+            self.report = run_pipeline(self.llvmModule, self.targetMachine, options)
+        self.engine = llvm.create_mcjit_compiler(self.llvmModule, self.targetMachine)
+        if cache is not None:
+            self.engine.set_object_cache(lambda llvm_module, data: cache.put(key, data),
+                                         lambda llvm_module: cached)
+        self.engine.finalize_object()
+        self.engine.run_static_constructors()
+        self.cfuncs: Dict[str, object] = {}
+
+    def exported(self) -> List[str]:
+        """模块中定义的外部可见函数"""
+        return [function.name for function in self.module.functions
+                if not function.is_declaration and function.linkage in ('', 'external')]
+
+    def function(self, name: str):
+        """取得函数 name 的 ctypes 函数，签名由 IR 中的函数类型得出"""
+        cfunc = self.cfuncs.get(name)
+        if cfunc is None:
+            try:
+                function = self.module.get_global(name)
+            except KeyError:
+                function = None
+            if not isinstance(function, ir.Function) or function.is_declaration:
+                raise CodegenError(f'function {name} is not defined')
+            cfunc = self.cfuncs[name] = to_cfunctype(function.function_type)(self.engine.get_function_address(name))
+            cfunc.owner = self  # 机器码属于引擎，函数还在用时引擎不能被回收
+        return cfunc
+
+    def functions(self) -> Dict[str, object]:
+        exported = {}
+        for name in self.exported():
+            try:
+                exported[name] = self.function(name)
+            except CodegenError:
+                pass  # 签名中有 ctypes 无法表示的类型
+        return exported
+
+    def run_main(self) -> int:
+        try:
+            return self.function('main')()
+        finally:
+            flush_stdout()
+
+    def close(self) -> None:
+        self.engine.run_static_destructors()
+        self.cfuncs.clear()
+
+
+def compile_module(module: ir.Module, options: Optional[PipelineOptions] = None,
+                   cache: Optional[ObjectCache] = None, cpu: str = '', features: str = '') -> JITModule:
+    return JITModule(module, options, cache, cpu, features)
@@ -1,33 +1,54 @@
+import importlib.util
+import itertools
+import os
+import re
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Union
 import ply.lex as lex
 from ply.lex import TOKEN
+import cache
 
-context = {
-    "struct": [],
-    "typedef": [],
-    "generic_type": [],
-    # "generic_func": [],
-    # "last_scope_is_struct": False,
-}
+class LexerContext(object):
+    """lexer hack 状态：parser 在规约时登记的 struct / typedef / 泛型名，每次解析独立一份"""
+    def __init__(self) -> None:
+        self.names: Dict[str, str] = {}  # struct名 / typedef名 -> token类型
+        self.generic_scopes: List[List[str]] = []  # 每层 template 声明的泛型名
+        self.generic_count: Dict[str, int] = {}  # 泛型名 -> 所在作用域层数
+        # self.generic_func = []  # function泛型名
+        # self.last_scope_is_struct = False
+
+    def add_struct(self, name: str) -> None:
+        self.names[name] = 'STRUCTID'
+
+    def add_typedef(self, name: str) -> None:
+        # struct 名优先于 typedef 名
+        self.names.setdefault(name, 'TYPEDEFID')
+
+    def push_generic_scope(self) -> None:
+        self.generic_scopes.append([])
 
+    def add_generic_type(self, name: str) -> None:
+        self.generic_scopes[-1].append(name)
+        self.generic_count[name] = self.generic_count.get(name, 0) + 1
 
-def init_lexer_context():
-    context["struct"].clear()  # struct
-    context["typedef"].clear()  # typedef名
-    context["generic_type"].clear()  # struct泛型名
-    # context["generic_func"].clear()  # function泛型名
-    # context["last_scope_is_struct"] = False
+    def pop_generic_scope(self) -> None:
+        for name in self.generic_scopes.pop():
+            count = self.generic_count[name] - 1
+            if count:
+                self.generic_count[name] = count
+            else:
+                del self.generic_count[name]
 
+    def query_name(self, name: str) -> Optional[str]:
+        token_type = self.names.get(name)
+        if token_type is None and name in self.generic_count:
+            return 'GENERICID'
+        return token_type
 
-def query_name(name):
-    # return None
-    if name in context["struct"]:
-        return 'STRUCTID'
-    elif name in context["typedef"]:
-        return 'TYPEDEFID'
-    elif name in context["generic_type"]:
-        return 'GENERICID'
-    else:
-        return None
+
+def init_lexer_context(lexer):
+    lexer.context = LexerContext()
+    lexer.lineno = 1
 
 
 # token名list
@@ -156,7 +177,7 @@ def t_FLOATCON(t):
 
 def t_ID(t):
     r'[a-zA-Z_][a-zA-Z_0-9]*'
-    t.type = reserved.get(t.value) or query_name(t.value) or 'ID'
+    t.type = reserved.get(t.value) or t.lexer.context.query_name(t.value) or 'ID'
     return t
 
 
@@ -191,5 +212,147 @@ def t_error(t):
     t.lexer.skip(1)
 
 
-def create_lexer():
-    return lex.lex()
+def build_cached_lexer():
+    """从缓存目录读取 lextab，跳过 lex.lex() 对本模块的反射与校验；缓存不存在时生成一次"""
+    cache_dir = cache.table_cache_dir('lex', __file__)
+    tab_file = os.path.join(cache_dir, 'lextab.py')
+    if not os.path.exists(tab_file):
+        tab_name = f'lextab_{os.getpid()}'
+        lex.lex(optimize=True, lextab=tab_name, outputdir=cache_dir)
+        os.replace(os.path.join(cache_dir, tab_name + '.py'), tab_file)
+        cache.prune_table_dirs(cache_dir)
+    spec = importlib.util.spec_from_file_location('lextab', tab_file)
+    lextab = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(lextab)
+    lexer = lex.Lexer()
+    lexer.lexoptimize = True
+    lexer.readtab(lextab, globals())
+    return lexer
+
+
+# 正则表对每个 optimize 取值只构建一次，之后每个 lexer 都是 clone 出来的独立实例
+_master_lexers = {}
+_master_lock = threading.Lock()
+
+
+def create_lexer(optimize=False):
+    optimize = bool(optimize)
+    with _master_lock:
+        master = _master_lexers.get(optimize)
+        if master is None:
+            master = _master_lexers[optimize] = build_cached_lexer() if optimize else lex.lex()
+    lexer = master.clone()
+    init_lexer_context(lexer)
+    return lexer
+
+
+def decode_value(rule):
+    def decoded_rule(t):
+        t.value = t.value.decode('utf8')
+        return rule(t)
+    return decoded_rule
+
+
+def decode_error(rule):
+    def decoded_rule(t):
+        t.value = t.value[:4].decode('utf8', errors='replace')
+        return rule(t)
+    return decoded_rule
+
+
+_bytes_master_lexers = {}
+
+
+def create_bytes_lexer(optimize=False):
+    """直接在 bytes / mmap 上匹配的 lexer：正则按 bytes 重新编译，
+    只有标识符和字符串 token 会解码成 str，其余简单 token 的值保持为 bytes"""
+    optimize = bool(optimize)
+    base = create_lexer(optimize)
+    with _master_lock:
+        master = _bytes_master_lexers.get(optimize)
+        if master is None:
+            lexer = base.clone()
+            decoded = {t_ID: decode_value(t_ID), t_STRINGCON: decode_value(t_STRINGCON)}
+            lexer.lexstatere = {}
+            for state, ritem in base.lexstatere.items():
+                lexer.lexstatere[state] = [
+                    (re.compile(lexre.pattern.encode('utf8'), lexre.flags & ~re.UNICODE),
+                     [(decoded.get(f[0], f[0]), f[1]) if f else f for f in findex])
+                    for lexre, findex in ritem]
+            # 文本模式读取时 \r\n 会被规范成 \n，按字节匹配时把 \r 当作空白忽略
+            lexer.lexstateignore = {state: ignore.encode('utf8') + b'\r' for state, ignore in base.lexstateignore.items()}
+            lexer.lexstateerrorf = {state: decode_error(f) for state, f in base.lexstateerrorf.items()}
+            lexer.lexliterals = b''
+            lexer.begin('INITIAL')
+            master = _bytes_master_lexers[optimize] = lexer
+    lexer = master.clone()
+    init_lexer_context(lexer)
+    return lexer
+
+
+def input_bytes(lexer, data) -> None:
+    # Lexer.input() 只接受 str，bytes / mmap 直接挂到 lexdata 上，不做拷贝
+    lexer.lexdata = data
+    lexer.lexpos = 0
+    lexer.lexlen = len(data)
+
+
+class StreamLexer(object):
+    """增量 lexer：从文件对象或字符串块迭代器中按需读取源码，只把完整的行交给 PLY lexer，
+    最后一行不完整时留到下一块拼接，因此跨块的 token 不会被截断。
+    可直接作为 parser.parse(lexer=...) 的 lexer 使用。"""
+    def __init__(self, source: Union[TextIO, Iterable[str]], lexer=None, chunk_size: int = 1 << 16) -> None:
+        if hasattr(source, 'read'):
+            f = source
+            source = iter(lambda: f.read(chunk_size), '')
+        self.chunks: Iterator[str] = iter(source)
+        self.lexer = lexer or create_lexer()
+        self.pending: List[str] = []  # 尚未遇到换行的不完整行
+        self.base = 0  # 当前块之前已交给 lexer 的字符数，用于把 lexpos 换算为全局位置
+        self.length = 0  # 当前块的长度
+
+    @property
+    def context(self) -> LexerContext:
+        return self.lexer.context
+
+    @property
+    def lineno(self) -> int:
+        return self.lexer.lineno
+
+    def input(self, data: str) -> None:
+        self.chunks = itertools.chain([data], self.chunks)
+
+    def feed(self) -> bool:
+        for chunk in self.chunks:
+            cut = chunk.rfind('\n') + 1
+            if not cut:
+                self.pending.append(chunk)
+                continue
+            self.pending.append(chunk[:cut])
+            data = ''.join(self.pending)
+            self.pending = [chunk[cut:]]
+            self.set_input(data)
+            return True
+        if any(self.pending):
+            data = ''.join(self.pending)
+            self.pending = []
+            self.set_input(data)
+            return True
+        return False
+
+    def set_input(self, data: str) -> None:
+        self.base += self.length
+        self.length = len(data)
+        self.lexer.input(data)
+
+    def token(self) -> Optional[lex.LexToken]:
+        while True:
+            tok = self.lexer.token() if self.length else None
+            if tok:
+                tok.lexpos += self.base
+                return tok
+            if not self.feed():
+                return None
+
+    def __iter__(self) -> Iterator[lex.LexToken]:
+        return iter(self.token, None)
@@ -1,6 +1,9 @@
 from ply.lex import LexToken
 import ply.yacc as yacc
+import os
 import ast1
+import cache
+import lexer as lexer_module
 from lexer import *
 from enums import *
 from error import *
@@ -13,11 +16,14 @@ def p_comp_unit(p):
         p[0].add_declaration(decl)
 
 
+# 列表产生式都写成左递归并原地 append：右递归的 [p[1]] + p[2] 每层都要拷贝一次列表，
+# 总代价是 O(n^2)，而且 parser 栈深度随列表长度线性增长
 def p_declaration_nest(p):
-    '''declaration_nest : declaration declaration_nest
+    '''declaration_nest : declaration_nest declaration
                         | empty'''
-    if p[1]:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -25,7 +31,8 @@ def p_declaration_nest(p):
 def p_declaration(p):
     '''declaration : block_decl
                    | template_decl
-                   | func_def'''
+                   | func_def
+                   | main_func_def'''
     p[0] = p[1]
 
 
@@ -40,7 +47,7 @@ def p_block_decl(p):
 
 def p_typedef_decl(p):
     '''typedef_decl : TYPEDEF ID ASSIGN type_spec'''
-    context["typedef"].append(p[2])
+    p.lexer.context.add_typedef(p[2])
     p[0] = ast1.TypeDefDecl(p.lineno(1), p[2], p[4])
 
 
@@ -55,10 +62,11 @@ def p_const_decl(p):
 
 
 def p_init_decl_nest(p):
-    '''init_decl_nest : COMMA init_decl init_decl_nest
+    '''init_decl_nest : init_decl_nest COMMA init_decl
                       | empty'''
-    if p[1]:
-        p[0] = [p[2]] + p[3]
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -92,9 +100,14 @@ def p_func_decl(p):
 
 
 def p_template_decl(p):
-    '''template_decl : TEMPLATE generic_type_list declaration'''
-    context["generic_type"].clear()
-    p[0] = ast1.TemplateDecl(p.lineno(1), p[2], p[3])
+    '''template_decl : TEMPLATE new_template generic_type_list declaration'''
+    p.lexer.context.pop_generic_scope()
+    p[0] = ast1.TemplateDecl(p.lineno(1), p[3], p[4])
+
+
+def p_new_template(p):
+    '''new_template :'''
+    p.lexer.context.push_generic_scope()
 
 
 def p_generic_type_list(p):
@@ -103,17 +116,18 @@ def p_generic_type_list(p):
 
 
 def p_generic_type_nest(p):
-    '''generic_type_nest : COMMA generic_type_decl generic_type_nest
+    '''generic_type_nest : generic_type_nest COMMA generic_type_decl
                          | empty'''
-    if p[1]:
-        p[0] = [p[2]] + p[3]
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = []
 
 
 def p_generic_type_decl(p):
     '''generic_type_decl : ID'''
-    context["generic_type"].append(p[1])
+    p.lexer.context.add_generic_type(p[1])
     p[0] = ast1.GenericTypeDecl(p.lineno(1), p[1])
 
 
@@ -123,8 +137,9 @@ def p_func_def(p):
 
 
 def p_main_func_def(p):
-    '''main_func_def : FUNC MAIN LPARENT RPARENT block_stmt'''
-    p[0] = ast1.MainFuncDef(p.lineno(1), p[5])
+    '''main_func_def : FUNC MAIN LPARENT RPARENT ret_type_opt block_stmt'''
+    # main 是关键字，这里按普通的无参函数处理
+    p[0] = ast1.FuncDef(p.lineno(1), ast1.FuncDecl(p.lineno(2), 'main', ast1.FuncType(p.lineno(3), [], p[5])), p[6])
 
 
 def p_type_spec(p):
@@ -164,9 +179,9 @@ def p_array_type(p):
 
 
 def p_int_literal_opt(p):
-    '''int_literal_opt : INT
+    '''int_literal_opt : INTCON
                        | empty'''
-    if p[1]:
+    if p[1] is not None:
         p[0] = p[1]
     else:
         p[0] = None
@@ -192,10 +207,11 @@ def p_generic_spec_list_opt(p):
 
 
 def p_generic_type_spec_nest(p):
-    '''generic_type_spec_nest : COMMA type_spec generic_type_spec_nest
+    '''generic_type_spec_nest : generic_type_spec_nest COMMA type_spec
                               | empty'''
-    if p[1]:
-        p[0] = [p[2]] + p[3]
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -224,10 +240,11 @@ def p_func_param_list_opt(p):
 
 
 def p_func_param_nest(p):
-    '''func_param_nest : COMMA func_param func_param_nest
+    '''func_param_nest : func_param_nest COMMA func_param
                        | empty'''
-    if p[1]:
-        p[0] = [p[2]] + p[3]
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -245,14 +262,15 @@ def p_struct_decl(p):
 
 def p_new_struct(p):
     '''new_struct :'''
-    context["struct"].append(p[-1])
+    p.lexer.context.add_struct(p[-1])
 
 
 def p_struct_member_nest(p):
-    '''struct_member_nest : struct_member struct_member_nest
+    '''struct_member_nest : struct_member_nest struct_member
                           | empty'''
-    if p[1]:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -298,10 +316,11 @@ def p_block_stmt(p):
 
 
 def p_stmt_nest(p):
-    '''stmt_nest : stmt stmt_nest
+    '''stmt_nest : stmt_nest stmt
                  | empty'''
-    if p[1]:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 3:
+        p[1].append(p[2])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -409,7 +428,7 @@ def p_binary_exp(p):
 
 def p_unary_exp(p):
     '''unary_exp : unary_op expression '''
-    p[0] = ast1.UnaryExp(p.lineno(1), p[2], p[1])
+    p[0] = ast1.UnaryExp(p.lineno(1), p[1], p[2])
 
 
 def p_unary_op(p):
@@ -438,15 +457,12 @@ def p_primary_exp(p):
                    | FLOATCON
                    | ID
                    | LPARENT expression RPARENT'''
-    if p[1] == '(':
-        p[0] = ast1.ExpPri(p.lineno(1), p.slice[2])
+    if p.slice[1].type == 'LPARENT':
+        p[0] = ast1.ExpPri(p.lineno(1), p[2])
     elif p.slice[1].type == 'ID':
-        p[0] = ast1.IdentPri(p.lineno(1), p.slice[1])
-    elif p.slice[1].type == 'FLOATCON':
-        # print(p[1])
-        p[0] = ast1.LiteralPri(p.lineno(1), p.slice[1])
+        p[0] = ast1.IdentPri(p.lineno(1), p[1])
     else:
-        p[0] = ast1.LiteralPri(p.lineno(1), p.slice[1])
+        p[0] = ast1.LiteralPri(p.lineno(1), p[1], p.slice[1].type)
 
 
 def p_array_index_exp(p):
@@ -470,8 +486,13 @@ def p_cast_exp(p):
 
 
 def p_func_call_exp(p):
-    '''call_func_exp : postfix_exp generic_spec_list_opt LPARENT func_real_param_list_opt RPARENT'''
-    p[0] = ast1.FuncCallExp(p.lineno(4), p[1], p[2], p[4])
+    '''call_func_exp : postfix_exp LPARENT func_real_param_list_opt RPARENT
+                     | postfix_exp LSS type_spec generic_type_spec_nest GRE LPARENT func_real_param_list_opt RPARENT'''
+    # 不带泛型实参时不能经过 generic_spec_list_opt 的空产生式，否则在 ( 处与其它规则冲突
+    if len(p) == 5:
+        p[0] = ast1.FuncCallExp(p.lineno(2), p[1], [], p[3])
+    else:
+        p[0] = ast1.FuncCallExp(p.lineno(6), p[1], [p[3]] + p[4], p[7])
 
 
 def p_func_real_param_list_opt(p):
@@ -484,10 +505,11 @@ def p_func_real_param_list_opt(p):
 
 
 def p_func_real_param_nest(p):
-    '''func_real_param_nest : expression func_real_param_nest
+    '''func_real_param_nest : func_real_param_nest COMMA expression
                             | empty'''
-    if p[1]:
-        p[0] = [p[1]] + p[2]
+    if len(p) == 4:
+        p[1].append(p[3])
+        p[0] = p[1]
     else:
         p[0] = []
 
@@ -500,10 +522,11 @@ def p_lambda_exp(p):
 def p_io_expr(p):
     '''io_exp : SCAN LSS type_spec GRE LPARENT ID RPARENT
                | PRINT LSS type_spec GRE LPARENT expression RPARENT'''
-    if IOType[p.slice[1].type] == 0:
-        p[0] = ast1.IOExp(p.lineno(1), p[1], p[3], p[6], None)
+    ioType = IOType[p.slice[1].type]
+    if ioType == IOType.SCAN:
+        p[0] = ast1.IOExp(p.lineno(1), ioType, p[3], p[6], None)
     else:
-        p[0] = ast1.IOExp(p.lineno(1), p[1], p[3], "", p[6])
+        p[0] = ast1.IOExp(p.lineno(1), ioType, p[3], "", p[6])
 
 
 def p_empty(p):
@@ -530,9 +553,30 @@ precedence = (
 def p_error(p: LexToken):
     # print(f"Syntax error at token {p.lineno} {p.type}")
     # yacc.errok()
-    raise ParseError(f'Syntax error at line {p.lineno}: {p.value}')
+    if p is None:
+        raise ParseError('Syntax error at end of input')
+    value = p.value.decode('utf8') if isinstance(p.value, bytes) else p.value
+    raise ParseError(f'Syntax error at line {p.lineno}: {value}')
+
+
+def build_cached_parser():
+    """从缓存目录读取 pickle 化的 LALR 表并直接绑定动作函数，跳过 yacc.yacc() 的文法反射、
+    docstring 扫描和签名比较，也不会改写源码目录下的 parsetab.py"""
+    cache_dir = cache.table_cache_dir('yacc', lexer_module.__file__, __file__)
+    table_file = os.path.join(cache_dir, 'parsetab.pickle')
+    if not os.path.exists(table_file):
+        tmp_file = cache.temp_path(table_file)
+        yacc.yacc(start='comp_unit', debug=False, outputdir=cache_dir, picklefile=tmp_file)
+        os.replace(tmp_file, table_file)
+        cache.prune_table_dirs(cache_dir)
+    lr = yacc.LRTable()
+    lr.read_pickle(table_file)
+    lr.bind_callables(globals())
+    return yacc.LRParser(lr, p_error)
 
 
 # Build the parser
-def create_parser(debug=None):
+def create_parser(debug=None, optimize=False):
+    if optimize:
+        return build_cached_parser()
     return yacc.yacc(start='comp_unit', debug=debug)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+import re
+import time
+from typing import List, Optional, Tuple
+from llvmlite import binding as llvm
+
+# LLVM 计时报告中的一行：用户、系统、用户+系统、墙钟时间（各带百分比）与 pass 名。
+# 某一列全为 0 时（常见的是系统时间）LLVM 不输出这一列，所以只认定最后一个时间是墙钟时间
+TIMING_LINE = re.compile(r'^\s*(?:[\d.]+ \(\s*[\d.]+%\)\s+)*([\d.]+) \(\s*[\d.]+%\)\s+([^\d\s].*?)\s*$')
+
+
+class PipelineOptions(object):
+    """LLVM 优化流水线的配置。opt 为 0..3，对应 -O0..-O3；循环向量化与 SLP 向量化默认在 -O2 及以上开启；
+    inline_threshold 为空时使用该优化级别的默认内联阈值。
+
+    fast_math 作用于代码生成：浮点运算与比较带上 fast 标志，允许重结合等变换，浮点归约循环才能被向量化。
+    time_passes 时记录每个 pass 的耗时。"""
+    def __init__(self, opt: int = 2, loop_vectorize: Optional[bool] = None, slp_vectorize: Optional[bool] = None,
+                 inline_threshold: Optional[int] = None, fast_math: bool = False, time_passes: bool = False) -> None:
+        self.opt = opt
+        self.loop_vectorize = opt >= 2 if loop_vectorize is None else loop_vectorize
+        self.slp_vectorize = opt >= 2 if slp_vectorize is None else slp_vectorize
+        self.inline_threshold = inline_threshold
+        self.fast_math = fast_math
+        self.time_passes = time_passes
+
+    def key(self) -> str:
+        """影响生成的机器码的配置，用于目标代码缓存的键；fast_math 已体现在 IR 中"""
+        return (f'O{self.opt} loop-vectorize={self.loop_vectorize} slp-vectorize={self.slp_vectorize} '
+                f'inline-threshold={self.inline_threshold}')
+
+    def tuning_options(self) -> llvm.PipelineTuningOptions:
+        tuning = llvm.create_pipeline_tuning_options(speed_level=self.opt)
+        tuning.loop_vectorization = self.loop_vectorize
+        tuning.slp_vectorization = self.slp_vectorize
+        if self.inline_threshold is not None:
+            tuning.inlining_threshold = self.inline_threshold
+        return tuning
+
+
+def ir_size(llvm_module: llvm.ModuleRef) -> Tuple[int, int, int]:
+    """(定义的函数数, 基本块数, 指令数)"""
+    functions = blocks = instructions = 0
+    for function in llvm_module.functions:
+        if function.is_declaration:
+            continue
+        functions += 1
+        for block in function.blocks:
+            blocks += 1
+            instructions += sum(1 for _ in block.instructions)
+    return functions, blocks, instructions
+
+
+class PipelineReport(object):
+    """一次优化的结果：总耗时、整个流水线前后的 IR 规模，开启 time_passes 时还有每个 pass 的耗时。
+    llvmlite 不能在 pass 之间观察 IR，所以 IR 规模只有流水线整体的变化，没有逐个 pass 的"""
+    def __init__(self, options: PipelineOptions, elapsed: float, before: Tuple[int, int, int],
+                 after: Tuple[int, int, int], passes: List[Tuple[str, float]]) -> None:
+        self.options = options
+        self.elapsed = elapsed
+        self.before = before
+        self.after = after
+        self.passes = passes  # (pass 名, 墙钟秒数)，按耗时从高到低
+
+    def format(self, top: int = 20) -> str:
+        lines = [f'pipeline {self.options.key()} fast-math={self.options.fast_math}: '
+                 f'{self.elapsed * 1000:.1f} ms', '  IR size before -> after the whole pipeline:']
+        for name, before, after in zip(('functions', 'blocks', 'instructions'), self.before, self.after):
+            change = f'{(after - before) / before * 100:+.1f}%' if before else 'n/a'
+            lines.append(f'  {name:<12} {before:>8} -> {after:>8} ({change})')
+        if self.passes:
+            lines.append('  time per pass:')
+        for name, seconds in self.passes[:top]:
+            lines.append(f'  {seconds * 1000:>9.3f} ms  {name}')
+        if len(self.passes) > top:
+            rest = sum(seconds for _, seconds in self.passes[top:])
+            lines.append(f'  {rest * 1000:>9.3f} ms  ({len(self.passes) - top} more passes)')
+        return '\n'.join(lines)
+
+
+def parse_pass_timings(report: str) -> List[Tuple[str, float]]:
+    """按 pass 名汇总 LLVM 计时报告中的 pass 部分（不含其后的分析部分）。
+    同一 pass 在流水线中的多个实例各占一行，这里累加"""
+    totals = {}
+    for line in report.split('Analysis execution timing report')[0].splitlines():
+        match = TIMING_LINE.match(line)
+        if match and match.group(2) != 'Total':
+            totals[match.group(2)] = totals.get(match.group(2), 0.0) + float(match.group(1))
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def run_pipeline(llvm_module: llvm.ModuleRef, target_machine: llvm.TargetMachine,
+                 options: PipelineOptions) -> PipelineReport:
+    """对 llvm_module 运行 options 配置的模块级默认流水线，-O0 时不做任何变换"""
+    before = ir_size(llvm_module)
+    start = time.perf_counter()
+    passes: List[Tuple[str, float]] = []
+    if options.opt > 0:
+        pass_builder = llvm.create_pass_builder(target_machine, options.tuning_options())
+        if options.time_passes:
+            pass_builder.start_pass_timing()
+        pass_builder.getModulePassManager().run(llvm_module, pass_builder)
+        if options.time_passes:
+            passes = parse_pass_timings(pass_builder.finish_pass_timing())
+    elapsed = time.perf_counter() - start
+    return PipelineReport(options, elapsed, before, ir_size(llvm_module), passes)
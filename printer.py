@@ -0,0 +1,239 @@
+from __future__ import annotations
+import io
+from typing import Callable, Dict, List, TextIO, Tuple, Union
+import ast1
+
+# print_<类名> 返回的输出片段：字符串原样写出，(节点, 缩进) 表示在此处打印子节点
+Part = Union[str, Tuple[ast1.Node, int]]
+
+# 只缓存较浅层的缩进串，深层表达式链的缩进按需生成，避免缓存本身随深度平方增长
+INDENT_CACHE_DEPTH = 256
+_indents = [' ' * i for i in range(INDENT_CACHE_DEPTH)]
+
+
+def indent(ind: int) -> str:
+    return _indents[ind] if ind < INDENT_CACHE_DEPTH else ' ' * ind
+
+
+class AstPrinter(object):
+    """把 AST 逐段写入文本流，输出与各节点 __str__ 完全一致。
+
+    每类节点对应一个 print_<类名>(node, ind) 方法，ind 为缩进的空格数，返回按顺序排列的输出片段；
+    print 用显式栈展开这些片段，不递归，上万层的表达式链也不会超出递归深度。"""
+    def __init__(self, stream: TextIO) -> None:
+        self.write: Callable[[str], object] = stream.write
+        self.dispatch: Dict[type, Callable[[ast1.Node, int], List[Part]]] = {}
+
+    def print(self, node: ast1.Node, ind: int = 0) -> None:
+        write, dispatch = self.write, self.dispatch
+        stack: List[Part] = [(node, ind)]
+        while stack:
+            item = stack.pop()
+            if type(item) is str:
+                write(item)
+                continue
+            node, ind = item
+            method = dispatch.get(type(node))
+            if method is None:
+                method = getattr(self, 'print_' + type(node).__name__, self.print_Node)
+                dispatch[type(node)] = method
+            parts = method(node, ind)
+            parts.reverse()
+            stack.extend(parts)
+
+    def print_Node(self, node: ast1.Node, ind: int) -> List[Part]:
+        return [indent(ind)]
+
+    ########################################################## 声明
+    def print_CompUnit(self, node: ast1.CompUnit, ind: int) -> List[Part]:
+        parts: List[Part] = ['CompUnit:\n']
+        parts.extend((decl, ind+1) for decl in node.blockDeclList)
+        parts.extend((decl, ind+1) for decl in node.templateDeclList)
+        parts.extend((defi, ind+1) for defi in node.funcDefList)
+        return parts
+
+    def print_TypeDefDecl(self, node: ast1.TypeDefDecl, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Typedef:\n{indent(ind+1)}ID: {node.ident}\n{indent(ind+1)}Type: ',
+                (node.typeSpec, ind+2), '\n']
+
+    def print_VarDecl(self, node: ast1.VarDecl, ind: int) -> List[Part]:
+        parts: List[Part] = [f'{indent(ind)}VarDecl:\n']
+        parts.extend((initdecl, ind+1) for initdecl in node.initDeclList)
+        return parts
+
+    def print_InitDecl(self, node: ast1.InitDecl, ind: int) -> List[Part]:
+        return [f'{indent(ind)}InitDecl: {"(const)" if node.isConst else ""}\n{indent(ind+1)}Type: ',
+                (node.typeSpec, ind+2) if node.typeSpec else '(empty)',
+                f'\n{indent(ind+1)}ID: {node.ident}\n{indent(ind+1)}Initializer:\n',
+                (node.initVal, ind+2) if node.typeSpec else '']
+
+    def print_FuncDecl(self, node: ast1.FuncDecl, ind: int) -> List[Part]:
+        return [f'{indent(ind)}FuncDecl:\n{indent(ind+1)}ID: {node.ident}\n', (node.funcType, ind+1)]
+
+    def print_TemplateDecl(self, node: ast1.TemplateDecl, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Template: ', (node.declaration, ind+1)]
+
+    def print_FuncDef(self, node: ast1.FuncDef, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Function Definition:\n', (node.funcDecl, ind+1), (node.blockStmt, ind+1)]
+
+    ########################################################## 类型
+    def print_BType(self, node: ast1.BType, ind: int) -> List[Part]:
+        return [f'{indent(ind)}{node.bType.name}']
+
+    def print_DefinedType(self, node: ast1.DefinedType, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Defined type({node.typeName})']
+
+    def print_GenericType(self, node: ast1.GenericType, ind: int) -> List[Part]:
+        return [f'Generic Type({node.typeName})']
+
+    def print_ArrayType(self, node: ast1.ArrayType, ind: int) -> List[Part]:
+        return [(node.typeSpec, ind+1), f'[{"" if node.size is None else node.size}]']
+
+    def print_ReferType(self, node: ast1.ReferType, ind: int) -> List[Part]:
+        return [(node.typeSpec, ind+1), ' reference']
+
+    def print_StructType(self, node: ast1.StructType, ind: int) -> List[Part]:
+        parts: List[Part] = ['struct ']
+        if node.genericSpecList:
+            parts.append('<')
+            for i, genericSpec in enumerate(node.genericSpecList):
+                if i != 0:
+                    parts.append(', ')
+                parts.append((genericSpec, ind+1))
+            parts.append('>')
+        parts.append(f' ({node.ident})')
+        return parts
+
+    def print_FuncType(self, node: ast1.FuncType, ind: int) -> List[Part]:
+        parts: List[Part] = [f'{indent(ind)}Function Type:\n{indent(ind+1)}FuncParams:\n']
+        parts.extend((param, ind+2) for param in node.funcParamList)
+        parts.append(f'{indent(ind+1)}FuncRetType: ')
+        parts.append((node.funcRetType, ind+2) if node.funcRetType else '(Empty)')
+        parts.append('\n')
+        return parts
+
+    def print_FuncParam(self, node: ast1.FuncParam, ind: int) -> List[Part]:
+        return [f'{indent(ind)}FuncParam:\n{indent(ind+1)}Type: ',
+                (node.paramType, ind+2) if node.paramType else '(Empty)',
+                f'\n{indent(ind+1)}ID: {node.ident}\n']
+
+    def print_GenericTypeDecl(self, node: ast1.GenericTypeDecl, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Generic Name: {node.ident}\n']
+
+    ########################################################## 结构体
+    def print_StructDecl(self, node: ast1.StructDecl, ind: int) -> List[Part]:
+        parts: List[Part] = [f'{indent(ind)}Struct Declaration:\n{indent(ind+1)}ID: {node.ident}\n'
+                             f'{indent(ind+1)}Members:\n']
+        parts.extend((member, ind+2) for member in node.memberDeclList)
+        parts.extend((member, ind+2) for member in node.consFuncDefList)
+        parts.extend((member, ind+2) for member in node.memberFuncDefList)
+        return parts
+
+    def print_MemberVarDecl(self, node: ast1.MemberVarDecl, ind: int) -> List[Part]:
+        return [f'{indent(ind)}MemberDecl:\n{indent(ind+1)}ID: {node.ident}\n{indent(ind+1)}Type: ',
+                (node.typeSpec, ind+2), '\n']
+
+    def print_ConsFuncDef(self, node: ast1.ConsFuncDef, ind: int) -> List[Part]:
+        return [f'{indent(ind)}ConsFuncDef:\n{indent(ind+1)}', (node.structType, ind+1), '\n',
+                (node.funcType, ind+1), '\n', (node.blockStmt, ind+1), '\n']
+
+    def print_MemberFuncDef(self, node: ast1.MemberFuncDef, ind: int) -> List[Part]:
+        return [f'{indent(ind)}MemberFuncDef:\n', (node.funcDef, ind+1)]
+
+    ########################################################## 语句
+    def print_BlockStmt(self, node: ast1.BlockStmt, ind: int) -> List[Part]:
+        parts: List[Part] = [f'{indent(ind)}BlockStmt:\n']
+        parts.extend((stmt, ind+1) for stmt in node.stmtList)
+        return parts
+
+    def print_DeclStmt(self, node: ast1.DeclStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}DeclStmt:\n', (node.varDecl, ind+1)]
+
+    def print_ExpStmt(self, node: ast1.ExpStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Expression Statement:\n', (node.exp, ind+1) if node.exp else '']
+
+    def print_IfStmt(self, node: ast1.IfStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}IfStmt:\n{indent(ind+1)}cond:\n', (node.cond, ind+2),
+                f'{indent(ind+1)}trueStmt:\n', (node.trueStmt, ind+2),
+                f'{indent(ind+1)}falseStmt:\n', (node.falseStmt, ind+2) if node.falseStmt else '']
+
+    def print_WhileStmt(self, node: ast1.WhileStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}WhileStmt:\n{indent(ind+1)}cond:\n', (node.cond, ind+2),
+                f'{indent(ind+1)}loopStmt:\n', (node.loopStmt, ind+2)]
+
+    def print_ForStmt(self, node: ast1.ForStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}ForStmt:\n{indent(ind+1)}init:\n', (node.init, ind+2),
+                f'{indent(ind+1)}cond:\n', (node.cond, ind+2),
+                f'{indent(ind+1)}after:\n', (node.after, ind+2),
+                f'{indent(ind+1)}loopStmt:\n', (node.loopStmt, ind+2)]
+
+    def print_BreakStmt(self, node: ast1.BreakStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}BreakStmt\n']
+
+    def print_ContinueStmt(self, node: ast1.ContinueStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}ContinueStmt\n']
+
+    def print_ReturnStmt(self, node: ast1.ReturnStmt, ind: int) -> List[Part]:
+        return [f'{indent(ind)}ReturnStmt:\n', (node.exp, ind+1) if node.exp else '']
+
+    ########################################################## 表达式
+    def print_AssignExp(self, node: ast1.AssignExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}AssignExp:\n', (node.LVal, ind+1), ' equals ', (node.exp, ind+1)]
+
+    def print_UnaryExp(self, node: ast1.UnaryExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}UnaryExp:\n{indent(ind+1)}unaryOp:{node.unaryOp.name}\n', (node.exp, ind+1)]
+
+    def print_BinaryExp(self, node: ast1.BinaryExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}BinaryExp:\n', (node.leftExp, ind+1), (node.rightExp, ind+1),
+                f'{indent(ind+1)}binaryOp: {node.binaryOp.name}\n']
+
+    def print_LiteralPri(self, node: ast1.LiteralPri, ind: int) -> List[Part]:
+        return [f'{indent(ind)}LiteralPrE: ({node.kind}) {node.value}\n']
+
+    def print_IdentPri(self, node: ast1.IdentPri, ind: int) -> List[Part]:
+        return [f'{indent(ind)}IdentPrE: {node.ident}\n']
+
+    def print_ExpPri(self, node: ast1.ExpPri, ind: int) -> List[Part]:
+        return [(node.exp, ind)]
+
+    def print_ArrayIndexExp(self, node: ast1.ArrayIndexExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}ArrayIndexExp:\n{indent(ind+1)}arrayExp:\n', (node.arrayExp, ind+2),
+                f'\n{indent(ind+1)}indexExp:\n', (node.indexExp, ind+2), '\n']
+
+    def print_MemberExp(self, node: ast1.MemberExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}MemberExp:\n{indent(ind+1)}objectExp:\n', (node.objectExp, ind+2),
+                f'\n{indent(ind+1)}MemberID:\n{node.MemberID}\n']
+
+    def print_ReferExp(self, node: ast1.ReferExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}ReferExp:\n{indent(ind+1)}referObjectExp:\n', (node.referObjectExp, ind+2), '\n']
+
+    def print_CastExp(self, node: ast1.CastExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}CastExp:\n{indent(ind+1)}Type: ', (node.typeSpec, ind+2),
+                f'\n{indent(ind+1)}castedExp:\n', (node.castedExp, ind+2), '\n']
+
+    def print_FuncCallExp(self, node: ast1.FuncCallExp, ind: int) -> List[Part]:
+        parts: List[Part] = [f'{indent(ind)}FuncCallExp:\n{indent(ind+1)}funcExp:\n', (node.funcExp, ind+2),
+                             f'{indent(ind+1)}genericSpecList:\n']
+        for i, genericsSpec in enumerate(node.genericSpecList):
+            parts.extend((f'{indent(ind+2)}<{i}>: ', (genericsSpec, ind+3), '\n'))
+        parts.append(f'{indent(ind+1)}paramExpList:\n')
+        parts.extend((param, ind+2) for param in node.paramExpList)
+        return parts
+
+    def print_IOExp(self, node: ast1.IOExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}IOExp:\n{indent(ind+1)}inIdent: {node.inIdent}\n{indent(ind+1)}outExp: \n',
+                (node.outExp, ind+2) if node.outExp else '',
+                f'\n{indent(ind+1)}ioType: {node.ioType.name}\n{indent(ind+1)}type: ', (node.typeSpec, ind+2), '\n']
+
+    def print_LambdaExp(self, node: ast1.LambdaExp, ind: int) -> List[Part]:
+        return [f'{indent(ind)}Lambda Expression:\n', (node.funcType, ind+1), (node.blockStmt, ind+1)]
+
+
+def dump(node: ast1.Node, stream: TextIO, ind: int = 0) -> None:
+    AstPrinter(stream).print(node, ind)
+
+
+def dumps(node: ast1.Node, ind: int = 0) -> str:
+    buf = io.StringIO()
+    dump(node, buf, ind)
+    return buf.getvalue()
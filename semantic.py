@@ -0,0 +1,639 @@
+from __future__ import annotations
+import time
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+import ast1
+from enums import BasicType, BinaryOp, IDType, IOType, UnaryOp
+from error import SemanticError
+from symboltable import Symbol, SymbolTable
+from type import StructInfo, Type
+from visitor import SKIP, Visitor, walk
+
+# 数值类型的提升顺序，二元运算结果取两侧中较大者（bool 参与运算时提升为 int）
+NUMERIC_RANK = {BasicType.BOOL: 0, BasicType.INT: 1, BasicType.F16: 2, BasicType.F32: 3, BasicType.F64: 4}
+INTEGRAL = {BasicType.BOOL, BasicType.INT}
+
+INTEGRAL_OPS = {BinaryOp.LSHIFT, BinaryOp.RSHIFT, BinaryOp.AND, BinaryOp.OR, BinaryOp.XOR}
+BOOL_OPS = {BinaryOp.LOGICAND, BinaryOp.LOGICOR,
+            BinaryOp.EQ, BinaryOp.NEQ, BinaryOp.LSS, BinaryOp.LEQ, BinaryOp.GRE, BinaryOp.GEQ}
+
+# 常用类型，模块持有强引用使其常驻驻留表
+AUTO = Type.auto()
+VOID = Type.basic(BasicType.VOID)
+BOOL = Type.basic(BasicType.BOOL)
+INT = Type.basic(BasicType.INT)
+
+LITERAL_TYPES = {'INTCON': INT, 'FLOATCON': Type.basic(BasicType.F64),
+                 'BOOLCON': BOOL, 'STRCON': Type.basic(BasicType.STRING)}
+
+# auto 与泛型类型要到实例化时才能确定，检查时与任何类型相容
+OPEN_KINDS = (IDType.AUTO, IDType.GENERIC)
+
+# 模板实例化的最大嵌套层数，防止模板以不断变化的类型实参递归实例化自己
+MAX_INSTANTIATION_DEPTH = 64
+
+
+def literal_type(node: ast1.LiteralPri) -> Type:
+    """源码中的字面量按 kind 定类型，常量折叠得到的字面量带有自己的类型"""
+    return Type.basic(node.bType) if node.bType is not None else LITERAL_TYPES[node.kind]
+
+
+class FuncContext(object):
+    """正在检查的函数（或 lambda、构造函数）：返回类型为 None 时由 return 语句推导"""
+    __slots__ = ('funcType', 'retType', 'loops', 'name', 'scope')
+
+    def __init__(self, funcType: Type, retType: Optional[Type], name: Optional[str], scope: Optional[SymbolTable]):
+        self.funcType = funcType
+        self.retType = retType
+        self.loops = 0
+        self.name = name
+        self.scope = scope
+
+
+class Specialization(object):
+    """模板函数的一个实例：各泛型参数的具体类型、实例化后的函数类型，
+    以及按这些类型重新检查函数体得到的表达式类型 types 与调用到的实例 calls。
+    模板结构体实例的方法与构造函数也是实例，owner 为所属的结构体实例类型"""
+    __slots__ = ('template', 'generics', 'funcType', 'types', 'calls', 'owner')
+
+    def __init__(self, template: ast1.Node, generics: Tuple[Type, ...], funcType: Type,
+                 owner: Optional[Type] = None) -> None:
+        self.template = template
+        self.generics = generics
+        self.funcType = funcType
+        self.types: Dict[ast1.Node, Type] = {}
+        self.calls: Dict[ast1.FuncCallExp, Specialization] = {}
+        self.owner = owner
+
+    @property
+    def ident(self) -> str:
+        """模板中的名字，构造函数取结构体名"""
+        if isinstance(self.template, ast1.ConsFuncDef):
+            return self.template.structType.ident
+        return self.template.funcDecl.ident
+
+    @property
+    def name(self) -> str:
+        if self.owner is not None:
+            return f'{self.owner.ir_name}.{self.ident}'
+        return f'{self.ident}<{", ".join(str(generic) for generic in self.generics)}>'
+
+
+class SemanticAnalyzer(Visitor):
+    """语义分析，分两个阶段：
+        declare  只扫描顶层声明，登记结构体、typedef 和所有函数签名，使函数可以先使用后定义
+        check    一次迭代遍历整棵树：维护作用域、登记变量、推导 auto 类型并检查每个表达式
+
+    表达式的类型记录在 types 中供后续阶段使用，各阶段耗时记录在 timings 中。
+
+    模板函数在调用处由实参推导出泛型参数，每组 (模板, 具体类型) 只实例化、检查一次，
+    结果缓存在 specializations 中，调用处到实例的对应关系记录在 calls 中。
+    模板结构体的实例在第一次使用时检查其构造函数与方法，结果记录在 structInstances 中。"""
+    def __init__(self) -> None:
+        self.globalSymtab = SymbolTable(None, None)
+        self.symtab = self.globalSymtab
+        self.types: Dict[ast1.Node, Type] = {}
+        self.signatures: Dict[ast1.Node, Type] = {}
+        self.defined: Set[Tuple[int, str]] = set()
+        self.functions: List[FuncContext] = []
+        self.bound: Set[ast1.MemberExp] = set()  # 取到成员函数的 MemberExp，调用时省略 self 参数
+        self.timings: Dict[str, float] = {}
+        self.templates: Dict[str, ast1.FuncDef] = {}  # 顶层模板函数名 -> 定义
+        self.specializations: Dict[Tuple[ast1.FuncDef, Tuple[Type, ...]], Specialization] = {}
+        self.calls: Dict[ast1.FuncCallExp, Specialization] = {}
+        self.structTemplates: Dict[StructInfo, ast1.StructDecl] = {}  # 模板结构体 -> 定义
+        # 模板结构体的具体实例 -> 其构造函数与方法的实例，按定义中的顺序
+        self.structInstances: Dict[Type, List[Specialization]] = {}
+        self.bindings: Dict[str, Type] = {}  # 正在检查的实例中泛型名对应的具体类型
+        self.instantiating: List[Specialization] = []
+        self.specHits = 0
+        self.specMisses = 0
+
+    def error(self, node: ast1.Node, msg: str) -> SemanticError:
+        # 由非终结符开头的产生式构造的节点没有行号，取子树中第一个有行号的节点
+        row = next((item.row for item in walk(node) if item.row), 0)
+        return SemanticError(f'Semantic error at line {row}: {msg}')
+
+    def analyze(self, root: ast1.CompUnit) -> SemanticAnalyzer:
+        start = time.perf_counter()
+        self.declare(root)
+        declared = time.perf_counter()
+        self.traverse(root)
+        self.timings['declare'] = declared - start
+        self.timings['check'] = time.perf_counter() - declared
+        return self
+
+    ########################################################## 类型说明符
+    def resolve(self, spec: Optional[ast1.TypeSpecifier]) -> Type:
+        if spec is None:
+            return AUTO
+        if isinstance(spec, ast1.BType):
+            return Type.basic(spec.bType)
+        if isinstance(spec, ast1.GenericType):
+            return self.bindings.get(spec.typeName) or Type.generic(spec.typeName)
+        if isinstance(spec, ast1.DefinedType):
+            defined = self.symtab.get_type(spec.typeName)
+            if defined is None:
+                raise self.error(spec, f'undefined type {spec.typeName}')
+            return defined
+        if isinstance(spec, ast1.StructType):
+            declared = self.globalSymtab.get_type(spec.ident)
+            if declared is None or declared.idType != IDType.STRUCT:
+                raise self.error(spec, f'undefined struct {spec.ident}')
+            return Type.struct(declared.struct_info, [self.resolve(generic) for generic in spec.genericSpecList])
+        if isinstance(spec, ast1.ArrayType):
+            element = self.resolve(spec.typeSpec)
+            try:
+                return Type.array(element, spec.size)
+            except SemanticError as err:
+                raise self.error(spec, str(err))
+        if isinstance(spec, ast1.ReferType):
+            try:
+                return Type.reference(self.resolve(spec.typeSpec))
+            except SemanticError as err:
+                raise self.error(spec, str(err))
+        if isinstance(spec, ast1.FuncType):
+            return self.resolve_func(spec)
+        raise self.error(spec, f'unknown type specifier {type(spec).__name__}')
+
+    def resolve_func(self, spec: ast1.FuncType, generics: Sequence[Type] = ()) -> Type:
+        params = [self.resolve(param.paramType) for param in spec.funcParamList]
+        return Type.function(params, self.resolve(spec.funcRetType), generics)
+
+    ########################################################## 类型关系
+    def is_open(self, type: Type) -> bool:
+        return type.idType in OPEN_KINDS
+
+    def is_scalar(self, type: Type) -> bool:
+        type = type.decay()
+        return type.idType in OPEN_KINDS or (type.idType == IDType.BASIC and type.basic_type in NUMERIC_RANK)
+
+    def assignable(self, target: Type, source: Type) -> bool:
+        """source 类型的值能否赋给（或传给、返回为）target 类型，数值类型之间可以隐式转换"""
+        while True:
+            target, source = target.decay(), source.decay()
+            if target is source or target.idType in OPEN_KINDS or source.idType in OPEN_KINDS:
+                return True
+            kind = target.idType
+            if kind != source.idType:
+                return False
+            if kind == IDType.BASIC:
+                return target.basic_type in NUMERIC_RANK and source.basic_type in NUMERIC_RANK
+            if kind == IDType.STRUCT:
+                return target.struct_info is source.struct_info
+            if kind == IDType.ARRAY:
+                # 未指定长度（None）的数组可以接受任意长度的数组
+                if target.size is not None and source.size is not None and target.size != source.size:
+                    return False
+                target, source = target.element_type, source.element_type
+                continue
+            if kind == IDType.FUNCTION:
+                return (len(target.param_types) == len(source.param_types) and
+                        all(self.assignable(p1, p2) for p1, p2 in zip(target.param_types, source.param_types))
+                        and self.assignable(target.func_ret_type, source.func_ret_type))
+            return False
+
+    def promote(self, left: Type, right: Type) -> Type:
+        rank = max(NUMERIC_RANK[left.basic_type], NUMERIC_RANK[right.basic_type], NUMERIC_RANK[BasicType.INT])
+        return left if NUMERIC_RANK[left.basic_type] == rank else (
+            right if NUMERIC_RANK[right.basic_type] == rank else INT)
+
+    ########################################################## 阶段一：顶层声明
+    def declare(self, root: ast1.CompUnit) -> None:
+        for decl in root.allDeclarationList:
+            generics: Tuple[Type, ...] = ()
+            if isinstance(decl, ast1.TemplateDecl):
+                generics = tuple(Type.generic(generic.ident) for generic in decl.typeNameList)
+                decl = decl.declaration
+            if isinstance(decl, ast1.StructDecl):
+                self.declare_struct(decl, generics)
+            elif isinstance(decl, ast1.TypeDefDecl):
+                self.globalSymtab.add_type(decl.ident, self.resolve(decl.typeSpec))
+            elif isinstance(decl, ast1.FuncDef):
+                self.declare_func(self.globalSymtab, decl.funcDecl, generics, decl)
+                if generics:
+                    self.templates[decl.funcDecl.ident] = decl
+            elif isinstance(decl, ast1.FuncDecl):
+                self.declare_func(self.globalSymtab, decl, generics, None)
+
+    def declare_func(self, scope: SymbolTable, decl: ast1.FuncDecl, generics: Sequence[Type],
+                     funcDef: Optional[ast1.FuncDef]) -> Type:
+        # 函数名以 const 类型登记，不能被赋值；同名声明必须签名一致，定义只能有一次
+        func_type = self.resolve_func(decl.funcType, generics).as_const()
+        symbol = scope.get_symbol_local(decl.ident)
+        if symbol is None:
+            scope.add_symbol(decl.ident, func_type)
+        elif symbol.type is not func_type:
+            raise self.error(decl, f'conflicting declaration of {decl.ident}')
+        if funcDef is not None:
+            if (id(scope), decl.ident) in self.defined:
+                raise self.error(decl, f'redefinition of {decl.ident}')
+            self.defined.add((id(scope), decl.ident))
+            self.signatures[funcDef] = func_type.remove_const()
+        return func_type
+
+    def declare_struct(self, decl: ast1.StructDecl, generics: Sequence[Type]) -> None:
+        if self.globalSymtab.get_type(decl.ident) is not None:
+            raise self.error(decl, f'redefinition of struct {decl.ident}')
+        info = StructInfo(decl.ident, generics).add_symbol_table(self.globalSymtab)
+        struct_type = Type.struct(info)
+        self.globalSymtab.add_type(decl.ident, struct_type)
+        if generics:
+            self.structTemplates[info] = decl
+        members = info.symbol_table
+        for member in decl.memberDeclList:
+            member_type = self.resolve(member.typeSpec)
+            if member_type is struct_type:
+                raise self.error(member, f'struct {decl.ident} can not contain itself')
+            if member_type is VOID:
+                raise self.error(member, f'member {member.ident} declared void')
+            if members.get_symbol_local(member.ident) is not None:
+                raise self.error(member, f'duplicate member {member.ident}')
+            info.add_struct_member(members.add_symbol(member.ident, member_type))
+        for cons in decl.consFuncDefList:
+            if cons.structType.ident != decl.ident:
+                raise self.error(cons, f'constructor of {cons.structType.ident} declared in struct {decl.ident}')
+            cons_type = self.resolve_func(cons.funcType, generics)
+            self.signatures[cons] = cons_type
+            if info.constructor is None:
+                info.constructor = Symbol(decl.ident, cons_type, None)
+        for method in decl.memberFuncDefList:
+            self.declare_func(members, method.funcDef.funcDecl, generics, method.funcDef)
+
+    ########################################################## 阶段二：作用域与语句
+    def push_scope(self, parentType: Optional[Type] = None) -> None:
+        self.symtab = SymbolTable(self.symtab, parentType)
+
+    def pop_scope(self) -> None:
+        self.symtab = self.symtab.parentSymtab
+
+    def declare_symbol(self, node: ast1.Node, name: str, type: Type, value=None) -> None:
+        if self.symtab.get_symbol_local(name) is not None:
+            raise self.error(node, f'redefinition of {name}')
+        self.symtab.add_symbol(name, type, value)
+
+    def enter_TypeSpecifier(self, node: ast1.TypeSpecifier):
+        # 类型说明符由 resolve 直接解析，不需要遍历
+        return SKIP
+
+    def enter_FuncDecl(self, node: ast1.FuncDecl):
+        return SKIP
+
+    def enter_StructDecl(self, node: ast1.StructDecl) -> None:
+        self.symtab = self.globalSymtab.get_type(node.ident).symbol_table
+
+    def leave_StructDecl(self, node: ast1.StructDecl) -> None:
+        self.pop_scope()
+
+    def enter_function(self, node: ast1.Node, func_type: Type, params: List[ast1.FuncParam],
+                       name: Optional[str]) -> None:
+        ret = func_type.func_ret_type
+        self.functions.append(FuncContext(func_type, None if ret is AUTO else ret, name, self.symtab))
+        self.push_scope(func_type)
+        for param, param_type in zip(params, func_type.param_types):
+            if param_type.decay() is VOID:
+                raise self.error(param, f'parameter {param.ident} declared void')
+            self.declare_symbol(param, param.ident, param_type)
+
+    def leave_function(self) -> Type:
+        """结束函数体，返回类型需要推导时用推导结果重建函数类型"""
+        self.pop_scope()
+        context = self.functions.pop()
+        func_type = context.funcType
+        if func_type.func_ret_type is AUTO:
+            func_type = Type.function(func_type.param_types, context.retType or VOID, func_type.generics_type_list)
+            if context.name is not None:
+                context.scope.modify_symbol_type_local(context.name, func_type.as_const())
+        return func_type
+
+    def instance_of(self, node: ast1.Node) -> Optional[Specialization]:
+        """node 是正在检查的实例的模板时返回该实例"""
+        if self.instantiating and node is self.instantiating[-1].template:
+            return self.instantiating[-1]
+        return None
+
+    def enter_FuncDef(self, node: ast1.FuncDef) -> None:
+        params = node.funcDecl.funcType.funcParamList
+        specialization = self.instance_of(node)
+        if specialization is not None:
+            self.enter_function(node, specialization.funcType, params, None)
+        else:
+            self.enter_function(node, self.signatures[node], params, node.funcDecl.ident)
+
+    def leave_FuncDef(self, node: ast1.FuncDef) -> None:
+        specialization = self.instance_of(node)
+        if specialization is not None:
+            specialization.funcType = self.leave_function()
+        else:
+            self.signatures[node] = self.leave_function()
+
+    def enter_ConsFuncDef(self, node: ast1.ConsFuncDef) -> None:
+        specialization = self.instance_of(node)
+        func_type = specialization.funcType if specialization is not None else self.signatures[node]
+        self.enter_function(node, func_type, node.funcType.funcParamList, None)
+
+    def leave_ConsFuncDef(self, node: ast1.ConsFuncDef) -> None:
+        specialization = self.instance_of(node)
+        if specialization is not None:
+            specialization.funcType = self.leave_function()
+        else:
+            self.signatures[node] = self.leave_function()
+
+    def enter_LambdaExp(self, node: ast1.LambdaExp) -> None:
+        self.enter_function(node, self.resolve_func(node.funcType), node.funcType.funcParamList, None)
+
+    def leave_LambdaExp(self, node: ast1.LambdaExp) -> None:
+        self.types[node] = self.leave_function()
+
+    def enter_BlockStmt(self, node: ast1.BlockStmt) -> None:
+        self.push_scope()
+
+    def leave_BlockStmt(self, node: ast1.BlockStmt) -> None:
+        self.pop_scope()
+
+    def leave_InitDecl(self, node: ast1.InitDecl) -> None:
+        decl_type = self.resolve(node.typeSpec) if node.typeSpec is not None else None
+        init_type = self.types[node.initVal] if node.initVal is not None else None
+        if decl_type is None:
+            if init_type is None:
+                raise self.error(node, f'can not infer type of {node.ident}')
+            decl_type = init_type.remove_const()
+        elif init_type is not None and not self.assignable(decl_type, init_type):
+            raise self.error(node, f'can not initialize {node.ident} of type {decl_type} with {init_type}')
+        if decl_type.decay() is VOID:
+            raise self.error(node, f'variable {node.ident} declared void')
+        # 声明的类型也记入 types：之后的常量折叠会替换初始值，代码生成仍按这里推导出的类型分配变量
+        self.types[node] = decl_type
+        # 没有初始值的结构体变量要调用构造函数
+        self.instantiate_struct(node, decl_type.decay())
+        value = None
+        if node.isConst:
+            decl_type = decl_type.as_const()
+            if isinstance(node.initVal, ast1.LiteralPri):
+                value = node.initVal.value
+        self.declare_symbol(node, node.ident, decl_type, value)
+
+    def check_cond(self, cond: Optional[ast1.Expression]) -> None:
+        if cond is not None and not self.is_scalar(self.types[cond]):
+            raise self.error(cond, f'condition of type {self.types[cond]} is not a scalar')
+
+    def leave_IfStmt(self, node: ast1.IfStmt) -> None:
+        self.check_cond(node.cond)
+
+    def enter_WhileStmt(self, node: ast1.WhileStmt) -> None:
+        self.enter_loop(node)
+
+    def leave_WhileStmt(self, node: ast1.WhileStmt) -> None:
+        self.functions[-1].loops -= 1
+        self.check_cond(node.cond)
+
+    def enter_ForStmt(self, node: ast1.ForStmt) -> None:
+        self.enter_loop(node)
+        self.push_scope()
+
+    def leave_ForStmt(self, node: ast1.ForStmt) -> None:
+        self.pop_scope()
+        self.functions[-1].loops -= 1
+        self.check_cond(node.cond)
+
+    def enter_loop(self, node: ast1.Stmt) -> None:
+        if not self.functions:
+            raise self.error(node, 'loop outside function')
+        self.functions[-1].loops += 1
+
+    def leave_BreakStmt(self, node: ast1.BreakStmt) -> None:
+        if not self.functions or not self.functions[-1].loops:
+            raise self.error(node, 'break statement not within loop')
+
+    def leave_ContinueStmt(self, node: ast1.ContinueStmt) -> None:
+        if not self.functions or not self.functions[-1].loops:
+            raise self.error(node, 'continue statement not within loop')
+
+    def leave_ReturnStmt(self, node: ast1.ReturnStmt) -> None:
+        if not self.functions:
+            raise self.error(node, 'return statement outside function')
+        context = self.functions[-1]
+        value_type = self.types[node.exp].remove_const() if node.exp is not None else VOID
+        if context.retType is None or context.retType is AUTO:
+            # 先遇到的 return 推导不出类型（如递归调用自身）时，由后面的 return 确定
+            context.retType = value_type
+        elif (context.retType is VOID) != (value_type is VOID):
+            raise self.error(node, f'return {value_type} in function returning {context.retType}')
+        elif not self.assignable(context.retType, value_type):
+            raise self.error(node, f'can not return {value_type} from function returning {context.retType}')
+
+    ########################################################## 表达式
+    def leave_LiteralPri(self, node: ast1.LiteralPri) -> None:
+        self.types[node] = literal_type(node)
+
+    def leave_IdentPri(self, node: ast1.IdentPri) -> None:
+        symbol = self.symtab.get_symbol(node.ident)
+        if symbol is None:
+            raise self.error(node, f'undefined identifier {node.ident}')
+        self.types[node] = symbol.type
+
+    def leave_ExpPri(self, node: ast1.ExpPri) -> None:
+        self.types[node] = self.types[node.exp]
+
+    def leave_UnaryExp(self, node: ast1.UnaryExp) -> None:
+        operand = self.types[node.exp].decay()
+        if not self.is_scalar(operand):
+            raise self.error(node, f'invalid operand to unary {node.unaryOp.name}: {operand}')
+        if node.unaryOp == UnaryOp.LOGICNOT:
+            self.types[node] = BOOL
+        elif self.is_open(operand):
+            self.types[node] = operand
+        elif node.unaryOp == UnaryOp.NOT and operand.basic_type not in INTEGRAL:
+            raise self.error(node, f'invalid operand to unary {node.unaryOp.name}: {operand}')
+        else:
+            self.types[node] = self.promote(operand, operand)
+
+    def leave_BinaryExp(self, node: ast1.BinaryExp) -> None:
+        left, right = self.types[node.leftExp].decay(), self.types[node.rightExp].decay()
+        op = node.binaryOp
+        if not (self.is_scalar(left) and self.is_scalar(right)):
+            raise self.error(node, f'invalid operands to binary {op.name}: {left} and {right}')
+        if op in BOOL_OPS:
+            self.types[node] = BOOL
+        elif self.is_open(left) or self.is_open(right):
+            self.types[node] = left if self.is_open(left) else right
+        elif op in INTEGRAL_OPS and not (left.basic_type in INTEGRAL and right.basic_type in INTEGRAL):
+            raise self.error(node, f'invalid operands to binary {op.name}: {left} and {right}')
+        else:
+            self.types[node] = self.promote(left, right)
+
+    def leave_AssignExp(self, node: ast1.AssignExp) -> None:
+        if not isinstance(node.LVal, (ast1.IdentPri, ast1.MemberExp, ast1.ArrayIndexExp)):
+            raise self.error(node, 'expression is not assignable')
+        target = self.types[node.LVal]
+        if target.isConst:
+            raise self.error(node, f'assignment to const {target}')
+        if not self.assignable(target, self.types[node.exp]):
+            raise self.error(node, f'can not assign {self.types[node.exp]} to {target}')
+        self.types[node] = target.decay()
+
+    def leave_ArrayIndexExp(self, node: ast1.ArrayIndexExp) -> None:
+        array_type = self.types[node.arrayExp]
+        index = self.types[node.indexExp].decay()
+        if not (self.is_open(index) or (index.idType == IDType.BASIC and index.basic_type in INTEGRAL)):
+            raise self.error(node, f'array index of type {index} is not an integer')
+        value = array_type.decay()
+        if self.is_open(value):
+            self.types[node] = value
+        elif value.idType != IDType.ARRAY:
+            raise self.error(node, f'subscripted value of type {value} is not an array')
+        else:
+            self.types[node] = value.element_type.with_const(array_type.isConst)
+
+    def leave_MemberExp(self, node: ast1.MemberExp) -> None:
+        object_type = self.types[node.objectExp]
+        value = object_type.decay()
+        if self.is_open(value):
+            self.types[node] = AUTO
+            return
+        if value.idType != IDType.STRUCT:
+            raise self.error(node, f'member access on non-struct type {value}')
+        members = value.symbol_table
+        symbol = members.get_symbol_local(node.MemberID) if members is not None else None
+        if symbol is None:
+            raise self.error(node, f'struct {value.struct_name} has no member {node.MemberID}')
+        member_type = symbol.type
+        if value.generics_type_list:
+            # 模板结构体的实例：成员类型中的泛型换成实例的类型实参
+            member_type = member_type.specialize({generic.generic_name: spec_type for generic, spec_type in
+                                                  zip(value.struct_info.generics_type_list, value.generics_type_list)})
+        if member_type.decay().idType == IDType.FUNCTION:
+            self.bound.add(node)
+            self.instantiate_struct(node, value)
+        self.types[node] = member_type.as_const() if object_type.isConst else member_type
+
+    def leave_ReferExp(self, node: ast1.ReferExp) -> None:
+        # 对引用再取引用得到的是对同一对象的引用
+        self.types[node] = Type.reference(self.types[node.referObjectExp].decay())
+
+    def leave_CastExp(self, node: ast1.CastExp) -> None:
+        target = self.resolve(node.typeSpec)
+        source = self.types[node.castedExp]
+        if not ((self.is_scalar(target) and self.is_scalar(source)) or self.assignable(target, source)):
+            raise self.error(node, f'invalid cast from {source} to {target}')
+        self.types[node] = target
+
+    def leave_FuncCallExp(self, node: ast1.FuncCallExp) -> None:
+        callee = self.types[node.funcExp].decay()
+        if self.is_open(callee):
+            self.types[node] = AUTO
+            return
+        if callee.idType != IDType.FUNCTION:
+            raise self.error(node, f'called object of type {callee} is not a function')
+        params = callee.param_types[1:] if node.funcExp in self.bound else callee.param_types
+        if len(params) != len(node.paramExpList):
+            raise self.error(node, f'function expects {len(params)} arguments, got {len(node.paramExpList)}')
+        if len(node.genericSpecList) > len(callee.generics_type_list):
+            raise self.error(node, f'too many generic arguments for function of type {callee}')
+        ret = callee.func_ret_type
+        template = self.template_of(node.funcExp)
+        if template is not None:
+            specialization = self.instantiate(node, template, callee, params)
+            if specialization is not None:
+                self.calls[node] = specialization
+                params = specialization.funcType.param_types
+                ret = specialization.funcType.func_ret_type
+        for param, arg in zip(params, node.paramExpList):
+            if not self.assignable(param, self.types[arg]):
+                raise self.error(arg, f'can not pass {self.types[arg]} as {param}')
+        # 泛型函数的返回类型要到实例化后才能确定
+        self.types[node] = AUTO if ret.is_generics() else ret
+
+    ########################################################## 模板实例化
+    def template_of(self, func_exp: ast1.Node) -> Optional[ast1.FuncDef]:
+        """被调用的是顶层模板函数（没有被局部名字遮蔽）时返回其定义"""
+        if not isinstance(func_exp, ast1.IdentPri) or func_exp.ident not in self.templates:
+            return None
+        if self.symtab.get_symbol(func_exp.ident) is not self.globalSymtab.get_symbol_local(func_exp.ident):
+            return None
+        return self.templates[func_exp.ident]
+
+    def instantiate(self, node: ast1.FuncCallExp, template: ast1.FuncDef, callee: Type,
+                    params: Sequence[Type]) -> Optional[Specialization]:
+        """显式给出的泛型实参在前，其余由实参类型推导；还有泛型推导不出具体类型时返回 None"""
+        generics = callee.generics_type_list
+        bindings = {generic.generic_name: self.resolve(spec) for generic, spec in zip(generics, node.genericSpecList)}
+        explicit = set(bindings)
+        for param, arg in zip(params, node.paramExpList):
+            matched, deduced = param.match_generics(self.types[arg])
+            if not matched:
+                raise self.error(arg, f'can not pass {self.types[arg]} as {param}')
+            for name, spec_type in deduced.items():
+                if name not in explicit and bindings.setdefault(name, spec_type) is not spec_type:
+                    raise self.error(arg, f'conflicting types {bindings[name]} and {spec_type} for {name}')
+        concrete = tuple(bindings.get(generic.generic_name) for generic in generics)
+        if any(spec_type is None or self.is_open(spec_type) or spec_type.is_generics() for spec_type in concrete):
+            return None
+
+        key = (template, concrete)
+        specialization = self.specializations.get(key)
+        if specialization is not None:
+            self.specHits += 1
+            return specialization
+        self.specMisses += 1
+        if len(self.instantiating) >= MAX_INSTANTIATION_DEPTH:
+            raise self.error(node, f'template instantiation depth exceeds {MAX_INSTANTIATION_DEPTH}')
+        specialization = Specialization(template, concrete, self.signatures[template].specialize(bindings))
+        # 先登记再检查，模板以相同类型递归调用自己时直接命中
+        self.specializations[key] = specialization
+        self.check_specialization(specialization, bindings)
+        return specialization
+
+    def instantiate_struct(self, node: ast1.Node, struct_type: Type) -> None:
+        """模板结构体的具体实例第一次声明变量或调用方法时，按类型实参检查它的构造函数与全部方法"""
+        if struct_type.idType != IDType.STRUCT or not struct_type.generics_type_list or struct_type.is_generics():
+            return
+        if struct_type in self.structInstances:
+            return
+        info = struct_type.struct_info
+        decl = self.structTemplates[info]
+        if len(self.instantiating) >= MAX_INSTANTIATION_DEPTH:
+            raise self.error(node, f'template instantiation depth exceeds {MAX_INSTANTIATION_DEPTH}')
+        bindings = {generic.generic_name: spec_type for generic, spec_type in
+                    zip(info.generics_type_list, struct_type.generics_type_list)}
+        members = [*decl.consFuncDefList, *(method.funcDef for method in decl.memberFuncDefList)]
+        instances = [Specialization(member, struct_type.generics_type_list,
+                                    self.signatures[member].specialize(bindings), struct_type) for member in members]
+        # 同 instantiate，先登记再检查，方法体里再用到同一实例时直接返回
+        self.structInstances[struct_type] = instances
+        for specialization in instances:
+            self.check_specialization(specialization, bindings, info.symbol_table)
+
+    def check_specialization(self, specialization: Specialization, bindings: Dict[str, Type],
+                             scope: Optional[SymbolTable] = None) -> None:
+        """以具体类型重新检查模板函数体，表达式类型记入实例自己的 types，不影响模板本身的检查结果。
+        结构体的方法在结构体的成员作用域 scope 中检查"""
+        saved = self.symtab, self.types, self.calls, self.functions, self.bindings
+        self.symtab, self.types, self.calls = scope or self.globalSymtab, specialization.types, specialization.calls
+        self.functions, self.bindings = [], bindings
+        self.instantiating.append(specialization)
+        try:
+            self.traverse(specialization.template)
+        except SemanticError as err:
+            raise SemanticError(f'{err}, in instantiation of {specialization.name}') from None
+        finally:
+            self.instantiating.pop()
+            self.symtab, self.types, self.calls, self.functions, self.bindings = saved
+
+    def leave_IOExp(self, node: ast1.IOExp) -> None:
+        io_type = self.resolve(node.typeSpec)
+        if node.ioType == IOType.SCAN:
+            symbol = self.symtab.get_symbol(node.inIdent)
+            if symbol is None:
+                raise self.error(node, f'undefined identifier {node.inIdent}')
+            if symbol.type.isConst:
+                raise self.error(node, f'scan into const {node.inIdent}')
+            self.types[node] = io_type
+        else:
+            if not self.assignable(io_type, self.types[node.outExp]):
+                raise self.error(node, f'can not print {self.types[node.outExp]} as {io_type}')
+            self.types[node] = VOID
+
+
+def analyze(root: ast1.CompUnit) -> SemanticAnalyzer:
+    """对整个编译单元做语义分析，出错时抛出 SemanticError"""
+    return SemanticAnalyzer().analyze(root)
@@ -1,6 +1,5 @@
 from __future__ import annotations
-import copy
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from type import Type
 
 
@@ -12,14 +11,28 @@ class Symbol(object):
 
 
 class SymbolTable(object):
-    """符号表，需要记录其父符号表的引用和域类型（函数或结构体）"""
+    """符号表，需要记录其父符号表的引用和域类型（函数或结构体）
+
+    向上查找名字时用循环代替递归，查找结果缓存在发起查找的表中（symbolCache/typeCache），
+    下次先看自己的缓存，逐层向上时也会命中外层表的缓存。
+    同一棵符号表树共享 versions：任何一层添加或修改名字 name 时 versions[name] 加一，
+    缓存项记录查找时的版本号，版本号不一致即失效，所以只有被遮蔽或修改的名字需要重新查找。
+
+    clone() 是写时复制的：克隆与原表共用 typeTable/symbolTable，任何一方第一次写某个表时才浅拷贝该表，
+    Symbol 与 Type 始终共享，不复制；修改符号类型时换成新的 Symbol，不原地修改。"""
     def __init__(self, parentSymtab: Optional[SymbolTable], parentType: Optional[Type]) -> None:
         self.parentSymtab = parentSymtab
         self.parentType = parentType
         self.typeTable: Dict[str, Type] = {}
         self.symbolTable: Dict[str, Symbol] = {}
+        self.ownsTypes = True  # False 表示 typeTable 与克隆共用，写之前要先复制
+        self.ownsSymbols = True
+        self.typeCache: Dict[str, Tuple[int, Optional[Type]]] = {}
+        self.symbolCache: Dict[str, Tuple[int, Optional[Symbol]]] = {}
+        self.versions: Dict[str, int] = parentSymtab.versions if parentSymtab else {}
         self.tmpIndex = 0
         self.isGlobal = self.is_global()
+        self.globalSymtab = parentSymtab.globalSymtab if parentSymtab else self
 
     def is_global(self) -> bool:
         if self.parentSymtab:
@@ -27,18 +40,32 @@ class SymbolTable(object):
         return True
 
     def get_global(self) -> SymbolTable:
-        if self.isGlobal:
-            return self
-        else:
-            return self.parentSymtab.get_global()
+        return self.globalSymtab
+
+    def touch(self, name: str) -> None:
+        self.versions[name] = self.versions.get(name, 0) + 1
+
+    def writable_types(self) -> Dict[str, Type]:
+        if not self.ownsTypes:
+            self.typeTable = dict(self.typeTable)
+            self.ownsTypes = True
+        return self.typeTable
+
+    def writable_symbols(self) -> Dict[str, Symbol]:
+        if not self.ownsSymbols:
+            self.symbolTable = dict(self.symbolTable)
+            self.ownsSymbols = True
+        return self.symbolTable
 
     def add_symbol(self, name: str, type: Type, value: Optional[int] = None) -> Symbol:
         new_symbol = Symbol(name, type, value)
-        self.symbolTable[name] = new_symbol
+        self.writable_symbols()[name] = new_symbol
+        self.touch(name)
         return new_symbol
 
     def add_type(self, name: str, type: Type) -> str:
-        self.typeTable[name] = type
+        self.writable_types()[name] = type
+        self.touch(name)
         return name
 
     def add_tmp_type(self, type: Type) -> str:
@@ -48,16 +75,40 @@ class SymbolTable(object):
         return name
 
     def get_type(self, name: str) -> Type:
-        if name in self.typeTable:
-            return self.typeTable[name]
-        if self.parentSymtab:
-            return self.parentSymtab.get_type(name)
+        found = self.typeTable.get(name)
+        if found is not None:
+            return found
+        version = self.versions.get(name, 0)
+        table = self
+        while table is not None:
+            found = table.typeTable.get(name)
+            if found is not None:
+                break
+            cached = table.typeCache.get(name)
+            if cached is not None and cached[0] == version:
+                found = cached[1]
+                break
+            table = table.parentSymtab
+        self.typeCache[name] = (version, found)
+        return found
 
     def get_symbol(self, name: str) -> Symbol:
-        if name in self.symbolTable:
-            return self.symbolTable[name]
-        if self.parentSymtab:
-            return self.parentSymtab.get_symbol(name)
+        found = self.symbolTable.get(name)
+        if found is not None:
+            return found
+        version = self.versions.get(name, 0)
+        table = self
+        while table is not None:
+            found = table.symbolTable.get(name)
+            if found is not None:
+                break
+            cached = table.symbolCache.get(name)
+            if cached is not None and cached[0] == version:
+                found = cached[1]
+                break
+            table = table.parentSymtab
+        self.symbolCache[name] = (version, found)
+        return found
 
     def get_symbol_local(self, name: str) -> Optional[Symbol]:
         if name in self.symbolTable:
@@ -67,18 +118,22 @@ class SymbolTable(object):
 
     def modify_type_local(self, name: str, type: Type) -> Type:
         if name in self.typeTable:
-            self.typeTable[name] = type
+            self.writable_types()[name] = type
+            self.touch(name)
             return type
 
     def modify_symbol_type_local(self, name: str, type: Type) -> Symbol:
         if name in self.symbolTable:
             old_symbol = self.symbolTable[name]
-            self.symbolTable[name] = Symbol(old_symbol.name, type, old_symbol.value)
+            self.writable_symbols()[name] = Symbol(old_symbol.name, type, old_symbol.value)
+            self.touch(name)
             return self.symbolTable[name]
 
     def clone(self) -> SymbolTable:
         tmp_symbol_table = SymbolTable(self.parentSymtab, self.parentType)
-        tmp_symbol_table.typeTable = copy.deepcopy(self.typeTable)
-        tmp_symbol_table.symbolTable = copy.deepcopy(self.symbolTable)
+        tmp_symbol_table.typeTable = self.typeTable
+        tmp_symbol_table.symbolTable = self.symbolTable
+        tmp_symbol_table.ownsTypes = tmp_symbol_table.ownsSymbols = False
+        self.ownsTypes = self.ownsSymbols = False
         tmp_symbol_table.tmpIndex = self.tmpIndex
         return tmp_symbol_table
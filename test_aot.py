@@ -0,0 +1,78 @@
+import ctypes
+import os
+import shutil
+import sys
+import pytest
+import complier
+
+pytest.importorskip('llvmlite')
+
+DOT = 'func dot(f64[]: a, f64[]: b, int: n) = f64 {\n' \
+      '    var f64: s = 0.0;\n' \
+      '    for (var int: i = 0; n > i; i = i + 1) { s = s + a[i] * b[i]; }\n' \
+      '    return s;\n' \
+      '}\n'
+SCALE = 'func scale(int: a) = int { return a * 3; }\n'
+
+needs_linker = pytest.mark.skipif(shutil.which(os.environ.get('CC', 'cc')) is None, reason='no C compiler to link')
+
+# ELF 头中 e_machine 字段的取值
+EM_X86_64 = 62
+EM_AARCH64 = 183
+
+
+@pytest.fixture
+def sources(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'dot.mo').write_text(DOT)
+    (tmp_path / 'scale.mo').write_text(SCALE)
+    return tmp_path
+
+
+def elf_machine(path) -> int:
+    with open(path, 'rb') as f:
+        header = f.read(20)
+    assert header[:4] == b'\x7fELF'
+    return int.from_bytes(header[18:20], 'little')
+
+
+def test_emit_object(sources):
+    output_dir = sources / 'out'
+    output_dir.mkdir()
+    result = complier.compile_file('dot.mo', output_dir=str(output_dir), emit_obj=True)
+    assert result.error is None
+    assert result.output == str(output_dir / 'dot.mo.o')
+    assert set(result.stages) >= {'parse', 'codegen', 'optimize', 'emit'}
+    if sys.platform.startswith('linux'):
+        assert elf_machine(result.output) in (EM_X86_64, EM_AARCH64)
+
+
+def test_cross_compile_object(sources, run_cli):
+    assert run_cli('-c', '--target', 'aarch64-unknown-linux-gnu', 'dot.mo')[0] == 0
+    assert elf_machine(sources / 'dot.mo.o') == EM_AARCH64
+
+
+def test_unknown_target_is_reported(sources, run_cli):
+    code, output = run_cli('-c', '--target', 'nonsense-unknown-none', 'dot.mo')
+    assert code == 1
+    assert 'unknown target' in output
+
+
+@needs_linker
+def test_shared_library_round_trip(sources, run_cli):
+    assert run_cli('--shared', str(sources / 'libk.so'), 'dot.mo', 'scale.mo')[0] == 0
+    # 没有 -o 与 -c 时目标文件只在临时目录里
+    assert sorted(os.listdir(sources)) == ['dot.mo', 'libk.so', 'scale.mo']
+    library = ctypes.CDLL(str(sources / 'libk.so'))
+    library.dot.restype = ctypes.c_double
+    library.dot.argtypes = [ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double), ctypes.c_int32]
+    a = (ctypes.c_double * 3)(1.0, 2.0, 3.0)
+    b = (ctypes.c_double * 3)(4.0, 5.0, 6.0)
+    assert library.dot(a, b, 3) == 32.0
+    assert library.scale(14) == 42
+
+
+@needs_linker
+def test_shared_library_keeps_objects_with_c(sources, run_cli):
+    assert run_cli('-c', '--shared', str(sources / 'libk.so'), 'dot.mo', 'scale.mo')[0] == 0
+    assert {'dot.mo.o', 'scale.mo.o', 'libk.so'} <= set(os.listdir(sources))
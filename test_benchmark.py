@@ -0,0 +1,45 @@
+import pytest
+import ast1
+import benchmark
+import printer
+import semantic
+import visitor
+
+
+@pytest.mark.parametrize('name', sorted(benchmark.GENERATORS))
+def test_generated_source_parses(name):
+    code_str = benchmark.GENERATORS[name](20)
+    assert benchmark.lex_all(code_str) > 0
+    root = benchmark.parse_all(code_str)
+    assert benchmark.count_nodes(root) > 20
+    semantic.analyze(root)
+
+
+@pytest.mark.parametrize('name', sorted(benchmark.GENERATORS))
+def test_generated_source_scales(name):
+    small = benchmark.count_nodes(benchmark.parse_all(benchmark.GENERATORS[name](10)))
+    large = benchmark.count_nodes(benchmark.parse_all(benchmark.GENERATORS[name](40)))
+    assert large > small
+
+
+def test_best_of_returns_fastest_and_result():
+    elapsed, result = benchmark.best_of(lambda: 42, 3)
+    assert elapsed >= 0.0
+    assert result == 42
+
+
+def test_ast_nodes_have_no_dict():
+    root = benchmark.parse_all(benchmark.gen_mixed(10))
+    nodes = [node for node in visitor.walk(root)]
+    assert len(nodes) == benchmark.count_nodes(root)
+    assert not any(hasattr(node, '__dict__') for node in nodes)
+
+
+def test_copy_tree_mirrors_fields():
+    root = benchmark.parse_all(benchmark.gen_binary_chain(2000))
+    slotted = benchmark.copy_tree(root, object.__new__)
+    assert slotted is not root and benchmark.count_nodes(slotted) == benchmark.count_nodes(root)
+    assert printer.dumps(slotted) == printer.dumps(root)
+    mirrored = benchmark.copy_tree(root, lambda cls: benchmark.dict_class(cls)())
+    assert type(mirrored).__name__ == 'CompUnit'
+    assert set(vars(mirrored)) == set(ast1.field_names(type(root)))
@@ -0,0 +1,121 @@
+import os
+import shutil
+import ply.lex
+import ply.yacc
+import pytest
+import cache
+import complier
+import lexer
+import parser
+import semantic
+from cache import ObjectCache
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+SOURCE = '''
+func add(int: a, int: b) = int { return a + b; }
+func main() = int { print<int>(add(2, 3)); return 0; }
+'''
+
+
+@pytest.fixture
+def table_root(tmp_path, monkeypatch):
+    monkeypatch.setenv('MATRIX_ONLY_CACHE', str(tmp_path))
+    return tmp_path
+
+
+def table_dirs(root) -> list:
+    return sorted(path.name.rsplit('-', 1)[0] for path in root.iterdir())
+
+
+def fail(*args, **kwargs):
+    raise AssertionError('tables were regenerated')
+
+
+def test_second_build_loads_cached_tables(table_root, monkeypatch):
+    lexer.build_cached_lexer()
+    parser.build_cached_parser()
+    assert table_dirs(table_root) == ['ply-lex', 'ply-yacc']
+    monkeypatch.setattr(ply.lex, 'lex', fail)
+    monkeypatch.setattr(ply.yacc, 'yacc', fail)
+    lex = lexer.build_cached_lexer()
+    lexer.init_lexer_context(lex)
+    root = parser.build_cached_parser().parse(SOURCE, lexer=lex)
+    assert [decl.__class__.__name__ for decl in root.allDeclarationList] == ['FuncDef', 'FuncDef']
+
+
+def test_source_change_moves_and_prunes_tables(table_root, tmp_path_factory, monkeypatch):
+    parser.build_cached_parser()
+    old_dir = next(table_root.glob('ply-yacc-*'))
+    # 改动文法源码（这里只加一行注释）后 source_key 变化，表写到新目录，旧目录被删除
+    changed = tmp_path_factory.mktemp('src') / 'parser.py'
+    shutil.copyfile(parser.__file__, changed)
+    with open(changed, 'a') as f:
+        f.write('# changed\n')
+    monkeypatch.setattr(parser, '__file__', str(changed))
+    parser.build_cached_parser()
+    new_dirs = list(table_root.glob('ply-yacc-*'))
+    assert len(new_dirs) == 1 and new_dirs[0] != old_dir
+    assert (new_dirs[0] / 'parsetab.pickle').exists()
+
+
+def test_table_builds_do_not_write_source_tree(table_root):
+    def snapshot():
+        return {entry.name: entry.stat().st_mtime_ns for entry in os.scandir(PACKAGE_DIR)
+                if entry.name != '__pycache__'}
+    before = snapshot()
+    lexer.build_cached_lexer()
+    parser.build_cached_parser()
+    assert snapshot() == before
+    assert not any(name.endswith('.tmp') for name in os.listdir(next(table_root.glob('ply-yacc-*'))))
+
+
+def test_object_cache_get_put(tmp_path):
+    cache = ObjectCache(str(tmp_path), 1 << 20)
+    assert cache.get('k') is None
+    cache.put('k', b'data')
+    assert cache.get('k') == b'data'
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_object_cache_evicts_least_recently_used(tmp_path):
+    cache = ObjectCache(str(tmp_path), 250)
+    # 直接设定 mtime 固定使用顺序，不依赖文件系统的时间精度
+    cache.put('a', bytes(100))
+    os.utime(cache.path('a'), (1, 1))
+    cache.put('b', bytes(100))
+    os.utime(cache.path('b'), (2, 2))
+    os.utime(cache.path('a'), (3, 3))
+    cache.put('c', bytes(100))
+    assert cache.get('b') is None
+    assert cache.get('a') is not None and cache.get('c') is not None
+    assert cache.evictions == 1
+
+
+def test_jit_cache_hit_on_second_run(tmp_path, capfd):
+    pytest.importorskip('llvmlite')
+    source = tmp_path / 'main.mo'
+    source.write_text(SOURCE)
+    cache = ObjectCache(str(tmp_path / 'jit'), 1 << 20)
+    results = [complier.compile_file(str(source), run_jit=True, jit_cache=cache) for _ in range(2)]
+    assert [result.exit_code for result in results] == [0, 0]
+    assert 'optimize' in results[0].stages and 'optimize' not in results[1].stages
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert capfd.readouterr().out == '5\n5\n'
+
+
+def test_jit_cache_key_depends_on_options(tmp_path):
+    pytest.importorskip('llvmlite')
+    import codegen
+    import jit
+    from pipeline import PipelineOptions
+    root = complier.parse_source(SOURCE)
+    module = codegen.generate(root, semantic.analyze(root)).module
+    cache = ObjectCache(str(tmp_path), 1 << 20)
+    first = jit.compile_module(module, PipelineOptions(2), cache)
+    assert not first.cacheHit and first.report is not None
+    again = jit.compile_module(module, PipelineOptions(2), cache)
+    assert again.cacheHit and again.report is None
+    assert again.function('add')(40, 2) == 42
+    assert not jit.compile_module(module, PipelineOptions(1), cache).cacheHit
+    assert not jit.compile_module(module, PipelineOptions(2), cache, cpu='native').cacheHit
@@ -0,0 +1,71 @@
+import pytest
+import complier
+import constfold
+import semantic
+from error import CodegenError
+
+pytest.importorskip('llvmlite')
+import codegen  # noqa: E402
+
+GLOBAL_CONST = '''
+const f32: a = 1.5;
+func main() = int {
+    var b = a * a;
+    var f32: c = b;
+    print<f32>(c);
+    return 0;
+}
+'''
+
+LOCAL_CONST = '''
+func main() = int {
+    const f32: a = 1.5;
+    var b = a * a;
+    var c = a * 2.0;
+    return 0;
+}
+'''
+
+
+def lower(code_str: str, fold: bool = True) -> str:
+    root = complier.parse_source(code_str)
+    analyzer = semantic.analyze(root)
+    if fold:
+        constfold.fold_constants(root)
+    return str(codegen.generate(root, analyzer).module)
+
+
+def test_folded_global_const_runs(tmp_path, capfd):
+    source = tmp_path / 'global.mo'
+    source.write_text(GLOBAL_CONST)
+    result = complier.compile_file(str(source), run_jit=True)
+    assert result.error is None
+    assert result.exit_code == 0
+    assert capfd.readouterr().out == '2.25\n'
+
+
+@pytest.mark.parametrize('fold', [False, True])
+def test_auto_variables_keep_analyzed_type(fold):
+    ir_text = lower(LOCAL_CONST, fold)
+    assert '%"b" = alloca float' in ir_text
+    assert '%"c" = alloca double' in ir_text
+
+
+def test_ir_type_errors_are_codegen_errors(monkeypatch):
+    # 不做类型转换时 llvmlite 会拒绝把 f32 存进 f64 变量
+    monkeypatch.setattr(codegen.CodeGenerator, 'convert', lambda self, value, source, target: value)
+    with pytest.raises(CodegenError, match='invalid IR'):
+        lower('func main() = int { const f32: a = 1.5; var f64: b = a; return 0; }', fold=False)
+
+
+def test_zero_length_array_is_sized():
+    ir_text = lower('''
+        func first(int[]: a) = int { return 0; }
+        func main() = int {
+            var int[0]: z;
+            return first(z);
+        }
+    ''')
+    assert '%"z" = alloca [0 x i32]' in ir_text
+    # 传给未指定长度的形参时退化为首元素指针
+    assert 'getelementptr inbounds [0 x i32], [0 x i32]* %"z", i32 0, i32 0' in ir_text
@@ -0,0 +1,130 @@
+import struct
+import pytest
+import ast1
+import complier
+import constfold
+import semantic
+from enums import BasicType
+from visitor import walk
+
+F32_SOURCE = '''
+const f32: x = 1.1;
+const f32: y = 3.0;
+const f32: z = 0.7;
+const f16: h = 0.1;
+func mul() = f32 { return x * y; }
+func chain() = f32 { return (x * y + z) / y - x; }
+func cast() = f32 { return ((f32)1.1) * ((f32)3.0); }
+func mixed() = f64 { return x * 3.0; }
+func half() = f16 { return h + h + h; }
+func local() = f32 { var a = x * y; return a * a - x / y; }
+func compare() = bool { return x * y == 3.3; }
+func truncate() = int { return (int)(x * y * 1000.0); }
+'''
+
+
+def f32(value: float) -> float:
+    return struct.unpack('f', struct.pack('f', value))[0]
+
+
+def f16(value: float) -> float:
+    return struct.unpack('e', struct.pack('e', value))[0]
+
+
+def folded_returns(code_str: str) -> dict:
+    """折叠后各函数第一个 return 语句的表达式，按函数名"""
+    root = complier.parse_source(code_str)
+    semantic.analyze(root)
+    constfold.fold_constants(root)
+    return {decl.funcDecl.ident: next(node.exp for node in walk(decl) if isinstance(node, ast1.ReturnStmt))
+            for decl in root.allDeclarationList if isinstance(decl, ast1.FuncDef)}
+
+
+def literal(node: ast1.Node):
+    assert isinstance(node, ast1.LiteralPri)
+    return node.value, semantic.literal_type(node).basic_type
+
+
+def test_int_arithmetic():
+    exps = folded_returns('''
+        func a() = int { return 1 + 2 * 3; }
+        func b() = int { return -7 / 2; }
+        func c() = int { return -7 % 2; }
+        func d() = int { return 2147483647 + 1; }
+        func e() = int { return 1 << 4 | 1; }
+        func f() = bool { return 2 > 1 && 3 > 4; }
+    ''')
+    assert literal(exps['a']) == (7, BasicType.INT)
+    assert literal(exps['b']) == (-3, BasicType.INT)
+    assert literal(exps['c']) == (-1, BasicType.INT)
+    assert literal(exps['d']) == (-2147483648, BasicType.INT)
+    assert literal(exps['e']) == (17, BasicType.INT)
+    assert literal(exps['f']) == (False, BasicType.BOOL)
+
+
+def test_runtime_errors_are_not_folded():
+    exps = folded_returns('''
+        func a() = int { return 1 / 0; }
+        func b() = int { return 1 << 32; }
+        func c() = f64 { return 1.0 % 0.0; }
+    ''')
+    assert all(isinstance(exp, ast1.BinaryExp) for exp in exps.values())
+
+
+def test_const_propagation_respects_shadowing():
+    exps = folded_returns('''
+        const int: n = 4;
+        func a() = int { return n * n; }
+        func b(int: n) = int { return n * 2; }
+        func c() = int { var int: n = 1; return n + 1; }
+    ''')
+    assert literal(exps['a']) == (16, BasicType.INT)
+    assert isinstance(exps['b'], ast1.BinaryExp)
+    assert isinstance(exps['c'], ast1.BinaryExp)
+
+
+def test_f32_intermediates_are_rounded():
+    exps = folded_returns(F32_SOURCE)
+    product = f32(f32(1.1) * 3.0)
+    assert literal(exps['mul']) == (product, BasicType.F32)
+    assert product != f32(1.1) * 3.0
+    assert literal(exps['chain']) == (f32(f32(f32(product + f32(0.7)) / 3.0) - f32(1.1)), BasicType.F32)
+    assert literal(exps['cast']) == (f32(f32(1.1) * f32(3.0)), BasicType.F32)
+    # f32 与 f64 字面量运算时提升为 f64，不舍入
+    assert literal(exps['mixed']) == (f32(1.1) * 3.0, BasicType.F64)
+
+
+def test_f16_intermediates_are_rounded():
+    value, basic_type = literal(folded_returns(F32_SOURCE)['half'])
+    tenth = f16(0.1)
+    assert basic_type == BasicType.F16
+    assert value == f16(f16(tenth + tenth) + tenth)
+
+
+def test_int_operand_is_converted_to_float_type():
+    exps = folded_returns('''
+        const f32: big = 16777216.0;
+        func a() = bool { return 16777217 == big; }
+        func b() = f32 { return 16777217 + big; }
+    ''')
+    assert literal(exps['a']) == (True, BasicType.BOOL)
+    assert literal(exps['b']) == (33554432.0, BasicType.F32)
+
+
+def test_folded_code_matches_unfolded_code():
+    pytest.importorskip('llvmlite')
+    import codegen
+    import jit
+    from pipeline import PipelineOptions
+
+    def run(fold: bool) -> dict:
+        root = complier.parse_source(F32_SOURCE)
+        analyzer = semantic.analyze(root)
+        if fold:
+            constfold.fold_constants(root)
+        module = jit.compile_module(codegen.generate(root, analyzer).module, PipelineOptions(0))
+        return {name: function() for name, function in module.functions().items()}
+
+    unfolded, folded = run(False), run(True)
+    assert set(unfolded) >= {'mul', 'chain', 'cast', 'mixed', 'local', 'compare', 'truncate'}
+    assert folded == unfolded
@@ -0,0 +1,48 @@
+import sys
+import pytest
+import ast1
+import benchmark
+import complier
+import constfold
+import printer
+import semantic
+from visitor import walk
+
+TERMS = 12000
+
+
+@pytest.fixture
+def low_recursion_limit():
+    # 限制调低后，任何按树深度递归的处理都会抛出 RecursionError
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(500)
+    yield
+    sys.setrecursionlimit(limit)
+
+
+def test_deep_chain_front_end(low_recursion_limit):
+    root = complier.parse_source(benchmark.gen_binary_chain(TERMS))
+    text = printer.dumps(root)
+    assert text.count('BinaryExp') == TERMS - 1
+    semantic.analyze(root)
+    # 链中 a 之后按优先级结合的常量子表达式会被折叠，其余部分保持原样
+    folded = constfold.fold_constants(root)
+    assert folded > 0
+    assert sum(isinstance(node, ast1.BinaryExp) for node in walk(root)) == TERMS - 1 - folded
+    assert printer.dumps(root).count('BinaryExp') == TERMS - 1 - folded
+
+
+def test_deep_constant_chain_folds(low_recursion_limit):
+    code_str = benchmark.gen_binary_chain(TERMS).replace('(int: a)', '()').replace('return a', 'return 1')
+    root = complier.parse_source(code_str)
+    assert constfold.fold_constants(root) == TERMS - 1
+    returned = next(node for node in walk(root) if isinstance(node, ast1.ReturnStmt))
+    assert isinstance(returned.exp, ast1.LiteralPri)
+
+
+def test_deep_chain_codegen(low_recursion_limit):
+    pytest.importorskip('llvmlite')
+    import codegen
+    root = complier.parse_source(benchmark.gen_binary_chain(TERMS))
+    module = codegen.generate(root, semantic.analyze(root)).module
+    assert str(module).count(' = add ') > TERMS // 4
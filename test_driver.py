@@ -0,0 +1,37 @@
+import pytest
+import complier
+
+GOOD = 'func add(int: a, int: b) = int { return a + b; }\n'
+BAD = 'func broken(int: a) = int { return a + ; }\n'
+
+
+@pytest.fixture
+def batch(tmp_path):
+    (tmp_path / 'a.mo').write_text(GOOD)
+    (tmp_path / 'b.mo').write_text(GOOD.replace('add', 'sub').replace('+', '-'))
+    (tmp_path / 'bad.mo').write_text(BAD)
+    return tmp_path
+
+
+def test_compile_all_in_process_pool(batch):
+    sources = [str(batch / name) for name in ('a.mo', 'bad.mo', 'b.mo')]
+    results = complier.compile_all(sources, 2, str(batch))
+    # 结果与输入顺序一致
+    assert [result.source_file for result in results] == sources
+    assert [result.error is None for result in results] == [True, False, True]
+    assert 'Syntax error at line 1' in results[1].error
+
+
+def test_parallel_cli_reports_bad_file(batch, run_cli):
+    output_dir = batch / 'out'
+    code, output = run_cli('-j', '2', '-o', str(output_dir), str(batch / '*.mo'))
+    assert code == 1
+    assert f'{batch / "bad.mo"}: Syntax error at line 1' in output
+    assert '2 succeeded, 1 failed, 3 files' in output
+    assert sorted(path.name for path in output_dir.iterdir()) == ['a.mo.ast', 'b.mo.ast']
+    assert 'sub' in (output_dir / 'b.mo.ast').read_text()
+
+
+def test_expand_sources_sorts_globs(batch):
+    assert complier.expand_sources([str(batch / '*.mo'), 'x.mo']) == \
+        [str(batch / name) for name in ('a.mo', 'b.mo', 'bad.mo')] + ['x.mo']
@@ -0,0 +1,117 @@
+import os
+import pickle
+import pytest
+import benchmark
+import complier
+import flatast
+from error import ParseError
+
+SAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test', 'variable')
+
+
+def encode(root) -> bytes:
+    # 平铺后的字节串包含节点种类、行号与全部字段，相等即两棵树完全相同
+    return flatast.flatten(root).to_bytes()
+
+
+def chunks(text: str, size: int):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+@pytest.fixture(params=['lf', 'crlf'])
+def source_file(request, tmp_path):
+    code_str = benchmark.gen_mixed(30)
+    newline = '\r\n' if request.param == 'crlf' else '\n'
+    path = tmp_path / f'mixed_{request.param}.mo'
+    path.write_bytes(code_str.replace('\n', newline).encode('utf8'))
+    return str(path)
+
+
+def test_read_stream_and_mmap_agree(source_file):
+    with open(source_file, 'r', encoding='utf8') as f:
+        expected = encode(complier.parse_source(f.read()))
+    with open(source_file, 'r', encoding='utf8') as f:
+        assert encode(complier.parse_stream(f)) == expected
+    assert encode(complier.parse_mapped(source_file)) == expected
+
+
+@pytest.mark.parametrize('size', [1, 7, 4096])
+def test_stream_chunk_boundaries(source_file, size):
+    with open(source_file, 'r', encoding='utf8') as f:
+        code_str = f.read()
+    assert encode(complier.parse_stream(chunks(code_str, size))) == encode(complier.parse_source(code_str))
+
+
+def test_crlf_sample_file():
+    # 仓库自带的样例是 CRLF 换行
+    with open(SAMPLE, 'rb') as f:
+        assert b'\r\n' in f.read()
+    with open(SAMPLE, 'r', encoding='utf8') as f:
+        expected = encode(complier.parse_source(f.read()))
+    with open(SAMPLE, 'r', encoding='utf8') as f:
+        assert encode(complier.parse_stream(f)) == expected
+    assert encode(complier.parse_mapped(SAMPLE)) == expected
+
+
+def test_flat_ast_round_trip(source_file):
+    root = complier.parse_mapped(source_file)
+    flat = flatast.FlatAST.from_bytes(encode(root))
+    assert encode(flatast.unflatten(flat)) == encode(root)
+
+
+def test_flat_ast_payload_values_round_trip():
+    root = complier.parse_source('func f(f64: x) = f64 {\n'
+                                 '    var int: big = 123456789012345678901234567890;\n'
+                                 '    var bool: b = !(x > 1.25);\n'
+                                 '    return -x * 2.5 + 0.1;\n'
+                                 '}\n')
+    flat = flatast.FlatAST.from_bytes(encode(root))
+    assert flat.payloads == flatast.flatten(root).payloads
+    assert encode(flatast.unflatten(flat)) == encode(root)
+
+
+class Exploit(object):
+    def __reduce__(self):
+        return os.system, ('exit 1',)
+
+
+def test_flat_ast_rejects_foreign_metadata():
+    data = encode(complier.parse_source('func f() = int { return 1; }'))
+    header = flatast.FlatAST.HEADER
+    _, count, meta_size = header.unpack_from(data)
+    columns = data[header.size:len(data) - meta_size]
+    # 元数据换成 pickle 数据时只会被当作格式错误，不会被反序列化执行
+    meta = pickle.dumps(([], [(Exploit(),)]))
+    with pytest.raises(ValueError):
+        flatast.FlatAST.from_bytes(header.pack(flatast.FlatAST.MAGIC, count, len(meta)) + columns + meta)
+    with pytest.raises(ValueError):
+        flatast.FlatAST.from_bytes(data[:len(data) - 3])
+    with pytest.raises(ValueError):
+        flatast.FlatAST.from_bytes(b'MOFA')
+
+
+def test_compile_file_modes_print_same_ast(source_file):
+    outputs = [complier.compile_file(source_file, keep_output=True, stream=stream, mapped=mapped).output
+               for stream, mapped in ((False, False), (True, False), (False, True))]
+    assert outputs[0] and outputs[0] == outputs[1] == outputs[2]
+
+
+def test_mmap_empty_file(tmp_path):
+    path = tmp_path / 'empty.mo'
+    path.write_bytes(b'')
+    assert complier.parse_mapped(str(path)).allDeclarationList == []
+
+
+def test_mmap_reports_same_error_line(tmp_path):
+    # 注释里的非 ASCII 字节与 \r 都不应影响按字节匹配时的行号
+    path = tmp_path / 'bad.mo'
+    path.write_bytes('# 注释\r\nfunc f() = int {\r\n    return 0 +;\r\n}\r\n'.encode('utf8'))
+    with pytest.raises(ParseError, match='line 3: ;'):
+        complier.parse_mapped(str(path))
+    with open(path, 'r', encoding='utf8') as f:
+        with pytest.raises(ParseError, match='line 3: ;'):
+            complier.parse_source(f.read())
+
+
+def test_mmap_cli_output(source_file, run_cli):
+    assert run_cli('--mmap', source_file) == run_cli(source_file)
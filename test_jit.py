@@ -0,0 +1,90 @@
+import pytest
+import complier
+import semantic
+from error import CodegenError
+
+pytest.importorskip('llvmlite')
+import codegen  # noqa: E402
+import jit  # noqa: E402
+from pipeline import PipelineOptions  # noqa: E402
+
+SOURCE = '''
+var int: counter = 40 + 2;
+func add(int: a, int: b) = int { return a + b; }
+func scale(f64: x) = f64 { return x * 1.5; }
+func main() = int {
+    print<int>(add(counter, 1));
+    print<f64>(scale(2.0));
+    return 3;
+}
+'''
+
+
+BOX = '''
+template<T>
+struct Box {
+    T : value;
+    func Box(&Box<T>: self) { self.value = (T)40; }
+    func get(&Box<T>: self) = T { return self.value; }
+    func add(&Box<T>: self, T: x) = T {
+        self.value = self.value + x;
+        return self.get();
+    }
+};
+func main() = int {
+    var Box<int>: b;
+    b.add(2);
+    var Box<f64>: d;
+    print<f64>(d.add(0.5));
+    return b.get();
+}
+'''
+
+
+def compile_source(code_str: str, **kwargs) -> jit.JITModule:
+    root = complier.parse_source(code_str)
+    return jit.compile_module(codegen.generate(root, semantic.analyze(root)).module, **kwargs)
+
+
+def test_run_main(tmp_path, capfd):
+    source = tmp_path / 'main.mo'
+    source.write_text(SOURCE)
+    result = complier.compile_file(str(source), run_jit=True)
+    assert result.error is None
+    assert result.exit_code == 3
+    assert capfd.readouterr().out == '43\n3\n'
+
+
+def test_exported_functions_are_callable():
+    module = compile_source(SOURCE)
+    assert module.function('add')(2, 5) == 7
+    assert module.function('scale')(4.0) == 6.0
+    assert set(module.functions()) == {'add', 'scale', 'main'}
+
+
+def test_missing_function_is_codegen_error():
+    with pytest.raises(CodegenError, match='not defined'):
+        compile_source(SOURCE).function('missing')
+
+
+@pytest.mark.parametrize('opt', [0, 3])
+def test_optimization_levels_agree(opt):
+    module = compile_source(SOURCE, options=PipelineOptions(opt))
+    assert module.function('add')(20, 22) == 42
+    assert module.report.options.opt == opt
+
+
+def test_native_cpu():
+    module = compile_source(SOURCE, cpu='native')
+    assert module.function('scale')(2.0) == 3.0
+
+
+def test_functions_outlive_module_reference():
+    add = compile_source(SOURCE).function('add')
+    assert add(1, 2) == 3
+
+
+def test_template_struct_methods(capfd):
+    module = compile_source(BOX)
+    assert module.function('main')() == 42
+    assert capfd.readouterr().out == '40.5\n'
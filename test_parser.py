@@ -0,0 +1,117 @@
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import ast1
+import benchmark
+import complier
+import printer
+from lexer import LexerContext, create_lexer
+
+THREADS = 8
+
+
+def scoped_source(i: int) -> str:
+    # 第 i 份源码声明 S{i}/T{i}，其余线程的 struct/typedef 名在这里只是普通变量名，
+    # lexer hack 状态若在线程间泄漏，这些变量名会被识别成 STRUCTID/TYPEDEFID 而解析失败
+    others = ''.join(f'    var int: S{j} = {j};\n    var int: T{j} = S{j};\n' for j in range(THREADS) if j != i)
+    return (f'struct S{i} {{ int: x; }};\ntypedef T{i} = S{i};\n'
+            f'func f{i}(T{i}: p) = int {{\n{others}    return p.x;\n}}\n')
+
+
+def test_threads_keep_separate_lexer_state():
+    sources = [scoped_source(i) for i in range(THREADS)]
+    expected = [printer.dumps(complier.parse_source(code_str)) for code_str in sources]
+
+    def parse_all(i: int):
+        # 每个线程从不同的源码开始，轮流解析全部源码
+        order = sources[i:] + sources[:i]
+        return [printer.dumps(complier.parse_source(code_str)) for code_str in order * 5], i
+
+    with ThreadPoolExecutor(max_workers=THREADS, initializer=complier.init_worker) as executor:
+        for dumps, i in executor.map(parse_all, range(THREADS)):
+            assert dumps == (expected[i:] + expected[:i]) * 5
+
+
+def token_types(code_str: str, context: LexerContext):
+    lexer = create_lexer(optimize=True)
+    lexer.context = context
+    lexer.input(code_str)
+    return [token.type for token in lexer]
+
+
+def test_query_name_classifies_registered_names():
+    context = LexerContext()
+    context.add_typedef('P')
+    context.add_struct('P')
+    context.add_struct('Q')
+    context.add_typedef('Q')
+    context.add_typedef('R')
+    # struct 名优先于 typedef 名，与登记顺序无关
+    assert [context.query_name(name) for name in 'PQRS'] == ['STRUCTID', 'STRUCTID', 'TYPEDEFID', None]
+    assert token_types('P R x int', context) == ['STRUCTID', 'TYPEDEFID', 'ID', 'INT']
+
+
+def test_generic_names_follow_template_scopes():
+    context = LexerContext()
+    context.add_struct('U')
+    context.push_generic_scope()
+    context.add_generic_type('T')
+    context.add_generic_type('U')
+    context.push_generic_scope()
+    context.add_generic_type('T')
+    context.pop_generic_scope()
+    # 内层 T 出栈后外层的 T 仍然有效；已登记的 struct 名不会被泛型名覆盖
+    assert (context.query_name('T'), context.query_name('U')) == ('GENERICID', 'STRUCTID')
+    context.pop_generic_scope()
+    assert context.query_name('T') is None
+    assert context.generic_count == {}
+
+
+def test_long_lists_keep_source_order():
+    n = 5000
+    func_def = complier.parse_source(benchmark.gen_long_block(n)).allDeclarationList[0]
+    params = func_def.funcDecl.funcType.funcParamList
+    assert [param.ident for param in params] == [f'p{i}' for i in range(n)]
+    stmts = func_def.blockStmt.stmtList
+    assert len(stmts) == n + 2
+    assert [init.ident for init in stmts[0].varDecl.initDeclList] == [f'v{i}' for i in range(n)]
+    assert [stmt.exp.exp.rightExp.value for stmt in stmts[1:-1]] == [i % 97 for i in range(n)]
+    assert isinstance(stmts[-1], ast1.ReturnStmt)
+
+
+def test_short_lists_keep_source_order():
+    root = complier.parse_source('''
+        struct S { int: a; f32: b; func S(&S: self) { self.a = 0; } func get(&S: self) = int { return self.a; } };
+        template<T, U, V>
+        func pick(T: x, U: y, V: z) = T { return x; }
+        func main() = int { return pick(1, 2.0, 3); }
+    ''')
+    struct, template, main = root.allDeclarationList
+    assert [member.ident for member in struct.memberDeclList] == ['a', 'b']
+    assert len(struct.consFuncDefList) == 1 and len(struct.memberFuncDefList) == 1
+    assert [decl.ident for decl in template.typeNameList] == ['T', 'U', 'V']
+    call = main.blockStmt.stmtList[0].exp
+    assert [arg.value for arg in call.paramExpList] == [1, 2.0, 3]
+
+
+def test_comp_unit_views_follow_declarations():
+    root = complier.parse_source('''
+        var int: a = 1;
+        func f() = int { return a; }
+        template<T>
+        func g(T: x) = T { return x; }
+        struct S { int: m; };
+        template<T>
+        struct Box { T: value; };
+    ''')
+    kinds = [type(decl).__name__ for decl in root.allDeclarationList]
+    assert kinds == ['VarDecl', 'FuncDef', 'TemplateDecl', 'StructDecl', 'TemplateDecl']
+    assert [type(decl).__name__ for decl in root.blockDeclList] == ['VarDecl', 'StructDecl']
+    assert root.templateDeclList == root.allDeclarationList[2::2]
+    assert root.templateFuncDefList == [root.allDeclarationList[2]]
+    assert root.templateBlockDeclList == [root.allDeclarationList[4]]
+    # 添加声明后分类视图重新计算
+    extra = complier.parse_source('func h() { }').allDeclarationList[0]
+    root.add_declaration(extra)
+    assert root.allDeclarationList[-1] is extra and root.funcDefList[-1] is extra
+    with pytest.raises(TypeError, match='unknown declaration type'):
+        root.add_declaration(ast1.BreakStmt(1))
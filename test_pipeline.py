@@ -0,0 +1,103 @@
+import pytest
+import complier
+import semantic
+
+pytest.importorskip('llvmlite')
+from llvmlite import binding as llvm  # noqa: E402
+import codegen  # noqa: E402
+import jit  # noqa: E402
+from pipeline import PipelineOptions, parse_pass_timings, run_pipeline  # noqa: E402
+
+SUM = '''
+func sum(int[]: a, int: n) = int {
+    var int: s = 0;
+    for (var int: i = 0; n > i; i = i + 1) { s = s + a[i]; }
+    return s;
+}
+'''
+
+
+def optimize(options: PipelineOptions):
+    root = complier.parse_source(SUM)
+    llvm_module = jit.parse_module(str(codegen.generate(root, semantic.analyze(root)).module))
+    report = run_pipeline(llvm_module, jit.create_target_machine(options.opt), options)
+    return llvm_module, report
+
+
+@pytest.fixture
+def tunings(monkeypatch):
+    """记录每次创建 pass builder 时收到的调优选项"""
+    seen = []
+    create = llvm.create_pass_builder
+
+    def record(target_machine, tuning):
+        seen.append((tuning.speed_level, tuning.loop_vectorization, tuning.slp_vectorization,
+                     tuning.inlining_threshold))
+        return create(target_machine, tuning)
+    monkeypatch.setattr(llvm, 'create_pass_builder', record)
+    return seen
+
+
+def test_o0_leaves_ir_unchanged(tunings):
+    llvm_module, report = optimize(PipelineOptions(0))
+    assert report.before == report.after
+    assert tunings == []
+
+
+def test_o2_vectorizes_the_loop(tunings):
+    llvm_module, report = optimize(PipelineOptions(2))
+    assert '<4 x i32>' in str(llvm_module)
+    assert report.after != report.before
+    assert tunings == [(2, True, True, -1)]
+
+
+def test_no_loop_vectorize(tunings):
+    llvm_module, _ = optimize(PipelineOptions(2, loop_vectorize=False))
+    assert '<4 x i32>' not in str(llvm_module)
+    assert tunings == [(2, False, True, -1)]
+
+
+def test_cli_options_reach_pass_builder(tmp_path, monkeypatch, run_cli, tunings):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'sum.mo').write_text(SUM)
+    assert run_cli('-c', '-O', '2', '--no-loop-vectorize', '--inline-threshold', '7', 'sum.mo')[0] == 0
+    assert run_cli('-c', '-O', '0', 'sum.mo')[0] == 0
+    assert tunings == [(2, False, True, 7)]
+
+
+def test_parse_pass_timings_of_llvm_report():
+    root = complier.parse_source(SUM)
+    llvm_module = jit.parse_module(str(codegen.generate(root, semantic.analyze(root)).module))
+    options = PipelineOptions(2)
+    pass_builder = llvm.create_pass_builder(jit.create_target_machine(2), options.tuning_options())
+    pass_builder.start_pass_timing()
+    pass_builder.getModulePassManager().run(llvm_module, pass_builder)
+    report = pass_builder.finish_pass_timing()
+    passes = parse_pass_timings(report)
+    names = [name for name, _ in passes]
+    assert 'InstCombinePass' in names and 'LoopVectorizePass' in names
+    # 只取 pass 部分：分析的耗时与 Total 行不计入
+    assert 'Total' not in names and not any(name.endswith('Analysis') for name in names)
+    assert len(set(names)) == len(names)
+    seconds = [seconds for _, seconds in passes]
+    assert seconds == sorted(seconds, reverse=True) and min(seconds) >= 0.0
+
+
+def test_parse_pass_timings_without_system_time_column():
+    # 系统时间全为 0 时 LLVM 省略这一列
+    report = ('   ---User Time---   --User+System--   ---Wall Time---  --- Name ---\n'
+              '   0.0008 ( 19.5%)   0.0008 ( 19.5%)   0.0008 ( 19.6%)  SimplifyCFGPass\n'
+              '   0.0002 (  4.4%)   0.0002 (  4.4%)   0.0003 (  4.3%)  InstCombinePass\n'
+              '   0.0001 (  2.6%)   0.0001 (  2.6%)   0.0002 (  2.7%)  SimplifyCFGPass\n'
+              '   0.0039 (100.0%)   0.0039 (100.0%)   0.0038 (100.0%)  Total\n')
+    assert parse_pass_timings(report) == [('SimplifyCFGPass', pytest.approx(0.001)), ('InstCombinePass', 0.0003)]
+
+
+def test_cli_time_passes_prints_report(tmp_path, monkeypatch, run_cli):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / 'sum.mo').write_text(SUM)
+    code, output = run_cli('-c', '--time-passes', 'sum.mo')
+    assert code == 0
+    assert 'sum.mo: pipeline O2 loop-vectorize=True slp-vectorize=True inline-threshold=None' in output
+    assert 'instructions' in output and 'time per pass:' in output
+    assert 'LoopVectorizePass' in output
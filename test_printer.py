@@ -0,0 +1,21 @@
+import io
+import os
+import pytest
+import complier
+import printer
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'test')
+
+
+@pytest.mark.parametrize('name', ['variable', 'template'])
+def test_dump_matches_golden(name):
+    # test/<name>.ast 是改用 printer 之前由 Node.__str__ 生成的输出，必须逐字节一致
+    with open(os.path.join(SAMPLE_DIR, name), 'r', encoding='utf8') as f:
+        root = complier.parse_source(f.read())
+    with open(os.path.join(SAMPLE_DIR, name + '.ast'), 'r', encoding='utf8', newline='') as f:
+        expected = f.read()
+    assert printer.dumps(root) == expected
+    out = io.StringIO()
+    printer.dump(root, out)
+    assert out.getvalue() == expected
+    assert str(root) == expected
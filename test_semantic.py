@@ -0,0 +1,71 @@
+import pytest
+import ast1
+import complier
+import semantic
+from enums import BasicType
+from error import SemanticError
+from visitor import walk
+
+STRUCT_P = 'struct P { f32 : x; func P(&P: self) { self.x = 0.0; } };\n'
+
+
+def analyze(code_str: str) -> semantic.SemanticAnalyzer:
+    return semantic.analyze(complier.parse_source(code_str))
+
+
+@pytest.mark.parametrize('code_str, message', [
+    ('func f(int: a) = int { const int: c = 3; c = 4; return a; }', 'line 1: assignment to const INT'),
+    ('func g() { var x = 3; var f64: y = x * 2.5; const f64: z = y; z = 1.0; }', 'assignment to const F64'),
+    (STRUCT_P + 'func g(&P: p) = f32 { var P: q; q = p; return p.x; }\nfunc h() { var &P: r = &(q); }',
+     'line 3: undefined identifier q'),
+    ('func g() = int { var f32[]: arr; return arr[2 > 1].x; }', 'member access on non-struct type F32'),
+    (STRUCT_P + 'func g(&P: p) = f32 { var int: k = p.y; return 1.0; }', 'line 2: struct P has no member y'),
+    ('func g() { var void: v; }', 'variable v declared void'),
+    ('func g() = int { var int: a = 1; return; }', 'return VOID in function returning INT'),
+    ('func g() { break; }', 'break statement not within loop'),
+    ('func g() = int { return g(1); }', 'function expects 0 arguments, got 1'),
+    ('func g() { var int: a = 1; a(); }', 'called object of type INT is not a function'),
+    ('func g() { var int: a = 1; var f32[4]: b; b[1.5] = 0.0; }', 'array index of type F64 is not an integer'),
+    ('func g() { var f64: a = 1.0; var int: b = a << 2; }', 'invalid operands to binary LSHIFT'),
+    ('func g() { var q; }', 'can not infer type of q'),
+    ('func g() { var int[0]: a; var int[4]: b = a; }', r'can not initialize b of type \[4\]INT with \[0\]INT'),
+    ('func g() { var int: a; var int: a; }', 'redefinition of a'),
+    ('struct S { int: a; int: a; };', 'duplicate member a'),
+])
+def test_semantic_errors(code_str, message):
+    with pytest.raises(SemanticError, match=message):
+        analyze(code_str)
+
+
+def test_expression_types():
+    analyzer = analyze('''
+        func g(f32: x, int: n) = f32 {
+            var a = x * n;
+            var b = n / 2;
+            var c = x * 2.0;
+            var d = n > 1;
+            return a;
+        }
+    ''')
+    decls = {node.ident: node for node in analyzer.types if isinstance(node, ast1.InitDecl)}
+    assert {name: analyzer.types[decl].basic_type for name, decl in decls.items()} == {
+        'a': BasicType.F32, 'b': BasicType.INT, 'c': BasicType.F64, 'd': BasicType.BOOL}
+
+
+def test_use_before_definition():
+    # 顶层函数先扫描签名，可以先调用后定义
+    analyze('func f() = int { return g(1); }\nfunc g(int: a) = int { return a + 1; }')
+
+
+def test_shadowing_uses_innermost_scope():
+    root = complier.parse_source('''
+        var f64: v = 1.0;
+        func g() = int {
+            var int: v = 2;
+            { var bool: v = 1; }
+            return v;
+        }
+    ''')
+    analyzer = semantic.analyze(root)
+    returned = next(node for node in walk(root) if isinstance(node, ast1.ReturnStmt))
+    assert analyzer.types[returned.exp].basic_type == BasicType.INT
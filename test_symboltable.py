@@ -0,0 +1,126 @@
+from symboltable import SymbolTable
+from enums import BasicType
+from type import Type
+
+INT = Type.basic(BasicType.INT)
+F64 = Type.basic(BasicType.F64)
+BOOL = Type.basic(BasicType.BOOL)
+
+
+def scopes(depth: int = 3):
+    """global -> ... -> 最内层，返回从外到内的各层符号表"""
+    tables = [SymbolTable(None, None)]
+    for _ in range(depth - 1):
+        tables.append(SymbolTable(tables[-1], None))
+    return tables
+
+
+def test_cached_miss_sees_later_outer_definition():
+    outer, middle, inner = scopes()
+    assert inner.get_symbol('x') is None and inner.get_type('T') is None
+    # middle 上也留下“不存在”的缓存，之后从 inner 查找时不能停在这一项上
+    assert middle.get_symbol('x') is None and middle.get_type('T') is None
+    symbol = outer.add_symbol('x', INT)
+    outer.add_type('T', F64)
+    assert inner.get_symbol('x') is symbol and middle.get_symbol('x') is symbol
+    assert inner.get_type('T') is F64 and middle.get_type('T') is F64
+
+
+def test_inner_definition_shadows_cached_outer_name():
+    outer, middle, inner = scopes()
+    outer.add_symbol('x', INT)
+    outer.add_type('T', INT)
+    assert inner.get_symbol('x').type is INT and inner.get_type('T') is INT
+    shadow = middle.add_symbol('x', F64)
+    middle.add_type('T', F64)
+    assert inner.get_symbol('x') is shadow and inner.get_type('T') is F64
+    assert outer.get_symbol('x').type is INT
+
+
+def test_local_modification_after_cached_hit():
+    outer, _, inner = scopes()
+    outer.add_symbol('x', INT)
+    outer.add_type('T', INT)
+    assert inner.get_symbol('x').type is INT and inner.get_type('T') is INT
+    outer.modify_symbol_type_local('x', F64)
+    outer.modify_type_local('T', BOOL)
+    assert inner.get_symbol('x').type is F64 and inner.get_type('T') is BOOL
+    # 名字不在本层时 modify_*_local 不做任何事，也不影响缓存
+    assert inner.modify_symbol_type_local('x', BOOL) is None
+    assert inner.get_symbol('x').type is F64
+
+
+def test_lookup_through_child_of_clone():
+    outer, middle = scopes(2)
+    outer.add_symbol('g', INT)
+    child = SymbolTable(middle, None)
+    assert child.get_symbol('y') is None and child.get_symbol('g').type is INT
+    copy = middle.clone()
+    clone_child = SymbolTable(copy, None)
+    assert clone_child.get_symbol('g').type is INT
+    added = copy.add_symbol('y', F64)
+    assert clone_child.get_symbol('y') is added
+    # 原表的子表缓存了 y 不存在，clone 上的定义不应让它查到 y
+    assert child.get_symbol('y') is None
+    outer.modify_symbol_type_local('g', BOOL)
+    assert clone_child.get_symbol('g').type is BOOL and child.get_symbol('g').type is BOOL
+
+
+def test_writes_on_clone_stay_in_clone():
+    _, table = scopes(2)
+    table.add_symbol('x', INT)
+    table.add_type('T', INT)
+    copy = table.clone()
+    copy.add_symbol('y', INT)
+    copy.add_type('U', INT)
+    copy.modify_symbol_type_local('x', F64)
+    copy.modify_type_local('T', F64)
+    assert table.get_symbol('y') is None and table.get_type('U') is None
+    assert table.get_symbol('x').type is INT and table.get_type('T') is INT
+    assert copy.get_symbol('x').type is F64 and copy.get_type('T') is F64
+    assert copy.tmpIndex == table.tmpIndex
+
+
+def test_writes_on_original_stay_out_of_clone():
+    _, table = scopes(2)
+    x = table.add_symbol('x', INT)
+    table.add_type('T', INT)
+    copy = table.clone()
+    # 克隆前后共用同一份字典，第一次写时才复制
+    assert copy.symbolTable is table.symbolTable and copy.typeTable is table.typeTable
+    table.add_symbol('y', INT)
+    table.add_type('U', INT)
+    table.modify_symbol_type_local('x', F64)
+    table.modify_type_local('T', F64)
+    assert copy.symbolTable is not table.symbolTable and copy.typeTable is not table.typeTable
+    assert copy.get_symbol('y') is None and copy.get_type('U') is None
+    assert copy.get_symbol('x') is x and x.type is INT
+    assert copy.get_type('T') is INT
+
+
+def test_clone_of_clone_copies_once_per_side():
+    _, table = scopes(2)
+    table.add_symbol('x', INT)
+    first = table.clone()
+    second = first.clone()
+    second.add_symbol('y', INT)
+    assert table.get_symbol_local('y') is None and first.get_symbol_local('y') is None
+    first.add_symbol('z', INT)
+    assert table.get_symbol_local('z') is None and second.get_symbol_local('z') is None
+    assert {name for name in table.symbolTable} == {'x'}
+
+
+def test_global_clone_has_own_versions():
+    table = SymbolTable(None, None)
+    table.add_symbol('x', INT)
+    copy = table.clone()
+    assert copy.isGlobal and copy.get_global() is copy
+    assert copy.versions is not table.versions
+    child = SymbolTable(copy, None)
+    assert child.versions is copy.versions
+    assert child.get_symbol('x').type is INT
+    # 原表的修改只增加原表的版本号，克隆一侧的缓存不受影响也不会读到原表的新值
+    table.modify_symbol_type_local('x', F64)
+    assert child.get_symbol('x').type is INT
+    copy.modify_symbol_type_local('x', BOOL)
+    assert child.get_symbol('x').type is BOOL and table.get_symbol('x').type is F64
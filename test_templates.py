@@ -0,0 +1,133 @@
+import pytest
+import complier
+import semantic
+from enums import BasicType
+from error import SemanticError
+from type import Type, specialization_cache_info
+
+TEMPLATES = '''
+template<T, U>
+func add(T: a, U: b) {
+    var c = a + b;
+    return c;
+}
+template<T>
+func twice(T: a) = T { return a + a; }
+template<T>
+func repeat(T: a, int: n) = T {
+    if (n > 0)
+        return repeat(a, n - 1);
+    return a;
+}
+'''
+
+BOX = '''
+template<T>
+struct Box {
+    T : value;
+    func Box(&Box<T>: self) { self.value = (T)0; }
+    func get(&Box<T>: self) = T { return self.value; }
+    func add(&Box<T>: self, T: x) = T {
+        self.value = self.value + x;
+        return self.get();
+    }
+};
+'''
+
+
+def analyze(code_str: str) -> semantic.SemanticAnalyzer:
+    return semantic.analyze(complier.parse_source(code_str))
+
+
+def specializations(analyzer: semantic.SemanticAnalyzer) -> dict:
+    return {spec.name: spec for spec in analyzer.specializations.values()}
+
+
+def test_each_type_combination_is_checked_once():
+    analyzer = analyze(TEMPLATES + '''
+        func caller(int: i, f32: f) = f32 {
+            var x = add(i, i);
+            var y = add(i, i);
+            var z = add(i, f);
+            return add(f, i) + z;
+        }
+    ''')
+    assert sorted(specializations(analyzer)) == ['add<F32, INT>', 'add<INT, F32>', 'add<INT, INT>']
+    assert analyzer.specMisses == 3
+    assert analyzer.specHits == 1
+
+
+def test_specializations_have_their_own_types():
+    analyzer = analyze(TEMPLATES + 'func caller(int: i, f64: d) { var x = twice(i); var y = twice(d); }')
+    found = specializations(analyzer)
+    assert found['twice<INT>'].funcType.func_ret_type.basic_type == BasicType.INT
+    assert found['twice<F64>'].funcType.func_ret_type.basic_type == BasicType.F64
+    assert found['twice<INT>'].types is not found['twice<F64>'].types
+
+
+def test_recursive_template_hits_its_own_specialization():
+    analyzer = analyze(TEMPLATES + 'func caller(f32: f) = f32 { return repeat(f, 3); }')
+    assert list(specializations(analyzer)) == ['repeat<F32>']
+    assert analyzer.specMisses == 1
+    assert analyzer.specHits == 1
+
+
+def test_uninstantiated_template_has_no_specializations():
+    assert analyze(TEMPLATES).specializations == {}
+
+
+def test_conflicting_deductions_are_errors():
+    with pytest.raises(SemanticError, match='conflicting types'):
+        analyze('template<T>\nfunc same(T: a, T: b) = T { return a; }\n'
+                'func caller(int: i, f32: f) { var x = same(i, f); }')
+
+
+def test_match_generics_is_memoized():
+    generic = Type.reference(Type.generic('T'))
+    before = specialization_cache_info()['match']
+    assert generic.match_generics(Type.reference(Type.basic(BasicType.F16))) == \
+        (True, {'T': Type.basic(BasicType.F16)})
+    assert generic.match_generics(Type.reference(Type.basic(BasicType.F16)))[0]
+    after = specialization_cache_info()['match']
+    assert after[0] > before[0]
+
+
+def test_specialize_returns_interned_types():
+    generic = Type.array(Type.generic('T'), 4)
+    first = generic.specialize({'T': Type.basic(BasicType.F32)})
+    assert first is generic.specialize({'T': Type.basic(BasicType.F32)})
+    assert first is Type.array(Type.basic(BasicType.F32), 4)
+
+
+def test_codegen_emits_one_function_per_specialization():
+    pytest.importorskip('llvmlite')
+    import codegen
+    root = complier.parse_source(TEMPLATES + '''
+        func main() = int {
+            var int: a = add(1, 2);
+            var int: b = add(3, 4);
+            var f64: c = add(1.5, 2);
+            return a + b;
+        }
+    ''')
+    module = codegen.generate(root, semantic.analyze(root)).module
+    names = sorted(function.name for function in module.functions if function.name.startswith('add<'))
+    assert names == ['add<F64, INT>', 'add<INT, INT>']
+
+
+def test_struct_instance_checks_its_methods_once():
+    analyzer = analyze(BOX + '''
+        func caller() = f64 {
+            var Box<int>: a;
+            var Box<int>: b;
+            var Box<f64>: c;
+            return c.add(1.5) + (f64)b.get();
+        }
+    ''')
+    instances = {struct_type.ir_name: specs for struct_type, specs in analyzer.structInstances.items()}
+    assert {name: [spec.name for spec in specs] for name, specs in instances.items()} == {
+        'Box<INT>': ['Box<INT>.Box', 'Box<INT>.get', 'Box<INT>.add'],
+        'Box<F64>': ['Box<F64>.Box', 'Box<F64>.get', 'Box<F64>.add']}
+    add = instances['Box<F64>'][2]
+    assert add.funcType.func_ret_type.basic_type == BasicType.F64
+
@@ -0,0 +1,69 @@
+import gc
+import pytest
+import symboltable  # noqa: F401  type 与 symboltable 互相引用，先导入 symboltable
+from enums import BasicType, IDType
+from error import CodegenError, SemanticError
+from type import StructInfo, Type, interned_count
+
+INT = Type.basic(BasicType.INT)
+F32 = Type.basic(BasicType.F32)
+
+
+def test_equal_types_are_one_instance():
+    assert Type.basic(BasicType.INT) is INT
+    assert Type.array(Type.array(F32, 3), 4) is Type.array(Type.array(F32, 3), 4)
+    assert Type.function([Type.reference(INT), F32], INT) is Type.function((Type.reference(INT), F32), INT)
+    assert Type.basic(BasicType.INT, True) is not INT
+    assert INT.as_const().remove_const() is INT
+    assert Type.reference(INT.as_const()).decay() is INT
+    assert {INT: 1}[Type.basic(BasicType.INT)] == 1
+
+
+def test_structs_intern_by_definition_not_name():
+    first, second = StructInfo('P'), StructInfo('P')
+    assert Type.struct(first) is Type.struct(first)
+    assert Type.struct(first) is not Type.struct(second)
+    assert Type.struct(first, [INT]) is not Type.struct(first, [F32])
+    assert str(Type.struct(first, [INT])) == 'struct P<INT>'
+
+
+def test_types_are_immutable():
+    with pytest.raises(AttributeError, match='immutable'):
+        INT.basic_type = BasicType.F64
+    assert INT.basic_type == BasicType.INT
+
+
+def test_derived_attributes():
+    generic = Type.function([Type.array(Type.generic('T'), 2)], INT)
+    assert generic.containsGeneric and not INT.containsGeneric
+    assert Type.array(Type.array(INT, 3), 4).dims == (3, 4)  # 最内层在前
+    assert Type.array(INT, 4).idType == IDType.ARRAY
+    assert str(Type.reference(Type.array(F32, 2))) == '[2]F32 ref'
+    with pytest.raises(SemanticError, match='array of void'):
+        Type.array(Type.basic(BasicType.VOID))
+    with pytest.raises(SemanticError, match='reference to reference'):
+        Type.reference(Type.reference(INT))
+
+
+def test_unused_types_are_released():
+    gc.collect()
+    before = interned_count()
+    info = StructInfo('Temp')
+    types = [Type.array(Type.struct(info), n) for n in range(1, 50)]
+    assert interned_count() >= before + 50
+    del types, info
+    gc.collect()
+    assert interned_count() <= before
+
+
+def test_zero_length_array_is_not_unsized():
+    assert Type.array(INT, 0) is not Type.array(INT)
+    assert (str(Type.array(INT, 0)), str(Type.array(INT))) == ('[0]INT', '[]INT')
+    assert str(Type.array(INT, 0).to_ir_type()) == '[0 x i32]'
+    assert str(Type.array(INT).to_ir_type()) == 'i32*'
+
+
+def test_unmapped_basic_type_is_codegen_error():
+    assert str(Type.array(INT, 4).to_ir_type()) == '[4 x i32]'
+    with pytest.raises(CodegenError, match='type STRING has no IR representation'):
+        Type.reference(Type.basic(BasicType.STRING)).to_ir_type()
@@ -0,0 +1,109 @@
+import ast1
+from enums import BinaryOp
+from visitor import SKIP, Transformer, Visitor, walk
+
+
+def build_tree() -> ast1.BlockStmt:
+    """{ a + 1; { b; } return c * 2; }"""
+    return ast1.BlockStmt(1, [
+        ast1.ExpStmt(1, ast1.BinaryExp(1, ast1.IdentPri(1, 'a'), ast1.LiteralPri(1, 1, 'INTCON'), BinaryOp.PLUS)),
+        ast1.BlockStmt(2, [ast1.ExpStmt(2, ast1.IdentPri(2, 'b'))]),
+        ast1.ReturnStmt(3, ast1.BinaryExp(3, ast1.IdentPri(3, 'c'), ast1.LiteralPri(3, 2, 'INTCON'), BinaryOp.MUL)),
+    ])
+
+
+def idents(root: ast1.Node) -> list:
+    return [node.ident for node in walk(root) if isinstance(node, ast1.IdentPri)]
+
+
+class Recorder(Visitor):
+    def __init__(self) -> None:
+        self.events = []
+
+    def visit_IdentPri(self, node: ast1.IdentPri) -> None:
+        self.events.append(node.ident)
+
+    def visit_Expression(self, node: ast1.Expression) -> None:
+        # IdentPri 之外的表达式落到父类的处理函数，不再向下遍历
+        self.events.append(type(node).__name__)
+
+    def enter_Stmt(self, node: ast1.Stmt):
+        self.events.append(f'enter {type(node).__name__}')
+        if isinstance(node, ast1.ReturnStmt):
+            return SKIP
+
+    def leave_Stmt(self, node: ast1.Stmt) -> None:
+        self.events.append(f'leave {type(node).__name__}')
+
+    def enter_IdentPri(self, node: ast1.IdentPri) -> None:
+        self.events.append(node.ident)
+
+
+def test_dispatch_follows_mro_and_is_cached():
+    recorder = Recorder()
+    recorder.visit(build_tree())
+    assert recorder.events == ['BinaryExp', 'b', 'BinaryExp']
+    assert Recorder.lookup(ast1.IdentPri) is Recorder.visit_IdentPri
+    assert Recorder.lookup(ast1.LiteralPri) is Recorder.visit_Expression
+    assert Recorder.lookup(ast1.BlockStmt) is Recorder.generic_visit
+    assert Recorder.lookup(ast1.BlockStmt, 'leave_') is Recorder.leave_Stmt
+    assert Recorder.lookup(ast1.LiteralPri, 'enter_') is None
+    # 缓存按子类各自保存，互不影响
+    assert Recorder._dispatch[('visit_', ast1.IdentPri)] is Recorder.visit_IdentPri
+    assert ('visit_', ast1.IdentPri) not in Visitor._dispatch
+
+
+def test_dispatch_is_resolved_once_per_class():
+    class Counter(Visitor):
+        pass
+
+    Counter().visit(build_tree())
+    assert Counter._dispatch[('visit_', ast1.IdentPri)] is Counter.generic_visit
+    # 解析结果已缓存，之后加上的处理函数不会再被查找
+    Counter.visit_IdentPri = lambda self, node: None
+    assert Counter.lookup(ast1.IdentPri) is Counter.generic_visit
+
+
+def test_traverse_orders_enter_leave_and_skips():
+    recorder = Recorder()
+    recorder.traverse(build_tree())
+    assert recorder.events == [
+        'enter BlockStmt',
+        'enter ExpStmt', 'a', 'leave ExpStmt',
+        'enter BlockStmt', 'enter ExpStmt', 'b', 'leave ExpStmt', 'leave BlockStmt',
+        # ReturnStmt 的 enter 返回 SKIP：不进入子树，也不调用 leave
+        'enter ReturnStmt',
+        'leave BlockStmt',
+    ]
+
+
+class Rewriter(Transformer):
+    def visit_ExpStmt(self, node: ast1.ExpStmt):
+        if isinstance(node.exp, ast1.IdentPri):
+            return None
+        return [node, ast1.ExpStmt(node.row, ast1.IdentPri(node.row, 'copy'))]
+
+    def visit_IdentPri(self, node: ast1.IdentPri) -> ast1.IdentPri:
+        return ast1.IdentPri(node.row, node.ident.upper())
+
+
+def test_transformer_deletes_and_expands_list_items():
+    root = build_tree()
+    assert Rewriter().visit(root) is root
+    first, inner, ret = root.stmtList[0], root.stmtList[2], root.stmtList[3]
+    assert [type(stmt).__name__ for stmt in root.stmtList] == ['ExpStmt', 'ExpStmt', 'BlockStmt', 'ReturnStmt']
+    # 展开插入的节点原样保留，返回 None 的语句从列表中删除
+    assert root.stmtList[1].exp.ident == 'copy'
+    assert inner.stmtList == []
+    assert idents(first) == ['a'] and idents(ret) == ['C']
+
+
+def test_transformer_replaces_single_fields():
+    root = build_tree()
+
+    class Upper(Transformer):
+        def visit_IdentPri(self, node: ast1.IdentPri) -> ast1.IdentPri:
+            return ast1.IdentPri(node.row, node.ident.upper())
+
+    Upper().visit(root)
+    assert idents(root) == ['A', 'B', 'C']
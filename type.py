@@ -1,231 +1,218 @@
 from __future__ import annotations
-import copy
-from typing import Dict, List, Optional, Tuple
+import functools
+import weakref
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 from llvmlite import ir
-from ast1 import Node
 from enums import BasicType, IDType
-from error import SemanticError
+from error import CodegenError, SemanticError
 import symboltable
-# from .utils.misc import merge_matched
 
+# 驻留表：结构相同的类型只保留一个实例。值是弱引用，不再被使用的类型会被回收，
+# 批量编译时不会因为每个文件的结构体类型而无限增长
+_interned: weakref.WeakValueDictionary = weakref.WeakValueDictionary()
 
-class Type(object):
-    def __init__(self,
-                 id_type: Optional[IDType] = None,
-                 basic_type: Optional[BasicType] = None,
-                 generic_name: Optional[str] = None,
-                 generic_type_range: Optional[Type] = None,
-                 struct_name: Optional[str] = None) -> None:
-        assert ((basic_type or generic_name or struct_name) and
-                not (basic_type and generic_name) or
-                not (basic_type and struct_name) or
-                not (generic_name and struct_name))
-        self.isConst = False
-        self.dims: List[int] = []  # 0 for empty size
-
-        # ID type
-        self.idType: Optional[IDType] = id_type
-        # Basic type
-        self.basic_type: Optional[BasicType] = basic_type
-
-        # Generic type
-        self.generic_name: Optional[str] = generic_name
-        self.generic_type_range: Optional[Type] = generic_type_range
-
-        # Struct type
-        self.struct_name: Optional[str] = struct_name
-        self.base_type_list: List[Type] = []
-        self.member_list: List[symboltable.Symbol] = []
-        self.constructor: Optional[symboltable.Symbol] = None
 
-        # Reference type
-        self.reference = False
+# 基本类型对应的 IR 类型；void 只能作返回类型，auto 与泛型在代码生成前都已确定
+IR_BASIC_TYPES = {
+    BasicType.VOID: ir.VoidType(),
+    BasicType.BOOL: ir.IntType(1),
+    BasicType.INT: ir.IntType(32),
+    BasicType.F16: ir.HalfType(),
+    BasicType.F32: ir.FloatType(),
+    BasicType.F64: ir.DoubleType(),
+}
 
-        # Function type
-        self.func_ret_type: Optional[Type] = None
-        self.func_params: List[symboltable.Symbol] = []
-
-        # Struct / Interface / Function type
-        self.generics_type_list: List[Type] = []
-        self.symbol_table: Optional[symboltable.SymbolTable] = None
-        self.unParsed: Optional[Node] = None
-
-        if self.idType is None:
-            self.idType = self.judge_idtype()
-
-    def judge_idtype(self) -> IDType:
-        if self.func_ret_type is not None:
-            return IDType.FUNCTION
-        elif self.reference:
-            return IDType.REFERENCE
-        elif self.struct_name is not None:
-            return IDType.STRUCT
-        elif self.generic_name is not None:
-            return IDType.GENERIC
-        elif self.basic_type is not None:
-            return IDType.BASIC
-        else:
-            return IDType.AUTO
 
-    def has_generics(self) -> bool:
-        return len(self.generics_type_list) > 0
+def interned_count() -> int:
+    return len(_interned)
 
-    def is_generics(self) -> bool:
-        idtype = self.idType
-        if idtype == IDType.AUTO:
-            return False
-        elif idtype == IDType.BASIC:
-            return False
-        elif idtype == IDType.GENERIC:
-            return True
-        elif idtype == IDType.STRUCT:
-            for generics_type in self.generics_type_list:
-                if generics_type.is_generics():
-                    return True
-            return False
-        elif idtype == IDType.REFERENCE:
-            refered_type = self.clone().remove_ref()
-            return refered_type.is_generics()
-        elif idtype == IDType.FUNCTION:
-            for param_symbol in self.func_params:
-                if param_symbol.type.is_generics():
-                    return True
-            return self.func_ret_type.is_generics()
-        else:
-            assert False
 
-    def add_const(self) -> Type:
-        self.isConst = True
-        return self
+class StructInfo(object):
+    """结构体的定义：成员、构造函数与成员作用域。
 
-    def add_symbol_table(self, parent_symbol_table: symboltable.SymbolTable) -> Type:
-        self.symbol_table = symboltable.SymbolTable(parent_symbol_table, self)
-        return self
+    结构体类型按定义对象驻留（而不是按名字），同名结构体的两次定义是两个不同的类型；
+    成员要在类型创建之后才能逐个登记，所以放在这个可变对象里，而不是不可变的 Type 上。"""
+    def __init__(self, name: str, generics_type_list: Sequence[Type] = ()) -> None:
+        self.name = name
+        self.generics_type_list: Tuple[Type, ...] = tuple(generics_type_list)
+        self.base_type_list: List[Type] = []
+        self.member_list: List[symboltable.Symbol] = []
+        self.constructor: Optional[symboltable.Symbol] = None
+        self.symbol_table: Optional[symboltable.SymbolTable] = None
 
-    def add_generics_type(self, generics_type: Type) -> Type:
-        assert generics_type.idType == IDType.GENERIC
-        self.generics_type_list.append(generics_type)
-        if len(generics_type.generic_name) > 0:
-            self.symbol_table.add_type(generics_type.generic_name, generics_type)
-        else:
-            generics_type.generic_name = self.symbol_table.add_unnamed_type(generics_type)
+    def add_symbol_table(self, parent_symbol_table: symboltable.SymbolTable) -> StructInfo:
+        self.symbol_table = symboltable.SymbolTable(parent_symbol_table, None)
         return self
 
-    # def add_struct_base_type(self, base_type: Type) -> Type:
-    #     self.base_type_list.append(base_type)
-    #     return self
-
-    def add_struct_member(self, member: symboltable.Symbol) -> Type:
+    def add_struct_member(self, member: symboltable.Symbol) -> StructInfo:
         self.member_list.append(member)
         return self
 
-    def add_array_dim_chosen(self, dim_index: int, dim_size: int) -> Type:
-        kind = self.idType
-        if kind == IDType.BASIC and self.basic_type == BasicType.VOID:
+
+class Type(object):
+    """类型。实例经过 hash-consing：结构相同的类型只有一个实例，创建后不可修改，
+    所以相等比较就是 is，哈希取对象 id，都是 O(1)，比较和打印也不再需要 clone。
+
+    不直接调用构造函数，用 Type.auto/basic/generic/struct/array/reference/function 创建，
+    用 as_const/remove_const/remove_ref/decay 等得到相关的类型。
+    数组是独立的 ARRAY 类型（element_type 与 size），多维数组是数组的数组。"""
+    __slots__ = ('idType', 'isConst', 'basic_type', 'generic_name', 'struct_info', 'generics_type_list',
+                 'element_type', 'size', 'referred_type', 'param_types', 'func_ret_type', 'containsGeneric',
+                 'text', '__weakref__')
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'Type is immutable, can not set {name}')
+
+    @staticmethod
+    def intern(key: tuple, id_type: IDType, is_const: bool, **fields) -> Type:
+        interned = _interned.get(key)
+        if interned is not None:
+            return interned
+        interned = object.__new__(Type)
+        init = object.__setattr__
+        for name in Type.__slots__[:-1]:
+            init(interned, name, fields.get(name))
+        init(interned, 'idType', id_type)
+        init(interned, 'isConst', is_const)
+        init(interned, 'generics_type_list', fields.get('generics_type_list', ()))
+        init(interned, 'param_types', fields.get('param_types', ()))
+        contains = id_type == IDType.GENERIC or any(
+            t is not None and t.containsGeneric
+            for t in (interned.element_type, interned.referred_type, interned.func_ret_type,
+                      *interned.param_types, *interned.generics_type_list))
+        init(interned, 'containsGeneric', contains)
+        _interned[key] = interned
+        return interned
+
+    ########################################################## 创建
+    @staticmethod
+    def auto(is_const: bool = False) -> Type:
+        return Type.intern((IDType.AUTO, is_const), IDType.AUTO, is_const)
+
+    @staticmethod
+    def basic(basic_type: BasicType, is_const: bool = False) -> Type:
+        return Type.intern((IDType.BASIC, is_const, basic_type), IDType.BASIC, is_const, basic_type=basic_type)
+
+    @staticmethod
+    def generic(generic_name: str, is_const: bool = False) -> Type:
+        return Type.intern((IDType.GENERIC, is_const, generic_name), IDType.GENERIC, is_const,
+                           generic_name=generic_name)
+
+    @staticmethod
+    def struct(struct_info: StructInfo, generics: Sequence[Type] = (), is_const: bool = False) -> Type:
+        generics = tuple(generics)
+        return Type.intern((IDType.STRUCT, is_const, struct_info, generics), IDType.STRUCT, is_const,
+                           struct_info=struct_info, generics_type_list=generics)
+
+    @staticmethod
+    def array(element_type: Type, size: Optional[int] = None, is_const: bool = False) -> Type:
+        """size 为 None 表示未指定长度，0 是长度为 0 的数组"""
+        if element_type.idType == IDType.BASIC and element_type.basic_type == BasicType.VOID:
             raise SemanticError('can not create array of void')
-        if kind == IDType.REFERENCE:
+        if element_type.idType == IDType.REFERENCE:
             raise SemanticError('type of array element can not be reference')
-        self.dims.insert(dim_index, dim_size)
-        return self
+        return Type.intern((IDType.ARRAY, is_const, element_type, size), IDType.ARRAY, is_const,
+                           element_type=element_type, size=size)
 
-    def add_ref(self) -> Type:
-        if self.reference:
+    @staticmethod
+    def reference(referred_type: Type, is_const: bool = False) -> Type:
+        if referred_type.idType == IDType.REFERENCE:
             raise SemanticError('can not create a reference to reference type')
-        self.reference = True
-        return self
+        return Type.intern((IDType.REFERENCE, is_const, referred_type), IDType.REFERENCE, is_const,
+                           referred_type=referred_type)
+
+    @staticmethod
+    def function(param_types: Sequence[Type], ret_type: Type, generics: Sequence[Type] = (),
+                 is_const: bool = False) -> Type:
+        param_types, generics = tuple(param_types), tuple(generics)
+        return Type.intern((IDType.FUNCTION, is_const, param_types, ret_type, generics), IDType.FUNCTION, is_const,
+                           param_types=param_types, func_ret_type=ret_type, generics_type_list=generics)
+
+    ########################################################## 派生
+    def with_const(self, is_const: bool) -> Type:
+        if is_const == self.isConst:
+            return self
+        kind = self.idType
+        if kind == IDType.AUTO:
+            return Type.auto(is_const)
+        if kind == IDType.BASIC:
+            return Type.basic(self.basic_type, is_const)
+        if kind == IDType.GENERIC:
+            return Type.generic(self.generic_name, is_const)
+        if kind == IDType.STRUCT:
+            return Type.struct(self.struct_info, self.generics_type_list, is_const)
+        if kind == IDType.ARRAY:
+            return Type.array(self.element_type, self.size, is_const)
+        if kind == IDType.REFERENCE:
+            return Type.reference(self.referred_type, is_const)
+        return Type.function(self.param_types, self.func_ret_type, self.generics_type_list, is_const)
 
-    def add_func_param(self, param: symboltable.Symbol) -> Type:
-        self.func_params.append(param)
-        return self
+    def as_const(self) -> Type:
+        return self.with_const(True)
 
-    def add_func_ret_type(self, ret_type: Type) -> Type:
-        assert self.func_ret_type is None
-        self.func_ret_type = ret_type
-        return self
+    def remove_const(self) -> Type:
+        return self.with_const(False)
 
-    def array_element(self) -> Type:
-        self.dims.pop()
-        return self
+    def remove_ref(self) -> Type:
+        assert self.idType == IDType.REFERENCE
+        return self.referred_type
 
-    def get_array_size_chosen(self, dim_index: int) -> int:
-        return self.dims[dim_index]
+    def array_element(self) -> Type:
+        assert self.idType == IDType.ARRAY
+        return self.element_type
+
+    def decay(self) -> Type:
+        """去掉 const 与引用，得到参与运算的值类型"""
+        type = self
+        while True:
+            if type.isConst:
+                type = type.remove_const()
+            elif type.idType == IDType.REFERENCE:
+                type = type.referred_type
+            else:
+                return type
+
+    ########################################################## 查询
+    @property
+    def struct_name(self) -> Optional[str]:
+        return self.struct_info.name if self.struct_info is not None else None
+
+    @property
+    def symbol_table(self) -> Optional[symboltable.SymbolTable]:
+        return self.struct_info.symbol_table if self.struct_info is not None else None
+
+    @property
+    def dims(self) -> Tuple[Optional[int], ...]:
+        """各维长度，最内层在前（None 表示未指定长度）"""
+        dims = []
+        type = self
+        while type.idType == IDType.ARRAY:
+            dims.append(type.size)
+            type = type.element_type
+        dims.reverse()
+        return tuple(dims)
 
     def get_dim_size(self) -> int:
         return len(self.dims)
 
-    def remove_ref(self) -> Type:
-        assert self.idType == IDType.REFERENCE
-        self.reference = False
-        return self
+    def has_generics(self) -> bool:
+        return len(self.generics_type_list) > 0
 
-    def clone(self, clone_symbol_table=False) -> Type:
-        tmp_type = Type(basic_type=self.basic_type,
-                        generic_name=self.generic_name,
-                        generic_type_range=self.generic_type_range,
-                        struct_name=self.struct_name)
-        tmp_type.isConst = self.isConst
-        tmp_type.base_type_list = copy.deepcopy(self.base_type_list)
-        tmp_type.dims = copy.deepcopy(self.dims)
-        tmp_type.reference = self.reference
-        tmp_type.func_ret_type = self.func_ret_type
-        tmp_type.func_params = copy.deepcopy(self.func_params)
-        tmp_type.generics_type_list = [*self.generics_type_list]
-        if clone_symbol_table:
-            tmp_type.symbol_table = self.symbol_table.clone()
-            # tmp_type.symbol_table.parent_type = tmp_type
-        else:
-            tmp_type.symbol_table = self.symbol_table
-        tmp_type.unParsed = self.unParsed
-        return tmp_type
-
-    def __eq__(self, type: Type) -> bool:
-        if not isinstance(type, Type):
-            return False
-        if self.get_dim_size() != type.get_dim_size():
-            return False
-        for dim1, dim2 in zip(self.dims, type.dims):
-            if dim1 != dim2:
-                return False
-        kind1, kind2 = self.idType, type.idType
-        if kind1 == IDType.AUTO and kind2 == IDType.AUTO:
-            return True
-        elif kind1 == IDType.BASIC and kind2 == IDType.BASIC:
-            return self.basic_type == type.basic_type
-        elif kind1 == IDType.GENERIC and kind2.GENERIC:
-            return self.generic_name == type.generic_name
-        elif kind1 == IDType.STRUCT and kind2 == IDType.STRUCT:
-            return self.struct_name == type.struct_name
-        elif kind1 == IDType.REFERENCE and kind2 == IDType.REFERENCE:
-            return self.clone().remove_ref() == type.clone().remove_ref()
-        elif kind1 == IDType.FUNCTION and kind2 == IDType.FUNCTION:
-            if not (self.func_ret_type == type.func_ret_type):
-                return False
-            if len(self.func_params) != len(type.func_params):
-                return False
-            for param1, param2 in zip(self.func_params, type.func_params):
-                if not (param1.type == param2.type):
-                    return False
-            return True
-
-        return False
+    def is_generics(self) -> bool:
+        """类型中是否含有未实例化的泛型，创建时已算好"""
+        return self.containsGeneric
+
+    def __repr__(self) -> str:
+        return f'<Type {self}>'
 
     def __str__(self) -> str:
-        kind = self.idType
+        # 类型不可变，字符串只需要拼一次
+        if self.text is None:
+            object.__setattr__(self, 'text', self.format())
+        return self.text
 
-        def get_generic_str() -> str:
-            if not self.has_generics():
-                return ''
-            generic_str = '<'
-            for i, generics_type in enumerate(self.generics_type_list):
-                if i > 0:
-                    generic_str += ', '
-                generic_str += f'{generics_type}' if generics_type.generic_name else '""'
-            generic_str += '>'
-            return generic_str
-
-        if len(self.dims) > 0:
-            element_type = self.clone().array_element()
-            return f'[{self.get_array_size_chosen(-1)}]{element_type}'
+    def format(self) -> str:
+        kind = self.idType
 
         if kind == IDType.AUTO:
             return 'auto'
@@ -234,138 +221,148 @@ class Type(object):
         elif kind == IDType.GENERIC:
             return self.generic_name
         elif kind == IDType.STRUCT:
-            return f'struct {self.struct_name}{get_generic_str()}'
+            return f'struct {self.struct_name}{self.get_generic_str()}'
+        elif kind == IDType.ARRAY:
+            return f'[{"" if self.size is None else self.size}]{self.element_type}'
         elif kind == IDType.REFERENCE:
-            refered_type = self.clone().remove_ref()
-            return f'{refered_type} ref'
+            return f'{self.referred_type} ref'
         elif kind == IDType.FUNCTION:
-            func_str = f'{get_generic_str()}('
-            for i, param in enumerate(self.func_params):
-                if i > 0:
-                    func_str += ', '
-                func_str += f'{param.type}'
-            func_str += f') -> {self.func_ret_type}'
-            return func_str
+            params = ', '.join(f'{param_type}' for param_type in self.param_types)
+            return f'{self.get_generic_str()}({params}) -> {self.func_ret_type}'
         else:
             assert False
 
-    # def to_ir_type(self) -> ir.Type:
-    #     kind = self.get_idtype()
-    #     if kind == IDType.AUTO:
-    #         return ir.VoidType()
-    #     if kind == IDType.BASIC:
-    #         if self.basic_type == BasicType.VOID:
-    #             return ir.VoidType()
-    #         if self.basic_type == BasicType.BOOL:
-    #             return ir.IntType(1)
-    #         elif self.basic_type == BasicType.F16:
-    #             return ir.HalfType()
-    #         elif self.basic_type == BasicType.F32:
-    #             return ir.FloatType()
-    #         elif self.basic_type == BasicType.F64:
-    #             return ir.DoubleType()
-    #         elif self.basic_type == BasicType.I8 or self.basic_type == BasicType.U8:
-    #             return ir.IntType(8)
-    #         elif self.basic_type == BasicType.I16 or self.basic_type == BasicType.U16:
-    #             return ir.IntType(16)
-    #         elif self.basic_type == BasicType.I32 or self.basic_type == BasicType.U32:
-    #             return ir.IntType(32)
-    #         elif self.basic_type == BasicType.I64 or self.basic_type == BasicType.U64:
-    #             return ir.IntType(64)
-    #         else:
-    #             raise NotImplementedError(f'IR BasicType {self.basic_type} not implemented')
-    #     elif kind == IDType.STRUCT:
-    #         return ir.global_context.get_identified_type(self.struct_name)
-    #     elif kind == IDType.ARRAY:
-    #         element_type = self.clone().to_element_type()
-    #         element_ir_type = element_type.to_ir_type()
-    #         # if element_type.get_kind() == IDType.BASIC:
-    #         #     return ir.VectorType(element_ir_type, self.array_dims[-1])
-    #         # else:
-    #         return ir.ArrayType(element_ir_type, self.dims[-1])
-    #     elif kind == IDType.REFERENCE:
-    #         refered_ir_type = self.clone().remove_ref().to_ir_type()
-    #         return ir.PointerType(refered_ir_type)
-    #     elif kind == IDType.FUNCTION:  # Return Function Pointer IR type
-    #         ret_ir_type = self.func_ret_type.to_ir_type()
-    #         param_ir_types = []
-    #         for param in self.func_params:
-    #             param_ir_types.append(param.type.to_ir_type())
-    #         return ir.PointerType(ir.FunctionType(ret_ir_type, param_ir_types))
-    #     else:
-    #         assert False, "uninstantiabled type!"
-    #
-    # def match_generics(self, spec_type: Type) -> Tuple[bool, Dict[str, Type]]:
-    #     """模版类型与函数实参匹配，推导出模版类型"""
-    #     kind1, kind2 = self.get_idtype(), spec_type.get_idtype()
-    #     if kind1 == IDType.GENERIC and kind2 != IDType.GENERIC:
-    #         # Matched generics type with a specializaed type
-    #         return True, {self.generic_name: spec_type}
-    #     elif kind1 == IDType.AUTO and kind2 == IDType.AUTO:
-    #         return True, {}
-    #     elif kind1 == IDType.BASIC and kind2 == IDType.BASIC:
-    #         return self.basic_type == spec_type.basic_type, {}
-    #     elif kind1 == IDType.STRUCT and kind2 == IDType.STRUCT:
-    #         return self.struct_name == spec_type.struct_name, {}
-    #     elif kind1 == IDType.ARRAY and kind2 == IDType.ARRAY:
-    #         return self.clone().to_element_type().match_generics(spec_type.clone().to_element_type())
-    #     elif kind1 == IDType.REFERENCE and kind2 == IDType.REFERENCE:
-    #         return self.clone().remove_ref().match_generics(spec_type.clone().remove_ref())
-    #     elif kind1 == IDType.FUNCTION and kind2 == IDType.FUNCTION:
-    #         if len(self.func_params) != len(spec_type.func_params):
-    #             return False, {}
-    #         ret, all_matched = self.func_ret_type.match_generics(spec_type.func_ret_type)
-    #         if not ret:
-    #             return False, {}
-    #         for param1, param2 in zip(self.func_params, spec_type.func_params):
-    #             ret, matched = param1.type.match_generics(param2.type)
-    #             if not ret:
-    #                 return False, {}
-    #             all_matched = merge_matched(all_matched, matched)
-    #             if all_matched is None:
-    #                 return False, {}
-    #         return True, all_matched
-    #     else:
-    #         return False, {}
-    #
-    # def specialize(self, generic_specialization_list: Dict[str, Type], spec_param_array_dims: Optional[Dict[str, List[int]]] = None) -> Type:
-    #     """将该类型中嵌套的泛型类型按照实例化列表进行替换"""
-    #     kind = self.get_idtype()
-    #
-    #     if kind == IDType.AUTO:
-    #         return self
-    #     if kind == IDType.BASIC:
-    #         return self
-    #     elif kind == IDType.GENERIC:
-    #         if self.generic_name in generic_specialization_list:
-    #             return generic_specialization_list[self.generic_name]
-    #         else:
-    #             return self
-    #     elif kind == IDType.STRUCT:
-    #         return self
-    #     elif kind == IDType.ARRAY:
-    #         element_type = self.clone().to_element_type()
-    #         return element_type.specialize(generic_specialization_list).clone().add_array_dim_chosen(self.get_array_size())
-    #     elif kind == IDType.REFERENCE:
-    #         refered_type = self.clone().remove_ref()
-    #         return refered_type.specialize(generic_specialization_list).clone().add_ref()
-    #     elif kind == IDType.FUNCTION:
-    #         func_type = self.clone(clone_symbol_table=True)
-    #         func_type.func_ret_type = self.func_ret_type.specialize(generic_specialization_list)
-    #         for i, param_symbol in enumerate(self.func_params):
-    #             param_type = param_symbol.type.specialize(generic_specialization_list)
-    #             # 实例化数组维数
-    #             if spec_param_array_dims is not None and len(param_type.dims) > 0 and param_symbol.id in spec_param_array_dims:
-    #                 param_type = param_type.clone()
-    #                 array_dims = spec_param_array_dims[param_symbol.id]
-    #                 for i, dim in enumerate(param_type.dims):
-    #                     if dim == 0:
-    #                         param_type.dims[i] = array_dims[i]
-    #             new_param_symbol = func_type.symbol_table.replace_local_symbol_type(param_symbol.id, param_type)
-    #             func_type.func_params[i] = new_param_symbol
-    #         for generic_name, spec_type in generic_specialization_list.items():
-    #             assert len(generic_name) > 0
-    #             func_type.symbol_table.replace_local_type(generic_name, spec_type)
-    #         return func_type
-    #     else:
-    #         assert False
+    ########################################################## IR 类型
+    @property
+    def ir_name(self) -> str:
+        """结构体在 IR 中的名字，模板结构体的实例带上类型实参"""
+        return f'{self.struct_name}{self.get_generic_str()}' if self.has_generics() else self.struct_name
+
+    def get_generic_str(self) -> str:
+        if not self.has_generics():
+            return ''
+        return '<' + ', '.join(f'{generics_type}' for generics_type in self.generics_type_list) + '>'
+
+    def to_ir_type(self, context: ir.Context = ir.global_context,
+                   lower: Optional[Callable[[Type], ir.Type]] = None) -> ir.Type:
+        """对应的 LLVM IR 类型。lower 用来转换嵌套的子类型（默认递归调用 to_ir_type），调用方可以借此缓存；
+        结构体只返回 context 中同名的 identified struct，成员布局由调用方设置。
+
+        引用是指向被引用类型的指针，未指定长度的数组作为参数传递时退化为指向元素的指针，函数类型是函数指针。"""
+        lower = lower or (lambda type: type.to_ir_type(context))
+        kind = self.idType
+        if kind == IDType.BASIC:
+            ir_type = IR_BASIC_TYPES.get(self.basic_type)
+            if ir_type is None:
+                raise CodegenError(f'type {self} has no IR representation')
+            return ir_type
+        elif kind == IDType.STRUCT:
+            return context.get_identified_type(self.ir_name)
+        elif kind == IDType.ARRAY:
+            element_ir_type = lower(self.element_type)
+            return ir.ArrayType(element_ir_type, self.size) if self.size is not None else ir.PointerType(element_ir_type)
+        elif kind == IDType.REFERENCE:
+            return ir.PointerType(lower(self.referred_type))
+        elif kind == IDType.FUNCTION:  # Return Function Pointer IR type
+            ret_ir_type = lower(self.func_ret_type)
+            param_ir_types = [lower(param_type) for param_type in self.param_types]
+            return ir.PointerType(ir.FunctionType(ret_ir_type, param_ir_types))
+        else:
+            assert False, "uninstantiabled type!"
+
+    ########################################################## 泛型
+    def match_generics(self, spec_type: Type) -> Tuple[bool, Dict[str, Type]]:
+        """模版类型与函数实参匹配，推导出模版类型；结果按 (self, spec_type) 缓存。
+
+        只推导泛型，不含泛型的部分总是匹配，能否隐式转换由调用方另行检查。"""
+        if not self.containsGeneric:
+            return True, {}
+        matched = _match_generics(self, spec_type)
+        if matched is None:
+            return False, {}
+        return True, dict(matched)
+
+    def specialize(self, generic_specialization_list: Dict[str, Type]) -> Type:
+        """将该类型中嵌套的泛型类型按照实例化列表进行替换；结果按 (self, 实例化列表) 缓存"""
+        if not self.containsGeneric or not generic_specialization_list:
+            return self
+        return _specialize(self, tuple(generic_specialization_list.items()))
+
+
+def merge_matched(all_matched: Dict[str, Type], matched: Dict[str, Type]) -> Optional[Dict[str, Type]]:
+    """合并两次推导的结果，同一泛型推导出不同类型时返回 None"""
+    for name, spec_type in matched.items():
+        if all_matched.setdefault(name, spec_type) is not spec_type:
+            return None
+    return all_matched
+
+
+@functools.lru_cache(maxsize=4096)
+def _match_generics(generic_type: Type, spec_type: Type) -> Optional[Tuple[Tuple[str, Type], ...]]:
+    kind1 = generic_type.idType
+    if not generic_type.containsGeneric:
+        return ()
+    if kind1 == IDType.GENERIC:
+        spec_type = spec_type.decay()
+        if spec_type.idType in (IDType.AUTO, IDType.GENERIC) or spec_type.containsGeneric:
+            return ()  # 实参类型还没确定，推导不出来
+        return ((generic_type.generic_name, spec_type),)
+    if kind1 == IDType.REFERENCE:
+        # 引用形参也可以直接接受值
+        if spec_type.idType == IDType.REFERENCE:
+            spec_type = spec_type.referred_type
+        return _match_generics(generic_type.referred_type, spec_type)
+    spec_type = spec_type.decay()
+    kind2 = spec_type.idType
+    if kind2 in (IDType.AUTO, IDType.GENERIC):
+        return ()
+    if kind1 != kind2:
+        return None
+    if kind1 == IDType.ARRAY:
+        return _match_generics(generic_type.element_type, spec_type.element_type)
+    if kind1 == IDType.STRUCT:
+        if generic_type.struct_info is not spec_type.struct_info:
+            return None
+        pairs = list(zip(generic_type.generics_type_list, spec_type.generics_type_list))
+    elif kind1 == IDType.FUNCTION:
+        if len(generic_type.param_types) != len(spec_type.param_types):
+            return None
+        pairs = list(zip(generic_type.param_types, spec_type.param_types))
+        pairs.append((generic_type.func_ret_type, spec_type.func_ret_type))
+    else:
+        return ()
+    all_matched: Dict[str, Type] = {}
+    for type1, type2 in pairs:
+        matched = _match_generics(type1, type2)
+        if matched is None or merge_matched(all_matched, dict(matched)) is None:
+            return None
+    return tuple(all_matched.items())
+
+
+@functools.lru_cache(maxsize=4096)
+def _specialize(generic_type: Type, specialization: Tuple[Tuple[str, Type], ...]) -> Type:
+    if not generic_type.containsGeneric:
+        return generic_type
+    kind = generic_type.idType
+    is_const = generic_type.isConst
+    if kind == IDType.GENERIC:
+        for name, spec_type in specialization:
+            if name == generic_type.generic_name:
+                return spec_type.with_const(is_const or spec_type.isConst)
+        return generic_type
+    if kind == IDType.ARRAY:
+        return Type.array(_specialize(generic_type.element_type, specialization), generic_type.size, is_const)
+    if kind == IDType.REFERENCE:
+        return Type.reference(_specialize(generic_type.referred_type, specialization), is_const)
+    generics = tuple(_specialize(generic, specialization) for generic in generic_type.generics_type_list)
+    if kind == IDType.STRUCT:
+        return Type.struct(generic_type.struct_info, generics, is_const)
+    # 已经确定的泛型参数不再是函数的泛型参数
+    generics = tuple(generic for generic in generics if generic.idType == IDType.GENERIC)
+    return Type.function([_specialize(param, specialization) for param in generic_type.param_types],
+                         _specialize(generic_type.func_ret_type, specialization), generics, is_const)
+
+
+def specialization_cache_info() -> Dict[str, Tuple[int, int]]:
+    """match_generics 与 specialize 缓存的 (命中, 未命中) 次数"""
+    return {'match': tuple(_match_generics.cache_info()[:2]), 'specialize': tuple(_specialize.cache_info()[:2])}
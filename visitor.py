@@ -0,0 +1,140 @@
+from __future__ import annotations
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import ast1
+
+
+def iter_child_nodes(node: ast1.Node) -> Iterator[ast1.Node]:
+    """按字段顺序产生直接子节点，列表字段逐个展开"""
+    for name in ast1.field_names(type(node)):
+        value = getattr(node, name)
+        if isinstance(value, ast1.Node):
+            yield value
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, ast1.Node):
+                    yield item
+
+
+def walk(node: ast1.Node) -> Iterator[ast1.Node]:
+    """先序遍历整棵树，用显式栈实现，不受递归深度限制"""
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        yield node
+        children = list(iter_child_nodes(node))
+        children.reverse()
+        stack.extend(children)
+
+
+# enter_<类名> 返回 SKIP 时，traverse 不再进入该节点的子树
+SKIP = object()
+
+
+class Visitor(object):
+    """visit(node) 分派到 visit_<类名>，没有时沿节点类的 MRO 找父类的处理函数，都没有则调用 generic_visit。
+    分派结果按 (visitor 类, 前缀, 节点类) 缓存，每个节点类只解析一次。
+
+    generic_visit 用显式栈向下遍历，只有遇到定义了处理函数的节点才调用它，
+    所以长表达式链这类深层结构不会因为逐层 visit 而触发递归深度限制。
+    处理函数自己递归（如 visit_Expression 里再调用 generic_visit）时仍受递归深度限制，
+    这类遍历改用 traverse：先序调用 enter_<类名>，子树结束后调用 leave_<类名>，全程不递归。"""
+    _dispatch: Dict[Tuple[str, type], Optional[Callable[[Visitor, ast1.Node], object]]] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._dispatch = {}
+
+    @classmethod
+    def lookup(cls, node_cls: type, prefix: str = 'visit_') -> Optional[Callable[[Visitor, ast1.Node], object]]:
+        key = (prefix, node_cls)
+        try:
+            return cls._dispatch[key]
+        except KeyError:
+            pass
+        method = cls.generic_visit if prefix == 'visit_' else None
+        for klass in node_cls.__mro__:
+            handler = getattr(cls, prefix + klass.__name__, None)
+            if handler is not None:
+                method = handler
+                break
+        cls._dispatch[key] = method
+        return method
+
+    def visit(self, node: ast1.Node):
+        return type(self).lookup(type(node))(self, node)
+
+    def generic_visit(self, node: ast1.Node) -> None:
+        lookup, generic = type(self).lookup, type(self).generic_visit
+        stack = list(iter_child_nodes(node))
+        stack.reverse()
+        while stack:
+            child = stack.pop()
+            method = lookup(type(child))
+            if method is generic:
+                children = list(iter_child_nodes(child))
+                children.reverse()
+                stack.extend(children)
+            else:
+                method(self, child)
+
+    def traverse(self, root: ast1.Node) -> None:
+        lookup = type(self).lookup
+        stack: List[Tuple[ast1.Node, bool]] = [(root, False)]
+        while stack:
+            node, leaving = stack.pop()
+            if leaving:
+                lookup(type(node), 'leave_')(self, node)
+                continue
+            enter = lookup(type(node), 'enter_')
+            if enter is not None and enter(self, node) is SKIP:
+                continue
+            if lookup(type(node), 'leave_') is not None:
+                stack.append((node, True))
+            children = [(child, False) for child in iter_child_nodes(node)]
+            children.reverse()
+            stack.extend(children)
+
+
+class Transformer(Visitor):
+    """visit 的返回值替换原节点：返回 None 时从所在列表中删除（单个字段则置为 None），
+    在列表中返回 list 时展开插入。没有处理函数的节点原地改写子节点后返回自身。
+
+    generic_visit 同样不递归：先收集不需要专门处理的节点，再按子节点先于父节点的顺序改写字段。"""
+    def generic_visit(self, node: ast1.Node) -> ast1.Node:
+        lookup, generic = type(self).lookup, type(self).generic_visit
+        order: List[ast1.Node] = []
+        stack = [node]
+        while stack:
+            item = stack.pop()
+            order.append(item)
+            for child in iter_child_nodes(item):
+                if lookup(type(child)) is generic:
+                    stack.append(child)
+
+        for item in reversed(order):
+            for name in ast1.field_names(type(item)):
+                value = getattr(item, name)
+                if isinstance(value, ast1.Node):
+                    method = lookup(type(value))
+                    if method is not generic:
+                        setattr(item, name, method(self, value))
+                elif isinstance(value, list):
+                    value[:] = self.transform_list(value, lookup, generic)
+            if isinstance(item, ast1.CompUnit):
+                item.declViews = None
+        return node
+
+    def transform_list(self, values: list, lookup, generic) -> list:
+        result = []
+        for value in values:
+            if isinstance(value, ast1.Node):
+                method = lookup(type(value))
+                if method is not generic:
+                    value = method(self, value)
+            if value is None:
+                continue
+            if isinstance(value, list):
+                result.extend(value)
+            else:
+                result.append(value)
+        return result